@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+APEXSAT AI - Asenkron Tarama API'si
+
+DVBScanner'ın bloklayan tarama döngüsünü asyncio üzerinden olay akışı olarak
+sunar. Tune/kilit bekleme, PSI okuma ve kontrol noktası yazımları iş
+parçacığında (asyncio.to_thread), senkron taramayla aynı kodla çalışır.
+UI (Qt) ve diğer tüketiciler olayları bloklanmadan dinler; birden fazla
+tarama aynı olay döngüsünü paylaşabilir (merge_events).
+
+İş parçacığındaki adımlar iptal edilemez: tarama iptal edildiğinde (ya da
+üreteç kapatıldığında) süren tune/PSI okuma ve veritabanı yazımı bitene
+kadar beklenir, kalan sonuçlar kontrol noktasına yazılır; böylece çağıran
+frontend'i ve veritabanını ancak bunlar bittikten sonra kapatır.
+
+Kullanım:
+    async for event in AsyncScanner(scanner).scan_turksat():
+        print(event.kind, event.to_dict())
+
+    python3 async_scan.py --simulate       # Sanal frontend ile olay akışı
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from typing import AsyncIterator, Callable, Optional
+
+try:
+    from .planner import PlanItem, ScanPlan
+    from .psi import MuxInfo
+    from .scanner import Channel, DVBScanner, ScanCheckpoint, ScanResult, Transponder, _ms
+except ImportError:
+    from planner import PlanItem, ScanPlan
+    from psi import MuxInfo
+    from scanner import Channel, DVBScanner, ScanCheckpoint, ScanResult, Transponder, _ms
+
+
+# ─── Olaylar ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class ScanEvent:
+    """Tüm tarama olaylarının tabanı."""
+    kind = "event"
+    scan_id: str = ""
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["kind"] = self.kind
+        return data
+
+
+@dataclass
+class ScanStarted(ScanEvent):
+    kind = "started"
+    total: int = 0
+
+
+@dataclass
+class TuneStarted(ScanEvent):
+    kind = "tune"
+    index: int = 0
+    total: int = 0
+    frequency: int = 0
+    polarization: str = ""
+    symbol_rate: int = 0
+    system: str = ""
+
+
+@dataclass
+class LockResult(ScanEvent):
+    kind = "lock"
+    frequency: int = 0
+    polarization: str = ""
+    locked: bool = False
+    reason: str = ""
+    lock_ms: Optional[float] = None
+
+
+@dataclass
+class SignalReport(ScanEvent):
+    kind = "signal"
+    frequency: int = 0
+    polarization: str = ""
+    snr: float = 0.0
+    signal_strength: float = 0.0
+    ber: float = 0.0
+
+
+@dataclass
+class ServicesFound(ScanEvent):
+    kind = "services"
+    frequency: int = 0
+    polarization: str = ""
+    transport_stream_id: Optional[int] = None
+    channels: list = field(default_factory=list)      # Kanal adları
+
+
+@dataclass
+class ScanProgress(ScanEvent):
+    kind = "progress"
+    done: int = 0
+    total: int = 0
+    channels_found: int = 0
+    eta_s: Optional[float] = None
+
+
+@dataclass
+class ScanFinished(ScanEvent):
+    kind = "finished"
+    transponders_scanned: int = 0
+    transponders_locked: int = 0
+    channels_found: int = 0
+    duration_s: float = 0.0
+    error: str = ""
+
+
+# ─── Tarayıcı ────────────────────────────────────────────────────────────────
+
+async def _drain(*work: Optional[asyncio.Future]):
+    """İş parçacığı işlerinin bitmesini bekle (tekrarlanan iptallere rağmen)."""
+    pending = {w for w in work if w is not None and not w.done()}
+    while pending:
+        try:
+            _, pending = await asyncio.wait(pending)
+        except asyncio.CancelledError:
+            continue
+    for w in work:
+        if w is not None and not w.cancelled():
+            w.exception()       # İptal sırasındaki hata yutulur, "retrieved" sayılır
+
+
+class AsyncScanner:
+    """
+    DVBScanner için asyncio sarmalayıcı.
+
+    Her transponder iş parçacığında senkron taramanın adımlarıyla taranır
+    (scan_item/_run_item): desteklenmeyen transponderı atlama, artımlı
+    sürüm kontrolü, kilit geçmişi ve kontrol noktaları ortaktır; oturum
+    scan_turksat(resume=True) ile her iki taraftan sürdürülebilir. Kilit
+    sonucu PSI okunmadan olay olarak gelir.
+    """
+
+    def __init__(self, scanner: DVBScanner, scan_id: str = ""):
+        self.scanner = scanner
+        self.scan_id = scan_id or f"adapter{scanner.adapter.adapter_num}"
+
+    @property
+    def result(self) -> ScanResult:
+        return self.scanner.scan_result
+
+    # ─── Bloklayan adımlar (iş parçacığında) ───
+
+    def _scan_item(self, position: int, item: PlanItem, known: dict,
+                   checkpoint: Optional[ScanCheckpoint],
+                   emit: Callable[[ScanEvent], None]) -> tuple[list[Channel], Optional[MuxInfo]]:
+        """
+        Plan öğesini tara → (kanallar, mux); kilit/sinyal olayları emit ile gelir.
+
+        Cihaz hatası (OSError) sadece bu transponderı etkiler: kilitsiz
+        LockResult olarak bildirilir, tarama sonraki öğeyle sürer. Frontend
+        aygıtı yoksa (FileNotFoundError) tüm tarama durur.
+        """
+        scanner = self.scanner
+        sid = self.scan_id
+        tp = item.transponder
+        reported = False
+        mux = None
+
+        def on_lock(tp: Transponder, wait, stats):
+            nonlocal reported
+            reported = True
+            emit(LockResult(sid, tp.frequency, tp.polarization, wait.locked, wait.reason,
+                            _ms(wait.lock_time)))
+            if stats is not None:
+                emit(SignalReport(sid, tp.frequency, tp.polarization, stats.snr,
+                                  stats.signal_strength, stats.ber))
+
+        def probe(position: int, item: PlanItem) -> list[Channel]:
+            nonlocal mux
+            channels = scanner.scan_item(item, known, on_lock)
+            # Kontrol noktası yazınca muxları bırakır, TSID şimdi alınır
+            mux = scanner.scan_result.muxes.get((item.satellite, tp.frequency, tp.polarization))
+            return channels
+
+        mark = len(scanner.scan_result.timings)
+        try:
+            channels = scanner._run_item(position, item, probe, checkpoint)
+            if not reported:
+                # Atlandı (desteklenmiyor) ya da tune sırasında cihaz hatası
+                timings = scanner.scan_result.timings[mark:]
+                reason = timings[-1].reason if timings else scanner._unsupported(tp) or "skipped"
+                emit(LockResult(sid, tp.frequency, tp.polarization, False, reason))
+            return channels, mux
+        except FileNotFoundError:
+            raise               # Frontend yok: tarama ScanFinished(error) ile biter
+        except OSError as e:
+            # DiSEqC port geçişi vb.; aday denendi sayılır
+            emit(LockResult(sid, tp.frequency, tp.polarization, False, str(e)))
+            if checkpoint is not None:
+                checkpoint.done(position, False, 0)
+            return [], None
+        finally:
+            emit(None)          # Öğe bitti
+
+    def _finish(self, checkpoint: Optional[ScanCheckpoint], incremental: bool):
+        self.scanner._finish_items(checkpoint, True)
+        if incremental:
+            self.scanner.save_incremental()
+
+    # ─── Olay akışı ───
+
+    async def scan(self, plan: Optional[ScanPlan] = None, incremental: bool = False,
+                   resume: bool = False) -> AsyncIterator[ScanEvent]:
+        """
+        Planı (None: bilinen Türksat listesi) tara, her adımda olay üret.
+
+        incremental/resume DVBScanner.scan_turksat ile aynıdır.
+        """
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        result = self.result
+        sid = self.scan_id
+        loop_start = time.monotonic()
+        in_flight: Optional[asyncio.Future] = None
+        checkpoint: Optional[ScanCheckpoint] = None
+        finishing = False
+
+        def emit(event: Optional[ScanEvent]):
+            # İş parçacığından; sıra korunur ve iş sonucundan önce gelir
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        def in_thread(func, *args) -> asyncio.Future:
+            # shield: iptal await'i keser ama iş parçacığındaki işi izlemeye devam ederiz
+            nonlocal in_flight
+            in_flight = asyncio.ensure_future(asyncio.to_thread(func, *args))
+            return asyncio.shield(in_flight)
+
+        async def abort():
+            # Frontend/veritabanı süren iş bitmeden kapatılmasın
+            await _drain(in_flight)
+            if not finishing:
+                self.scanner._finish_items(checkpoint, False)
+
+        try:
+            checkpoint, items, total, known = await in_thread(
+                self.scanner.open_turksat_scan, plan, incremental, resume)
+            yield ScanStarted(sid, total)
+
+            for count, (position, item) in enumerate(items, 1):
+                tp = item.transponder
+                yield TuneStarted(sid, position + 1, total, tp.frequency, tp.polarization,
+                                  tp.symbol_rate, tp.system)
+
+                work = in_thread(self._scan_item, position, item, known, checkpoint, emit)
+                while (event := await events.get()) is not None:
+                    yield event
+                channels, mux = await work
+                if mux is not None:
+                    yield ServicesFound(sid, tp.frequency, tp.polarization,
+                                        mux.transport_stream_id, [ch.name for ch in channels])
+
+                elapsed = time.monotonic() - loop_start
+                eta = elapsed / count * (len(items) - count)
+                yield ScanProgress(sid, position + 1, total, result.channels_found, eta)
+
+            finishing = True
+            await in_thread(self._finish, checkpoint, incremental)
+            result.scan_duration = time.monotonic() - loop_start
+            yield ScanFinished(sid, result.transponders_scanned, result.transponders_locked,
+                               result.channels_found, result.scan_duration)
+        except OSError as e:
+            # Oturum açma/kaydetme hatası (transponder hataları öğe başına işlenir)
+            await abort()
+            yield ScanFinished(sid, result.transponders_scanned, result.transponders_locked,
+                               result.channels_found, time.monotonic() - loop_start, str(e))
+        except BaseException:
+            # İptal, üreteç kapatma ya da beklenmeyen hata
+            await abort()
+            raise
+
+    def scan_turksat(self, incremental: bool = False, resume: bool = False) -> AsyncIterator[ScanEvent]:
+        """Bilinen Türksat transponderlarını planlı sırayla tara."""
+        return self.scan(None, incremental, resume)
+
+
+async def merge_events(*streams: AsyncIterator[ScanEvent]) -> AsyncIterator[ScanEvent]:
+    """Birden fazla taramanın olaylarını geldikleri sırayla tek akışta birleştir."""
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    async def pump(stream):
+        try:
+            async for event in stream:
+                await queue.put(event)
+        finally:
+            await queue.put(done)
+
+    tasks = [asyncio.create_task(pump(s)) for s in streams]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            event = await queue.get()
+            if event is done:
+                remaining -= 1
+            else:
+                yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+# ─── Test ────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+    from pathlib import Path
+
+    try:
+        from .frontend import VirtualClock
+        from .scanner import ChannelDatabase, DVBAdapter
+    except ImportError:
+        from frontend import VirtualClock
+        from scanner import ChannelDatabase, DVBAdapter
+
+    parser = argparse.ArgumentParser(description="APEXSAT AI - Asenkron tarama olayları")
+    parser.add_argument("--simulate", action="store_true", help="Sanal frontend kullan")
+    parser.add_argument("--tuners", type=int, default=1, help="Aynı döngüde paralel tarama sayısı")
+    args = parser.parse_args()
+
+    async def run():
+        tmp = tempfile.TemporaryDirectory(prefix="apexsat-async-")
+        db = ChannelDatabase(Path(tmp.name) / "channels.db")
+        streams = []
+        for n in range(args.tuners):
+            backend = DVBScanner.simulation_frontend(clock=VirtualClock()) if args.simulate else None
+            scanner = DVBScanner(DVBAdapter(n, backend=backend), db)
+            streams.append(AsyncScanner(scanner).scan_turksat())
+
+        async for event in merge_events(*streams):
+            if event.kind in ("progress", "finished", "services"):
+                print(f"[{event.scan_id}] {event.kind}: {event.to_dict()}")
+        db.close()
+        tmp.cleanup()
+
+    asyncio.run(run())
@@ -0,0 +1,653 @@
+#!/usr/bin/env python3
+"""
+APEXSAT AI - Performans Ölçümleri
+
+Donanım gerektirmeyen ölçümler. Geçici dizinde çalışır, gerçek
+veritabanlarına dokunmaz.
+
+Tarama ölçümleri ModelledFrontend (tune gecikmesi, kilit olasılığı, SI
+tekrar aralıkları) ve sanal saatle uçtan uca çalışır; seed sabit olduğu
+sürece tarama sonuçları ve sanal süreler her koşuda aynıdır.
+
+Kullanım:
+    python3 benchmark.py                    # Tüm ölçümler
+    python3 benchmark.py db search          # Sadece veritabanı ölçümleri
+    python3 benchmark.py export --channels 100000   # Dışa aktarma (süre, tepe bellek)
+    python3 benchmark.py scan --seed 7      # Tarama ölçümleri (turksat, blind, nit)
+    python3 benchmark.py parallel --tuners 1,2,4    # Çoklu tuner paralel tarama
+    python3 benchmark.py epg --epg-events 10000,100000   # EPG toplu yükleme (olay/s)
+    python3 benchmark.py xmltv --xmltv-events 200000     # XMLTV akış yükleme (süre, tepe bellek)
+    python3 benchmark.py --channels 10000   # Kanal sayısı
+"""
+
+import contextlib
+import io
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from xml.sax.saxutils import escape
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    from .coordinator import ParallelScanCoordinator
+    from .epg import EPGDatabase, EPGEvent, EPGManager, XMLTVParser
+    from .frontend import LatencyModel, ModelledFrontend, VirtualClock
+    from .scanner import (EXPORT_FORMATS, Channel, ChannelDatabase, ChannelExporter,
+                          DVBAdapter, DVBScanner)
+except ImportError:
+    from coordinator import ParallelScanCoordinator
+    from epg import EPGDatabase, EPGEvent, EPGManager, XMLTVParser
+    from frontend import LatencyModel, ModelledFrontend, VirtualClock
+    from scanner import (EXPORT_FORMATS, Channel, ChannelDatabase, ChannelExporter,
+                         DVBAdapter, DVBScanner)
+
+
+def _timed(func, *args, **kwargs) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+# Sentetik kanal adları için marka havuzu (çok uydulu liste benzeri dağılım)
+CHANNEL_BRANDS = (
+    "TRT", "ATV", "Show TV", "Star TV", "Kanal D", "Habertürk", "CNN Türk", "NTV",
+    "Fox", "TV8", "Beyaz TV", "Halk TV", "Tele1", "TGRT Haber", "Bloomberg HT",
+    "Euronews", "BBC", "Deutsche Welle", "France 24", "Al Jazeera", "Rai", "ZDF",
+    "Sky", "Eurosport", "Discovery", "National Geographic", "Cartoon Network",
+    "MTV", "Power Türk", "Kral Pop", "Number1", "Dream Türk", "Diyanet TV",
+    "Ülke TV", "Kanal 7", "Flash Haber", "Sözcü TV", "Tv 360", "Yaban TV", "Çiftçi TV",
+)
+
+
+def synthetic_channels(count: int, per_transponder: int = 60) -> list[Channel]:
+    """Gerçekçi dağılımlı sentetik kanal listesi."""
+    channels = []
+    for i in range(count):
+        tp, slot = divmod(i, per_transponder)
+        radio = slot % 5 == 4
+        brand, variant = CHANNEL_BRANDS[i % len(CHANNEL_BRANDS)], i // len(CHANNEL_BRANDS)
+        channels.append(Channel(
+            name=f"{brand} {variant}",
+            service_id=1000 + slot,
+            transponder_freq=10700 + tp * 8,
+            transponder_pol="H" if tp % 2 == 0 else "V",
+            video_pid=0 if radio else 256 + slot,
+            audio_pid=512 + slot,
+            pcr_pid=256 + slot,
+            pmt_pid=4096 + slot,
+            channel_type="Radio" if radio else "TV",
+            is_free=slot % 3 != 0,
+            is_hd=not radio and slot % 2 == 0,
+            provider="Benchmark",
+            category="Genel",
+            service_type=2 if radio else 1,
+            transport_stream_id=tp + 1,
+            original_network_id=1,
+        ))
+    return channels
+
+
+def _legacy_save(db_path: Path, channels: list[Channel]):
+    """Eski yöntem: transponder başına bağlantı, satır başına INSERT."""
+    by_tp: dict[tuple, list[Channel]] = {}
+    for ch in channels:
+        by_tp.setdefault((ch.transponder_freq, ch.transponder_pol), []).append(ch)
+    for group in by_tp.values():
+        with sqlite3.connect(db_path) as conn:
+            for ch in group:
+                conn.execute("""
+                    INSERT OR REPLACE INTO channels
+                    (name, service_id, transponder_freq, transponder_pol,
+                     video_pid, audio_pid, pcr_pid, pmt_pid,
+                     channel_type, is_free, is_hd, provider, category)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    ch.name, ch.service_id, ch.transponder_freq, ch.transponder_pol,
+                    ch.video_pid, ch.audio_pid, ch.pcr_pid, ch.pmt_pid,
+                    ch.channel_type, ch.is_free, ch.is_hd, ch.provider, ch.category
+                ))
+        conn.close()
+
+
+def _legacy_count(db_path: Path) -> dict:
+    with sqlite3.connect(db_path) as conn:
+        queries = {
+            "total": "SELECT COUNT(*) FROM channels",
+            "tv": "SELECT COUNT(*) FROM channels WHERE channel_type='TV'",
+            "radio": "SELECT COUNT(*) FROM channels WHERE channel_type='Radio'",
+            "hd": "SELECT COUNT(*) FROM channels WHERE is_hd=1",
+            "fta": "SELECT COUNT(*) FROM channels WHERE is_free=1",
+        }
+        result = {key: conn.execute(sql).fetchone()[0] for key, sql in queries.items()}
+    conn.close()
+    return result
+
+
+# ─── Kanal Veritabanı ────────────────────────────────────────────────────────
+
+def bench_channel_db(count: int = 10000, repeat: int = 20) -> dict:
+    """
+    ChannelDatabase yazma/okuma süreleri (saniye).
+
+    save: boş veritabanına ilk kayıt, resave: aynı kanalların yeniden
+    kaydı (upsert), count: get_channel_count() ortalaması. legacy_*
+    değerleri eski bağlantı-başına/satır-başına yöntemi ölçer.
+    """
+    channels = synthetic_channels(count)
+    results = {"channels": count}
+
+    with tempfile.TemporaryDirectory(prefix="apexsat-bench-") as tmp:
+        db = ChannelDatabase(Path(tmp) / "channels.db")
+        results["save"], _ = _timed(db.save_channels, channels)
+        results["resave"], _ = _timed(db.save_channels, channels)
+        elapsed, counts = _timed(lambda: [db.get_channel_count() for _ in range(repeat)])
+        results["count"] = elapsed / repeat
+        results["rows"] = counts[-1]["total"]
+        db.close()
+
+        legacy_path = Path(tmp) / "legacy.db"
+        ChannelDatabase(legacy_path).close()
+        with sqlite3.connect(legacy_path) as conn:
+            conn.execute("DROP INDEX idx_channels_service")
+            for (trigger,) in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall():
+                conn.execute(f"DROP TRIGGER {trigger}")
+            conn.execute("PRAGMA journal_mode=DELETE")
+        conn.close()
+        results["legacy_save"], _ = _timed(_legacy_save, legacy_path, channels)
+        elapsed, _ = _timed(lambda: [_legacy_count(legacy_path) for _ in range(repeat)])
+        results["legacy_count"] = elapsed / repeat
+
+    return results
+
+
+def bench_channel_search(count: int = 10000, repeat: int = 200,
+                         queries: tuple = ("cnn turk 12", "ciftci 4", "habertürk", "deutsche 9")) -> dict:
+    """search_channels() sorgu başına ortalama süre: FTS5 ve LIKE (saniye)."""
+    results = {"channels": count}
+    with tempfile.TemporaryDirectory(prefix="apexsat-bench-") as tmp:
+        db = ChannelDatabase(Path(tmp) / "channels.db")
+        db.save_channels(synthetic_channels(count))
+        for name, search in (("fts", db.search_channels), ("like", db._search_like)):
+            elapsed, _ = _timed(lambda: [search(q, 50) for _ in range(repeat) for q in queries])
+            results[name] = elapsed / (repeat * len(queries))
+        results["fts_enabled"] = db.fts_enabled
+        db.close()
+    return results
+
+
+def bench_export(count: int = 10000) -> dict:
+    """Tüm biçimler: tek geçiş (export_all) ve biçim başına ayrı geçiş; süre ve tepe bellek."""
+    results = {"channels": count}
+    with tempfile.TemporaryDirectory(prefix="apexsat-bench-") as tmp:
+        tmp = Path(tmp)
+        db = ChannelDatabase(tmp / "channels.db")
+        db.save_channels(synthetic_channels(count))
+        exporter = ChannelExporter(db)
+        separate = (exporter.export_m3u, exporter.export_csv,
+                    exporter.export_enigma2, exporter.export_xmltv)
+
+        for name, run in (
+            ("all", lambda: exporter.export_all(tmp / "all")),
+            ("separate", lambda: [export(tmp / f"separate{ext}")
+                                  for export, ext in zip(separate, EXPORT_FORMATS.values())]),
+            ("list", lambda: db.get_all_channels()),    # Karşılaştırma: tüm listeyi belleğe al
+        ):
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[name], _ = _timed(run)
+                # Bellek ölçümü ayrı koşuda (tracemalloc süreyi şişirir)
+                tracemalloc.start()
+                run()
+                results[f"{name}_peak"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        results["bytes"] = sum(p.stat().st_size for p in (tmp / "all").iterdir())
+        db.close()
+    return results
+
+
+def print_channel_db(results: dict):
+    def ms(key):
+        return f"{results[key] * 1000:9.1f} ms"
+
+    print(f"\n📺 Kanal veritabanı ({results['channels']} kanal, {results['rows']} satır)")
+    print(f"   İlk kayıt        : {ms('save')}   (eski: {ms('legacy_save')})")
+    print(f"   Yeniden kayıt    : {ms('resave')}")
+    print(f"   Kanal sayıları   : {ms('count')}   (eski: {ms('legacy_count')})")
+
+
+def print_channel_search(results: dict):
+    if not results["fts_enabled"]:
+        print("\n🔎 Kanal arama: SQLite FTS5 desteği yok, ölçüm atlandı")
+        return
+    print(f"\n🔎 Kanal arama ({results['channels']} kanal, sorgu başına)")
+    print(f"   FTS5 (önek, bm25): {results['fts'] * 1000:8.3f} ms")
+    print(f"   LIKE (tam tarama): {results['like'] * 1000:8.3f} ms")
+
+
+def print_export(results: dict):
+    print(f"\n📤 Dışa aktarma ({results['channels']} kanal, 4 biçim, "
+          f"{results['bytes'] / 1e6:.1f} MB)")
+    for name, label in (("all", "Tek geçiş (all)"), ("separate", "Biçim başına"),
+                        ("list", "Liste yükleme")):
+        print(f"   {label:<17}: {results[name] * 1000:9.1f} ms   "
+              f"tepe bellek {results[f'{name}_peak'] / 1024:8.0f} KiB")
+
+
+# ─── EPG ─────────────────────────────────────────────────────────────────────
+
+EPG_SIZES = (10_000, 100_000, 1_000_000)
+EPG_LEGACY_SAMPLE = 2000        # Eski yol olay başına bağlantı açar; örneklemle ölçülür
+EPG_BASE = datetime(2026, 1, 1, 6, 0)
+
+
+def synthetic_events(count: int, channels: int = 300) -> Iterator[EPGEvent]:
+    """Kanal başına art arda 30 dakikalık olaylar (7 günlük 300 kanal ≈ 100k olay)."""
+    base = EPG_BASE
+    for i in range(count):
+        slot, channel = divmod(i, channels)
+        yield EPGEvent(
+            channel_id=1000 + channel,
+            event_id=slot,
+            start_time=base + timedelta(minutes=30 * slot),
+            duration=30,
+            title=f"{CHANNEL_BRANDS[channel % len(CHANNEL_BRANDS)]} Program {slot % 97}",
+            description="Sentetik olay açıklaması " * 4,
+            genre=("Haber", "Film", "Spor", "Çocuk", "Belgesel")[slot % 5],
+        )
+
+
+def _legacy_save_events(db_path: Path, events: Iterator[EPGEvent]):
+    """Eski yöntem: olay başına bağlantı ve commit."""
+    for event in events:
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO epg_events
+                (channel_id, event_id, start_time, duration, title, description, genre)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (event.channel_id, event.event_id, event.start_time.isoformat(),
+                  event.duration, event.title, event.description, event.genre))
+        conn.close()
+
+
+def _legacy_current(db: EPGDatabase, now: datetime) -> list:
+    """Eski "şu an" sorgusu: sütun fonksiyona sarılı, tüm tablo taranır."""
+    with db._lock:
+        return db.conn.execute("""
+            SELECT * FROM epg_events
+            WHERE start_time <= ? AND datetime(start_time, '+' || duration || ' minutes') > ?
+        """, (now.isoformat(), now.isoformat(sep=" "))).fetchall()
+
+
+def bench_epg_queries(db: EPGDatabase, now: datetime, channels: int = 300,
+                      repeat: int = 5) -> dict:
+    """
+    Sorgu başına süre (saniye): tüm kanallarda şu an (yeni/eski), kanal
+    başına now/next, önbellekten 200 kanallık liste yenilemesi ve 12 kanal
+    × 6 saatlik rehber görünümü (get_grid / kanal başına get_schedule).
+    """
+    now_ts = now.timestamp()
+    results = {}
+    elapsed, _ = _timed(lambda: [db.get_current_events(now=now_ts) for _ in range(repeat)])
+    results["current"] = elapsed / repeat
+    elapsed, _ = _timed(lambda: [_legacy_current(db, now) for _ in range(repeat)])
+    results["legacy_current"] = elapsed / repeat
+    elapsed, _ = _timed(lambda: [db.get_now_next(1000 + c, now_ts) for c in range(channels)])
+    results["now_next"] = elapsed / channels
+
+    manager = EPGManager(db)
+    visible = [1000 + c for c in range(min(channels, 200))]
+    manager.get_now_next_many(visible, now_ts)
+    misses = manager.cache_misses
+    elapsed, _ = _timed(lambda: [manager.get_now_next_many(visible, now_ts) for _ in range(repeat)])
+    results["refresh_cached"] = elapsed / repeat
+    results["refresh_misses"] = manager.cache_misses - misses
+
+    rows, window = 12, 6 * 3600
+    day = now.strftime("%Y-%m-%d")
+    pages = [[1000 + (page * rows + r) % channels for r in range(rows)] for page in range(repeat)]
+    elapsed, _ = _timed(lambda: [db.get_grid(ids, int(now_ts), int(now_ts) + window) for ids in pages])
+    results["grid"] = elapsed / repeat
+    elapsed, _ = _timed(lambda: [[db.get_schedule(c, day) for c in ids] for ids in pages])
+    results["grid_legacy"] = elapsed / repeat
+    return results
+
+
+def bench_epg_ingest(sizes: tuple = EPG_SIZES) -> list[dict]:
+    """
+    EPGDatabase.save_events() olay/s: parçalı transaction, ertelenmiş indeksle
+    ve eski yol; yüklenen rehberin ortasında zaman sorguları.
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="apexsat-bench-") as tmp:
+        tmp = Path(tmp)
+        legacy_path = tmp / "legacy.db"
+        EPGDatabase(legacy_path).close()
+        elapsed, _ = _timed(_legacy_save_events, legacy_path, synthetic_events(EPG_LEGACY_SAMPLE))
+        legacy_rate = EPG_LEGACY_SAMPLE / elapsed
+
+        for count in sizes:
+            row = {"events": count, "legacy": legacy_rate}
+            for name, defer in (("bulk", False), ("deferred", True)):
+                path = tmp / f"{name}_{count}.db"
+                db = EPGDatabase(path)
+                elapsed, _ = _timed(db.save_events, synthetic_events(count), defer_indexes=defer)
+                row[name] = count / elapsed
+                if defer:
+                    middle = EPG_BASE + timedelta(minutes=30 * (count // 300 // 2), seconds=60)
+                    row.update(bench_epg_queries(db, middle))
+                db.close()
+                path.unlink()
+            results.append(row)
+    return results
+
+
+def print_epg_ingest(results: list[dict]):
+    print(f"\n🗓️  EPG toplu yükleme (olay/s; eski yol {EPG_LEGACY_SAMPLE} olay örneklemi)")
+    print(f"   {'Olay':>9}{'Parçalı':>12}{'Ert. indeks':>13}{'Eski':>10}")
+    for r in results:
+        print(f"   {r['events']:>9}{r['bulk']:>12.0f}{r['deferred']:>13.0f}{r['legacy']:>10.0f}")
+    print(f"\n🗓️  EPG zaman sorguları (sorgu başına ms)")
+    print(f"   {'Olay':>9}{'Şu an':>10}{'Eski':>10}{'Now/next':>10}{'200 kanal (önbellek)':>22}")
+    for r in results:
+        print(f"   {r['events']:>9}{r['current'] * 1000:>10.2f}{r['legacy_current'] * 1000:>10.1f}"
+              f"{r['now_next'] * 1000:>10.3f}{r['refresh_cached'] * 1000:>14.3f} "
+              f"({r['refresh_misses']} DB)")
+    print(f"\n🗓️  Rehber görünümü (12 kanal × 6 saat, ms)")
+    print(f"   {'Olay':>9}{'get_grid':>10}{'12× get_schedule':>18}")
+    for r in results:
+        print(f"   {r['events']:>9}{r['grid'] * 1000:>10.2f}{r['grid_legacy'] * 1000:>18.2f}")
+
+
+def write_xmltv(path: Path, count: int, channels: int = 300) -> int:
+    """synthetic_events() olaylarını +0300 dilimli XMLTV dosyasına yaz; bayt sayısı."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<tv generator-info-name="APEXSAT Benchmark">\n')
+        for c in range(channels):
+            f.write(f'  <channel id="ch{1000 + c}.tr"><display-name>Kanal {c}</display-name></channel>\n')
+        for event in synthetic_events(count, channels):
+            start = event.start_time.strftime("%Y%m%d%H%M%S")
+            stop = event.end_time.strftime("%Y%m%d%H%M%S")
+            f.write(f'  <programme start="{start} +0300" stop="{stop} +0300" '
+                    f'channel="ch{event.channel_id}.tr">\n'
+                    f'    <title lang="tr">{escape(event.title)}</title>\n'
+                    f'    <desc lang="tr">{escape(event.description)}</desc>\n'
+                    f'    <category lang="tr">{event.genre}</category>\n'
+                    f'  </programme>\n')
+        f.write("</tv>\n")
+    return path.stat().st_size
+
+
+def _legacy_parse_xmltv(path: Path) -> list[EPGEvent]:
+    """Eski yöntem: tüm DOM (ET.parse) ve strptime ile tam olay listesi."""
+    import xml.etree.ElementTree as ET
+
+    events = []
+    for programme in ET.parse(path).getroot().findall("programme"):
+        start = datetime.strptime(programme.get("start").split()[0][:14], "%Y%m%d%H%M%S")
+        end = datetime.strptime(programme.get("stop").split()[0][:14], "%Y%m%d%H%M%S")
+        events.append(EPGEvent(
+            channel_id=hash(programme.get("channel")) & 0xFFFF,
+            event_id=hash(programme.get("channel") + programme.get("start")) & 0xFFFF,
+            start_time=start,
+            duration=int((end - start).total_seconds() / 60),
+            title=programme.findtext("title"),
+            description=programme.findtext("desc") or "",
+            genre=programme.findtext("category") or "",
+        ))
+    return events
+
+
+def bench_xmltv(count: int = 100_000) -> dict:
+    """
+    XMLTV yükleme: eski yol (DOM + liste + save_events) ve akış
+    (iterparse → parçalı yazım); süre, olay/s ve tepe bellek.
+    """
+    results = {"events": count}
+    with tempfile.TemporaryDirectory(prefix="apexsat-bench-") as tmp:
+        tmp = Path(tmp)
+        path = tmp / "guide.xml"
+        results["bytes"] = write_xmltv(path, count)
+
+        def legacy(db):
+            db.save_events(_legacy_parse_xmltv(path))
+
+        def streaming(db):
+            EPGManager(db).load_xmltv_file(path)
+
+        for name, load in (("legacy", legacy), ("stream", streaming)):
+            for measure in ("time", "memory"):
+                db_path = tmp / f"{name}_{measure}.db"
+                db = EPGDatabase(db_path)
+                if measure == "time":
+                    results[name], _ = _timed(load, db)
+                else:
+                    # Bellek ölçümü ayrı koşuda (tracemalloc süreyi şişirir)
+                    tracemalloc.start()
+                    load(db)
+                    results[f"{name}_peak"] = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                db.close()
+                db_path.unlink()
+        results["parse_only"], _ = _timed(lambda: sum(1 for _ in XMLTVParser().iter_events(path)))
+    return results
+
+
+def print_xmltv(results: dict):
+    print(f"\n📥 XMLTV yükleme ({results['events']} olay, {results['bytes'] / 1e6:.1f} MB)")
+    for name, label in (("legacy", "DOM + liste"), ("stream", "Akış (iterparse)")):
+        print(f"   {label:<17}: {results[name]:7.2f} s  "
+              f"{results['events'] / results[name]:8.0f} olay/s   "
+              f"tepe bellek {results[f'{name}_peak'] / 1e6:7.1f} MB")
+    print(f"   Sadece ayrıştırma: {results['events'] / results['parse_only']:8.0f} olay/s")
+
+
+# ─── Tarama Motoru ───────────────────────────────────────────────────────────
+
+SCAN_MODES = ("turksat", "blind", "nit")
+
+
+class _TimedChannelDatabase(ChannelDatabase):
+    """Yazım transaction'larında geçen süreyi toplayan veritabanı."""
+
+    def __init__(self, db_path: Path):
+        self.write_time = 0.0
+        super().__init__(db_path)
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        start = time.perf_counter()
+        try:
+            with super()._transaction() as conn:
+                yield conn
+        finally:
+            self.write_time += time.perf_counter() - start
+
+
+def bench_scan(mode: str, seed: int = 1, model: Optional[LatencyModel] = None,
+               blind_method: str = "spectrum") -> dict:
+    """
+    Tek tarama modunu modellenmiş frontend'e karşı uçtan uca çalıştır.
+
+    Her zaman statik transponder listesi kullanılır (kayıtlı NIT listesi
+    okunmaz), NIT listesi de geçici dizine yazılır; sonuç depo durumundan
+    bağımsızdır. scan_time sanal (modellenen) tarama süresidir; wall ve
+    db_time bu makinedeki gerçek CPU/disk süreleridir.
+    """
+    clock = VirtualClock()
+    transponders = DVBScanner.load_transponders()
+    carriers = DVBScanner.simulation_frontend(transponders, clock=clock).carriers
+    frontend = ModelledFrontend(carriers, model, clock=clock, sleep=clock.sleep, seed=seed)
+
+    with tempfile.TemporaryDirectory(prefix="apexsat-bench-") as tmp:
+        db = _TimedChannelDatabase(Path(tmp) / "channels.db")
+        scanner = DVBScanner(DVBAdapter(backend=frontend), db)
+        nit_list = Path(tmp) / "nit_transponders.json"
+
+        runners = {
+            "turksat": lambda: scanner.scan_turksat(plan=scanner.planner.plan(transponders)),
+            "blind": lambda: scanner.blind_scan(method=blind_method),
+            "nit": lambda: scanner.nit_scan(transponders=transponders, nit_list=nit_list),
+        }
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = runners[mode]()
+        wall = time.perf_counter() - start
+        db.close()
+
+    return {
+        "mode": mode if mode != "blind" else f"blind/{blind_method}",
+        "seed": seed,
+        "transponders": result.transponders_scanned,
+        "locked": result.transponders_locked,
+        "channels": result.channels_found,
+        "tune_attempts": frontend.tune_count,
+        "failed_locks": frontend.failed_locks,
+        "power_reads": frontend.power_reads,
+        "scan_time": clock.now,
+        "tp_per_s": result.transponders_locked / clock.now if clock.now else 0.0,
+        "wall": wall,
+        "db_time": db.write_time,
+    }
+
+
+def print_scan(results: list[dict]):
+    print(f"\n📡 Tarama (ModelledFrontend, seed {results[0]['seed']})")
+    print(f"   {'Mod':<14}{'TP':>5}{'Kilit':>7}{'Kanal':>7}{'Tune':>7}{'Güç':>7}"
+          f"{'Sanal s':>10}{'TP/s':>7}{'Duvar s':>9}{'DB ms':>8}")
+    for r in results:
+        print(f"   {r['mode']:<14}{r['transponders']:>5}{r['locked']:>7}{r['channels']:>7}"
+              f"{r['tune_attempts']:>7}{r['power_reads']:>7}{r['scan_time']:>10.1f}"
+              f"{r['tp_per_s']:>7.2f}{r['wall']:>9.2f}{r['db_time'] * 1000:>8.1f}")
+
+
+PARALLEL_TUNERS = (1, 2, 4)
+PARALLEL_SCALE = 0.05           # Modellenen 1 s = 50 ms gerçek bekleme
+
+
+class _ScaledClock:
+    """
+    Tunerların paylaştığı ölçekli saat: sleep(s) s × scale gerçek saniye
+    bekler, saat modellenen saniyeyi döner.
+
+    Sanal saatten farkı, iş çalma kararlarının modellenen zamana göre
+    gerçekten eşzamanlı verilmesidir; ölçüm CPU süresini de (1 / scale ile
+    büyütülmüş olarak) içerir.
+    """
+
+    def __init__(self, scale: float = PARALLEL_SCALE):
+        self.scale = scale
+        self._start = time.monotonic()
+
+    def __call__(self) -> float:
+        return (time.monotonic() - self._start) / self.scale
+
+    def sleep(self, seconds: float):
+        time.sleep(max(seconds, 0.0) * self.scale)
+
+
+def bench_parallel(tuners: int, seed: int = 1, model: Optional[LatencyModel] = None,
+                   scale: float = PARALLEL_SCALE) -> dict:
+    """
+    Türksat listesini N modellenmiş tunerla ParallelScanCoordinator üzerinden tara.
+
+    bench_scan gibi statik transponder listesini kullanır. scan_time ortak
+    ölçekli saatle ölçülen modellenen tarama süresidir.
+    """
+    clock = _ScaledClock(scale)
+    transponders = DVBScanner.load_transponders()
+    adapters = [
+        DVBAdapter(i, backend=ModelledFrontend(DVBScanner.simulation_frontend(transponders).carriers,
+                                               model, clock=clock, sleep=clock.sleep,
+                                               seed=seed + i))
+        for i in range(tuners)
+    ]
+
+    with tempfile.TemporaryDirectory(prefix="apexsat-bench-") as tmp:
+        db = _TimedChannelDatabase(Path(tmp) / "channels.db")
+        coordinator = ParallelScanCoordinator(adapters, db)
+        start = time.perf_counter()
+        clock_start = clock()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = coordinator.scan(coordinator.planner.plan(transponders))
+        scan_time = clock() - clock_start
+        wall = time.perf_counter() - start
+        coordinator.close()
+        db.close()
+
+    return {
+        "tuners": tuners,
+        "seed": seed,
+        "transponders": result.transponders_scanned,
+        "locked": result.transponders_locked,
+        "channels": result.channels_found,
+        "per_tuner": [s.scan_result.transponders_scanned for s in coordinator.scanners],
+        "scan_time": scan_time,
+        "tp_per_s": result.transponders_locked / scan_time if scan_time else 0.0,
+        "wall": wall,
+        "db_time": db.write_time,
+    }
+
+
+def print_parallel(results: list[dict]):
+    base = results[0]["scan_time"]
+    print(f"\n🔀 Paralel tarama (ModelledFrontend, seed {results[0]['seed']}, "
+          f"ölçekli saat ×{PARALLEL_SCALE})")
+    print(f"   {'Tuner':<7}{'TP':>5}{'Kilit':>7}{'Kanal':>7}{'Sanal s':>10}{'Hızlanma':>10}"
+          f"{'TP/s':>7}{'Duvar s':>9}   Tuner başına TP")
+    for r in results:
+        speedup = base / r["scan_time"] if r["scan_time"] else 0.0
+        print(f"   {r['tuners']:<7}{r['transponders']:>5}{r['locked']:>7}{r['channels']:>7}"
+              f"{r['scan_time']:>10.1f}{speedup:>9.2f}x{r['tp_per_s']:>7.2f}{r['wall']:>9.2f}"
+              f"   {'/'.join(map(str, r['per_tuner']))}")
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────────
+
+def main():
+    import argparse
+
+    suites = ("db", "search", "export", "epg", "xmltv", "scan", "parallel")
+    parser = argparse.ArgumentParser(description="APEXSAT AI - Performans ölçümleri")
+    parser.add_argument("suites", nargs="*", choices=suites, help="Çalıştırılacak ölçümler (varsayılan: hepsi)")
+    parser.add_argument("--channels", type=int, default=10000,
+                        help="Kanal veritabanı ölçümündeki kanal sayısı")
+    parser.add_argument("--epg-events", default=",".join(map(str, EPG_SIZES)),
+                        help="EPG yükleme ölçümündeki olay sayıları (virgülle)")
+    parser.add_argument("--xmltv-events", type=int, default=100_000,
+                        help="XMLTV yükleme ölçümündeki olay sayısı")
+    parser.add_argument("--seed", type=int, default=1, help="Tarama modeli seed'i")
+    parser.add_argument("--modes", default=",".join(SCAN_MODES),
+                        help="Tarama modları (virgülle: turksat,blind,nit)")
+    parser.add_argument("--blind-method", choices=["spectrum", "step", "adaptive"],
+                        default="spectrum")
+    parser.add_argument("--tuners", default=",".join(map(str, PARALLEL_TUNERS)),
+                        help="Paralel tarama ölçümündeki tuner sayıları (virgülle)")
+    args = parser.parse_args()
+    selected = args.suites or suites
+
+    print("=" * 50)
+    print("  APEXSAT AI - Benchmark")
+    print("=" * 50)
+
+    if "db" in selected:
+        print_channel_db(bench_channel_db(args.channels))
+    if "search" in selected:
+        print_channel_search(bench_channel_search(args.channels))
+    if "export" in selected:
+        print_export(bench_export(args.channels))
+    if "epg" in selected:
+        print_epg_ingest(bench_epg_ingest(tuple(int(n) for n in args.epg_events.split(","))))
+    if "xmltv" in selected:
+        print_xmltv(bench_xmltv(args.xmltv_events))
+    if "scan" in selected:
+        print_scan([bench_scan(mode, args.seed, blind_method=args.blind_method)
+                    for mode in args.modes.split(",")])
+    if "parallel" in selected:
+        print_parallel([bench_parallel(int(n), args.seed) for n in args.tuners.split(",")])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+APEXSAT AI - Çoklu Tuner Paralel Tarama Koordinatörü
+
+Sistemdeki tüm /dev/dvb/adapter*/frontend* cihazlarını bulur, tarama planını
+tunerlar arasında paylaştırır ve iş çalan (work-stealing) kuyruklarla
+paralel tarar. Tunerlar tek tuner taramasıyla aynı "turksat" oturumunu
+paylaşır: her tuner sonuçlarını kendi kontrol noktasıyla yazar, denemeler
+kilit geçmişine işlenir; kesilen tarama --resume ile sürdürülebilir.
+
+Bir transponderdaki cihaz hatası (OSError) sadece o transponderı etkiler;
+eksik frontend aygıtı ya da beklenmeyen bir hata tüm tunerları durdurur,
+oturumu yarım bırakır ve scan() hatayı yeniden yükseltir.
+"""
+
+import glob
+import re
+import threading
+import time
+from collections import deque
+from itertools import groupby
+from typing import Optional
+
+try:
+    from .planner import PlanItem, ScanPlan, ScanPlanner
+    from .scanner import (DVB_ADAPTER_PATH, ChannelDatabase, DVBAdapter,
+                          DVBScanner, ScanCheckpoint, ScanResult)
+except ImportError:
+    from planner import PlanItem, ScanPlan, ScanPlanner
+    from scanner import (DVB_ADAPTER_PATH, ChannelDatabase, DVBAdapter,
+                         DVBScanner, ScanCheckpoint, ScanResult)
+
+
+def discover_adapters(base_path: str = DVB_ADAPTER_PATH) -> list[DVBAdapter]:
+    """Tüm adapter/frontend çiftlerini bul."""
+    adapters = []
+    for path in sorted(glob.glob(f"{base_path}/adapter*/frontend*")):
+        match = re.search(r"adapter(\d+)/frontend(\d+)$", path)
+        if match:
+            adapters.append(DVBAdapter(int(match.group(1)), int(match.group(2))))
+    return adapters
+
+
+class WorkStealingQueue:
+    """
+    Tuner başına iş kuyruğu.
+
+    Öğeler plan sırasındaki (sıra, PlanItem) çiftleridir. Her tuner kendi
+    kuyruğunun başından alır; kuyruğu boşalınca en dolu kuyruğun sonundan
+    çalar. Ardışık aynı LNB durumundaki öğeler (plan grubu) aynı kuyruğa
+    düştüğü için LNB geçişleri düşük kalır.
+    """
+
+    def __init__(self, items: list[tuple[int, PlanItem]], workers: int):
+        self._lock = threading.Lock()
+        self._queues = [deque() for _ in range(workers)]
+        self.steals = 0
+
+        groups = [list(g) for _, g in groupby(items, key=lambda e: (e[1].satellite,
+                                                                     e[1].lnb_state))]
+        # Grupları en az yüklü kuyruğa dağıt (büyükten küçüğe)
+        for group in sorted(groups, key=len, reverse=True):
+            target = min(self._queues, key=len)
+            target.extend(group)
+
+    def pop(self, worker: int):
+        with self._lock:
+            own = self._queues[worker]
+            if own:
+                return own.popleft()
+
+            victim = max(self._queues, key=len)
+            if victim:
+                self.steals += 1
+                return victim.pop()
+        return None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(q) for q in self._queues)
+
+
+class ParallelScanCoordinator:
+    """Birden fazla DVB adaptörüyle paralel tarama."""
+
+    def __init__(self, adapters: list[DVBAdapter], db: ChannelDatabase,
+                 planner: Optional[ScanPlanner] = None, diseqc: Optional[list] = None):
+        """diseqc: adaptör başına DiSEqC denetleyicisi (aynı sırada, None: switch yok)."""
+        if not adapters:
+            raise ValueError("En az bir DVB adaptör gerekli")
+        if diseqc is not None and len(diseqc) != len(adapters):
+            raise ValueError("Her adaptör için bir DiSEqC denetleyicisi gerekli")
+        self.adapters = adapters
+        self.db = db
+        self.planner = planner or ScanPlanner()
+        self.scanners = [DVBScanner(adapter, db, controller)
+                         for adapter, controller in zip(adapters, diseqc or [None] * len(adapters))]
+        for scanner in self.scanners:
+            scanner.planner = self.planner
+        self.scan_result = ScanResult()
+        self._failed = [0] * len(adapters)      # Tuner başına OSError ile taranamayan
+        self._abort = threading.Event()
+        self._errors: list[BaseException] = []
+
+    @property
+    def failed(self) -> int:
+        """Cihaz hatası (OSError) nedeniyle taranamayan transponder sayısı."""
+        return sum(self._failed)
+
+    def _worker(self, index: int, queue: WorkStealingQueue, checkpoint: ScanCheckpoint):
+        scanner = self.scanners[index]
+
+        def probe(position: int, item: PlanItem):
+            return scanner.scan_item(item)
+
+        try:
+            while not self._abort.is_set():
+                entry = queue.pop(index)
+                if entry is None:
+                    break
+                position, item = entry
+                try:
+                    scanner._run_item(position, item, probe, checkpoint)
+                except FileNotFoundError:
+                    raise       # Frontend yok: tüm tunerları durdur
+                except OSError as e:
+                    # Port geçişi/cihaz hatası sadece bu transponderı etkiler
+                    self._failed[index] += 1
+                    tp = item.transponder
+                    print(f"    ⚠️  adapter{scanner.adapter.adapter_num}: "
+                          f"{tp.frequency} MHz {tp.polarization} taranamadı: {e}")
+                    checkpoint.done(position, False, 0)
+        except BaseException as e:
+            self._errors.append(e)
+            self._abort.set()
+
+    def scan(self, plan: Optional[ScanPlan] = None, resume: bool = False) -> ScanResult:
+        """
+        Planı tüm tunerlarda paralel tara (plan yoksa bilinen Türksat listesi).
+
+        Oturum DVBScanner.open_turksat_scan ile açılır; resume ile tek ya da
+        çok tunerla yarım kalmış taramanın bekleyen adayları dağıtılır.
+        """
+        print("=" * 60)
+        print(f"  APEXSAT AI - Paralel Tarama ({len(self.adapters)} tuner)")
+        print("=" * 60)
+
+        first = self.scanners[0]
+        checkpoint, items, total, _ = first.open_turksat_scan(plan, resume=resume)
+        checkpoints = [checkpoint] + [
+            ScanCheckpoint(self.db, checkpoint.session_id, scanner.scan_result, total)
+            for scanner in self.scanners[1:]
+        ]
+        queue = WorkStealingQueue(items, len(self.adapters))
+        start_time = time.time()
+        self._failed = [0] * len(self.adapters)
+        self._abort.clear()
+        self._errors.clear()
+
+        threads = [
+            threading.Thread(target=self._worker, args=(i, queue, checkpoints[i]),
+                             name=f"scan-adapter{a.adapter_num}", daemon=True)
+            for i, a in enumerate(self.adapters)
+        ]
+        for t in threads:
+            t.start()
+        try:
+            for t in threads:
+                t.join()
+        except BaseException:
+            # Ctrl+C: tunerlar ellerindeki transponderı bitirip durur
+            self._abort.set()
+            for t in threads:
+                t.join()
+            raise
+        finally:
+            completed = not self._errors and len(queue) == 0
+            for scanner, worker_checkpoint in zip(self.scanners[1:], checkpoints[1:]):
+                scanner._flush_trials()
+                worker_checkpoint.flush()
+            # Oturum en son, tüm tunerların kalanları yazıldıktan sonra kapanır
+            first._finish_items(checkpoint, completed)
+
+        if self._errors:
+            print(f"\n❌ Paralel tarama durduruldu: {self._errors[0]!r}")
+            raise self._errors[0]
+
+        for scanner in self.scanners:
+            self.scan_result.merge(scanner.scan_result)
+        self.scan_result.scan_duration = time.time() - start_time
+
+        per_tuner = ", ".join(
+            f"adapter{s.adapter.adapter_num}: {s.scan_result.transponders_scanned}"
+            for s in self.scanners
+        )
+        print(f"\n🔀 Dağılım: {per_tuner} (çalınan iş: {queue.steals})")
+        if self.failed:
+            print(f"⚠️  Cihaz hatası nedeniyle taranamayan: {self.failed} transponder")
+        first._print_scan_summary(self.scan_result)
+        return self.scan_result
+
+    def scan_turksat(self, resume: bool = False) -> ScanResult:
+        return self.scan(resume=resume)
+
+    def close(self):
+        for adapter in self.adapters:
+            adapter.close()
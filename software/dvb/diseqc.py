@@ -4,13 +4,16 @@ APEXSAT AI - DiSEqC Motor ve Switch Kontrol Modülü
 
 DiSEqC 1.0/1.1/1.2 ve USALS protokol desteği.
 LNB voltaj (13V/18V) ve 22kHz tone kontrolü.
+Çoklu uydu taramasında uydu sırası ve motor hareketi DishPositioner ile
+yönetilir.
 """
 
+import math
 import struct
 import time
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 
 class DiSEqCVersion(IntEnum):
@@ -53,6 +56,22 @@ SATELLITE_POSITIONS = {
 }
 
 
+# Varsayılan alıcı konumu (İzmir/Manisa civarı)
+SITE_LATITUDE = 38.42
+SITE_LONGITUDE = 27.14
+
+# Motor hareket modeli
+MOTOR_SPEED_DEG_S = 1.5     # Tipik USALS motor hızı (derece/saniye, 18V)
+MOTOR_SETTLE_S = 0.5        # Durduktan sonra çanak salınımının sönmesi
+
+
+def usals_motor_angle(satellite_longitude: float, site_latitude: float,
+                      site_longitude: float) -> float:
+    """USALS motor açısı (derece, Doğu pozitif)."""
+    delta_lon = math.radians(satellite_longitude - site_longitude)
+    return math.degrees(math.atan2(math.tan(delta_lon), math.sin(math.radians(site_latitude))))
+
+
 class DiSEqCController:
     """DiSEqC switch ve motor kontrol sınıfı."""
 
@@ -337,8 +356,6 @@ class DiSEqCController:
             site_latitude: Alıcı enlem (Kuzey pozitif)
             site_longitude: Alıcı boylam (Doğu pozitif)
         """
-        import math
-
         # Motor açısı hesaplama (GotoX formülü)
         sat_lon_rad = math.radians(satellite_longitude)
         site_lat_rad = math.radians(site_latitude)
@@ -346,12 +363,6 @@ class DiSEqCController:
 
         delta_lon = sat_lon_rad - site_lon_rad
 
-        # Azimut hesaplama
-        azimuth = math.atan2(
-            math.tan(delta_lon),
-            math.sin(site_lat_rad)
-        )
-
         # Elevasyon hesaplama
         r_eq = 42164.0    # Geostasyon yörünge yarıçapı (km)
         r_earth = 6378.14  # Dünya yarıçapı (km)
@@ -363,7 +374,7 @@ class DiSEqCController:
         )
 
         # Motor açısı
-        motor_angle = math.degrees(azimuth)
+        motor_angle = usals_motor_angle(satellite_longitude, site_latitude, site_longitude)
 
         print(f"\n🛰️  USALS Hesaplama:")
         print(f"  Uydu: {satellite_longitude:.1f}°{'E' if satellite_longitude >= 0 else 'W'}")
@@ -396,7 +407,7 @@ class DiSEqCController:
         print(f"  🔄 Motor {abs(motor_angle):.2f}° {dir_name}'ya gönderildi\n")
 
     def goto_satellite(self, sat_name: str,
-                        site_lat: float = 38.42, site_lon: float = 27.14):
+                        site_lat: float = SITE_LATITUDE, site_lon: float = SITE_LONGITUDE):
         """
         Bilinen uyduya yönlen (USALS ile).
 
@@ -416,6 +427,106 @@ class DiSEqCController:
         self.usals_goto_angle(sat.longitude, site_lat, site_lon)
 
 
+# ─── Çoklu Uydu Konumlandırma ───────────────────────────────────────────────
+
+class DishPositioner:
+    """
+    Çoklu uydu taramasında uydu sırası ve çanak hareketi.
+
+    mode="usals": motor USALS ile döndürülür; goto() komutu gönderip hemen
+    döner, wait() kalan hareket süresini bekler. Arada önceki uydunun
+    veritabanı yazımı yapılarak motor hareketi boşa beklenmez.
+    mode="switch": uydular DiSEqC switch portlarındadır (port geçişini
+    tarayıcı yapar); sıralama port numarasına göredir.
+    """
+
+    def __init__(self, controller: Optional[DiSEqCController] = None, mode: str = "usals",
+                 site_lat: float = SITE_LATITUDE, site_lon: float = SITE_LONGITUDE,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep,
+                 speed: float = MOTOR_SPEED_DEG_S, settle: float = MOTOR_SETTLE_S):
+        if mode not in ("usals", "switch"):
+            raise ValueError(f"Bilinmeyen konumlandırma: {mode}")
+        self.controller = controller
+        self.mode = mode
+        self.site_lat = site_lat
+        self.site_lon = site_lon
+        self.clock = clock
+        self.sleep = sleep
+        self.speed = speed
+        self.settle = settle
+
+        self.current: Optional[str] = None
+        self.angle = 0.0                # Motor açılışta referans (0°) konumunda varsayılır
+        self.ready_at = 0.0
+        self.moves = 0
+        self.travel_deg = 0.0
+        self.travel_s = 0.0             # Toplam hareket süresi
+        self.waited_s = 0.0             # Hareketin örtüşmeyip beklenen kısmı
+
+    def angle_of(self, name: str) -> float:
+        sat = SATELLITE_POSITIONS[name]
+        return usals_motor_angle(sat.longitude, self.site_lat, self.site_lon)
+
+    def travel_time(self, name: str) -> float:
+        if self.mode != "usals" or name == self.current:
+            return 0.0
+        return abs(self.angle_of(name) - self.angle) / self.speed + self.settle
+
+    def order(self, names: Iterable[str]) -> list[str]:
+        """
+        Toplam motor hareketini en aza indiren uydu sırası.
+
+        Uydular tek eksende (motor açısı) olduğundan en kısa yol, mevcut
+        konuma yakın uçtan başlayıp diğer uca tek geçiştir.
+        """
+        names = list(dict.fromkeys(names))
+        if self.mode == "switch":
+            return sorted(names, key=lambda n: SATELLITE_POSITIONS[n].diseqc_port)
+
+        by_angle = sorted(names, key=self.angle_of)
+        if not by_angle:
+            return by_angle
+        west, east = self.angle_of(by_angle[0]), self.angle_of(by_angle[-1])
+        if abs(self.angle - east) < abs(self.angle - west):
+            by_angle.reverse()
+        return by_angle
+
+    def route_cost(self, names: Iterable[str]) -> float:
+        """Verilen sırayla gezmenin toplam hareket süresi (saniye)."""
+        if self.mode != "usals":
+            return 0.0
+        angle, total = self.angle, 0.0
+        for name in names:
+            target = self.angle_of(name)
+            if target != angle:
+                total += abs(target - angle) / self.speed + self.settle
+            angle = target
+        return total
+
+    def goto(self, name: str) -> float:
+        """Hareketi başlat, beklemeden dön → tahmini hareket süresi."""
+        travel = self.travel_time(name)
+        if self.mode == "usals" and name != self.current:
+            if self.controller is not None:
+                self.controller.goto_satellite(name, self.site_lat, self.site_lon)
+            target = self.angle_of(name)
+            self.travel_deg += abs(target - self.angle)
+            self.angle = target
+            self.moves += 1
+            self.travel_s += travel
+            self.ready_at = self.clock() + travel
+        self.current = name
+        return travel
+
+    def wait(self):
+        """Çanak yerine oturana kadar bekle."""
+        remaining = self.ready_at - self.clock()
+        if remaining > 0:
+            self.waited_s += remaining
+            self.sleep(remaining)
+
+
 # ─── Kullanım Örneği ────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
@@ -6,20 +6,56 @@ DVB-SI EIT tablolarından ve internet kaynaklarından (XMLTV) EPG verisi toplar.
 AI ile zenginleştirilmiş meta-data desteği.
 """
 
+import gzip
+import heapq
 import json
 import sqlite3
+import threading
 import time
 import struct
 import urllib.request
+import zlib
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+
+try:
+    from .psi import PID_EIT, parse_section
+except ImportError:
+    from psi import PID_EIT, parse_section
 
 
 SCRIPT_DIR = Path(__file__).parent
 EPG_DB = SCRIPT_DIR / "epg.db"
 
+# Kalıcı bağlantı ayarları (kanal veritabanıyla aynı; toplu yüklemeler için daha büyük önbellek)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",          # Okuyucular (UI) yükleme sırasında beklemez
+    "PRAGMA synchronous=NORMAL",        # WAL'da commit başına fsync yok
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",         # ~16 MB sayfa önbelleği
+    "PRAGMA busy_timeout=5000",
+)
+
+# Toplu yazım: transaction başına olay sayısı
+EPG_BATCH = 5000
+# Bu kadar olaydan büyük yüklemelerde ikincil indeksler sonda yeniden kurulur
+DEFER_INDEX_THRESHOLD = 50000
+# Programı olmayan kanalın boş now/next sonucu bu kadar saniye önbellekte kalır
+NOW_NEXT_EMPTY_TTL = 300
+# Bu boyuttan büyük XMLTV dosyaları ertelenmiş indeksle yüklenir
+XMLTV_DEFER_BYTES = 20 * 1024 * 1024
+
+
+def epoch(dt: datetime) -> int:
+    """UTC epoch saniyesi; saat dilimsiz datetime yerel saat kabul edilir."""
+    return int(dt.timestamp())
+
 
 @dataclass
 class EPGEvent:
@@ -47,20 +83,63 @@ class EPGEvent:
     def end_time(self) -> datetime:
         return self.start_time + timedelta(minutes=self.duration)
 
+    @property
+    def start_ts(self) -> int:
+        return epoch(self.start_time)
+
+    @property
+    def end_ts(self) -> int:
+        return self.start_ts + self.duration * 60
+
+    def _now(self) -> datetime:
+        # EIT zamanları UTC'dir (saat dilimli), XMLTV/simülasyon yerel saat
+        return datetime.now(self.start_time.tzinfo)
+
     @property
     def is_current(self) -> bool:
-        now = datetime.now()
+        now = self._now()
         return self.start_time <= now < self.end_time
 
     @property
     def progress_percent(self) -> float:
         if not self.is_current:
-            return 0.0 if datetime.now() < self.start_time else 100.0
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+            return 0.0 if self._now() < self.start_time else 100.0
+        elapsed = (self._now() - self.start_time).total_seconds()
         total = self.duration * 60
         return min((elapsed / total) * 100, 100.0)
 
 
+@dataclass
+class EPGGrid:
+    """
+    Rehber görünümü için sütunlu olay listesi (satır, sonra başlangıç sırasında).
+
+    row: channel_ids içindeki kanal sırası (grid satırı); start/end UTC
+    epoch; title: EPGDatabase.titles havuzundaki başlık indeksi (aynı
+    başlık her sorguda aynı indeks). event: açıklama için satır id'si.
+    """
+    channel_ids: np.ndarray     # int64, istenen sırada
+    start_ts: int               # Pencere
+    end_ts: int
+    event: np.ndarray           # int64, epg_events.id
+    row: np.ndarray             # int32
+    start: np.ndarray           # int64
+    end: np.ndarray             # int64
+    title: np.ndarray           # int32
+    titles: list[str]           # Başlık havuzu (paylaşılan, sadece büyür)
+
+    def __len__(self) -> int:
+        return len(self.event)
+
+    def row_slice(self, row: int) -> slice:
+        """Bir grid satırının olayları (dizilerde ardışık)."""
+        lo, hi = np.searchsorted(self.row, [row, row + 1])
+        return slice(int(lo), int(hi))
+
+    def title_of(self, index: int) -> str:
+        return self.titles[self.title[index]]
+
+
 # DVB-SI EIT Tür tablosu (ETSI EN 300 468)
 DVB_CONTENT_TYPES = {
     0x10: "Film", 0x11: "Polisiye/Gerilim", 0x12: "Macera/Western",
@@ -89,14 +168,57 @@ DVB_CONTENT_TYPES = {
 
 
 class EPGDatabase:
-    """EPG veritabanı yöneticisi."""
+    """
+    EPG veritabanı yöneticisi.
+
+    Tek kalıcı bağlantı (WAL) iş parçacıkları arasında kilitle paylaşılır.
+    save_events() olayları EPG_BATCH'lik parçalar halinde, parça başına tek
+    transaction'da executemany ile yazar; girdi liste ya da akış olabilir.
+
+    Zaman sorguları start_ts/end_ts (UTC epoch) tamsayı sütunlarında saf
+    indeks aralıklarıdır; start_time/duration uyumluluk için saklanır.
+    "Şu an" taraması start_ts'i en uzun olay süresi (epg_meta.max_span)
+    kadar geriye sınırlar, böylece tüm tablo değil sadece son olaylar okunur.
+    """
+
+    # Toplu yüklemede bırakılıp sonda yeniden kurulabilen ikincil indeksler
+    INDEXES = {
+        # Kanal programı, şimdiki/sonraki (end_ts: satıra inmeden kapsanır)
+        "idx_epg_channel_start": "epg_events(channel_id, start_ts, end_ts)",
+        # Tüm kanallarda şu an: start_ts aralığı, end_ts/kanal indeksten
+        "idx_epg_time": "epg_events(start_ts, end_ts, channel_id)",
+        "idx_epg_genre": "epg_events(genre)",
+    }
+    # Eski şemanın fonksiyon sarmalı sorgularla kullanılamayan indeksleri
+    _LEGACY_INDEXES = ("idx_epg_channel", "idx_epg_start")
+    _MIGRATIONS = {"start_ts": "INTEGER", "end_ts": "INTEGER"}
 
     def __init__(self, db_path: Path = EPG_DB):
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        for pragma in SQLITE_PRAGMAS:
+            self.conn.execute(pragma)
+        self._max_span = 0          # En uzun olay süresi (saniye)
+        self._subscribers: dict[int, Callable[[set[int]], None]] = {}
+        self._next_token = 0
+        self.titles: list[str] = []             # Grid başlık havuzu
+        self._title_index: dict[str, int] = {}
         self._init_db()
 
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Kilitli, tek commit'li yazım bloğu."""
+        with self._lock, self.conn:
+            yield self.conn
+
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS epg_events (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -119,6 +241,8 @@ class EPGDatabase:
                     imdb_rating REAL DEFAULT 0,
                     poster_url TEXT DEFAULT '',
                     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    start_ts INTEGER,
+                    end_ts INTEGER,
                     UNIQUE(channel_id, event_id)
                 );
 
@@ -131,72 +255,262 @@ class EPGDatabase:
                     event_count INTEGER DEFAULT 0
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_epg_channel ON epg_events(channel_id);
-                CREATE INDEX IF NOT EXISTS idx_epg_start ON epg_events(start_time);
-                CREATE INDEX IF NOT EXISTS idx_epg_genre ON epg_events(genre);
+                CREATE TABLE IF NOT EXISTS epg_meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER
+                );
             """)
+            self._migrate(conn)
+            # Yarıda kalan ertelenmiş yüklemeden eksik kalan indeksler de burada kurulur
+            self._create_indexes(conn)
+            self._max_span = self._meta(conn, "max_span")
+
+    def _migrate(self, conn: sqlite3.Connection):
+        """
+        Eski epg.db: start_ts/end_ts sütunlarını ekle ve doldur.
+
+        start_time ISO metni Python'da çözülür (saat dilimsiz → yerel saat,
+        yeni yazımlarla aynı kural); SQLite strftime('%s') yereli UTC sanır.
+        """
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(epg_events)")}
+        for column, decl in self._MIGRATIONS.items():
+            if column not in existing:
+                conn.execute(f"ALTER TABLE epg_events ADD COLUMN {column} {decl}")
+        for name in self._LEGACY_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+        cursor = conn.execute(
+            "SELECT id, start_time, duration FROM epg_events WHERE start_ts IS NULL")
+        while True:
+            rows = cursor.fetchmany(EPG_BATCH)
+            if not rows:
+                break
+            updates = []
+            for row_id, start_time, duration in rows:
+                start = epoch(datetime.fromisoformat(start_time))
+                updates.append((start, start + duration * 60, row_id))
+            conn.executemany("UPDATE epg_events SET start_ts = ?, end_ts = ? WHERE id = ?", updates)
+            self._raise_max_span(conn, max(end - start for start, end, _ in updates))
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection, key: str) -> int:
+        row = conn.execute("SELECT value FROM epg_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def _raise_max_span(self, conn: sqlite3.Connection, span: int):
+        """En uzun olay süresini büyüt (silmede küçültülmez, sınır sadece genişler)."""
+        conn.execute("""
+            INSERT INTO epg_meta (key, value) VALUES ('max_span', ?)
+            ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)
+        """, (span,))
+        self._max_span = max(self._max_span, span)
+
+    def _create_indexes(self, conn: sqlite3.Connection):
+        for name, target in self.INDEXES.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+    def _drop_indexes(self, conn: sqlite3.Connection):
+        for name in self.INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+    @staticmethod
+    def _event_row(event: EPGEvent) -> tuple:
+        start_ts = event.start_ts
+        return (
+            event.channel_id, event.event_id,
+            event.start_time.isoformat(), event.duration,
+            start_ts, start_ts + event.duration * 60,
+            event.title, event.description,
+            event.genre, event.sub_genre, event.parental_rating,
+            event.language, event.is_hd,
+            event.has_subtitle, event.has_audio_desc,
+            event.ai_category, event.ai_score,
+            event.imdb_id, event.imdb_rating, event.poster_url,
+        )
+
+    def _insert_events(self, conn: sqlite3.Connection, events: list[EPGEvent]):
+        conn.executemany("""
+            INSERT OR REPLACE INTO epg_events
+            (channel_id, event_id, start_time, duration, start_ts, end_ts, title, description,
+             genre, sub_genre, parental_rating, language, is_hd,
+             has_subtitle, has_audio_desc, ai_category, ai_score,
+             imdb_id, imdb_rating, poster_url)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, map(self._event_row, events))
+        span = max(event.duration for event in events) * 60
+        if span > self._max_span:
+            self._raise_max_span(conn, span)
+
+    # ─── Değişiklik bildirimi ───
+
+    def subscribe(self, callback: Callable[[set[int]], None]) -> int:
+        """Her yazılan parçadan sonra değişen kanal id'leriyle çağrıl; token döner."""
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscribers[token] = callback
+        return token
+
+    def unsubscribe(self, token: int):
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def _notify(self, channel_ids: set[int]):
+        for callback in list(self._subscribers.values()):
+            callback(channel_ids)
 
     def save_event(self, event: EPGEvent):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO epg_events
-                (channel_id, event_id, start_time, duration, title, description,
-                 genre, sub_genre, parental_rating, language, is_hd,
-                 has_subtitle, has_audio_desc, ai_category, ai_score,
-                 imdb_id, imdb_rating, poster_url)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event.channel_id, event.event_id,
-                event.start_time.isoformat(), event.duration,
-                event.title, event.description,
-                event.genre, event.sub_genre, event.parental_rating,
-                event.language, event.is_hd,
-                event.has_subtitle, event.has_audio_desc,
-                event.ai_category, event.ai_score,
-                event.imdb_id, event.imdb_rating, event.poster_url
-            ))
-
-    def save_events(self, events: list[EPGEvent]):
-        for event in events:
-            self.save_event(event)
-
-    def get_current_events(self, channel_ids: list[int] = None) -> list[dict]:
-        """Şu anda yayınlanan programları getir."""
-        now = datetime.now().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        self.save_events([event])
+
+    def save_events(self, events: Iterable[EPGEvent], batch_size: int = EPG_BATCH,
+                    defer_indexes: Optional[bool] = None) -> int:
+        """
+        Olayları toplu yaz; yazılan olay sayısını döndür.
+
+        Her parça ayrı transaction'dır: okuyucular yükleme boyunca beklemez,
+        kesintide o ana kadarki parçalar kalır. defer_indexes=True ikincil
+        indeksleri yükleme öncesi bırakıp sonda tek seferde kurar (çok
+        büyük yüklemelerde satır başına indeks güncellemesinden hızlı);
+        None: liste DEFER_INDEX_THRESHOLD'dan büyükse.
+        """
+        if defer_indexes is None:
+            defer_indexes = isinstance(events, list) and len(events) > DEFER_INDEX_THRESHOLD
+
+        if defer_indexes:
+            with self._transaction() as conn:
+                self._drop_indexes(conn)
+
+        count = 0
+        iterator = iter(events)
+        try:
+            while True:
+                chunk = list(islice(iterator, batch_size))
+                if not chunk:
+                    break
+                with self._transaction() as conn:
+                    self._insert_events(conn, chunk)
+                count += len(chunk)
+                self._notify({event.channel_id for event in chunk})
+        finally:
+            if defer_indexes:
+                with self._transaction() as conn:
+                    self._create_indexes(conn)
+        return count
+
+    def get_current_events(self, channel_ids: list[int] = None,
+                           now: Optional[float] = None) -> list[dict]:
+        """Şu anda yayınlanan programları getir (now: epoch, varsayılan şimdi)."""
+        now = int(time.time() if now is None else now)
+        with self._lock:
             query = """
                 SELECT * FROM epg_events
-                WHERE start_time <= ?
-                AND datetime(start_time, '+' || duration || ' minutes') > ?
+                WHERE start_ts > ? AND start_ts <= ? AND end_ts > ?
             """
-            params = [now, now]
+            params = [now - self._max_span, now, now]
             if channel_ids:
                 placeholders = ",".join("?" * len(channel_ids))
                 query += f" AND channel_id IN ({placeholders})"
                 params.extend(channel_ids)
             query += " ORDER BY channel_id"
-            return [dict(r) for r in conn.execute(query, params).fetchall()]
+            return [dict(r) for r in self.conn.execute(query, params).fetchall()]
 
     def get_schedule(self, channel_id: int, date: str = None) -> list[dict]:
-        """Belirli kanalın programını getir."""
+        """Belirli kanalın programını getir (date: yerel gün, YYYY-MM-DD)."""
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
+        day = datetime.strptime(date, "%Y-%m-%d")
+        return self.get_range(channel_id, epoch(day), epoch(day + timedelta(days=1)))
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("""
+    def get_range(self, channel_id: int, start_ts: int, end_ts: int) -> list[dict]:
+        """Kanalın [start_ts, end_ts) aralığında başlayan olayları."""
+        with self._lock:
+            rows = self.conn.execute("""
                 SELECT * FROM epg_events
-                WHERE channel_id = ?
-                AND date(start_time) = ?
-                ORDER BY start_time
-            """, (channel_id, date)).fetchall()
+                WHERE channel_id = ? AND start_ts >= ? AND start_ts < ?
+                ORDER BY start_ts
+            """, (channel_id, start_ts, end_ts)).fetchall()
             return [dict(r) for r in rows]
 
+    def get_now_next(self, channel_id: int, now: Optional[float] = None) -> dict:
+        """Kanalın şimdiki ve sonraki olayı: iki indeks araması."""
+        now = int(time.time() if now is None else now)
+        with self._lock:
+            current = self.conn.execute("""
+                SELECT * FROM epg_events WHERE channel_id = ? AND start_ts <= ?
+                ORDER BY start_ts DESC LIMIT 1
+            """, (channel_id, now)).fetchone()
+            if current is not None and current["end_ts"] <= now:
+                current = None
+            next_prog = self.conn.execute("""
+                SELECT * FROM epg_events WHERE channel_id = ? AND start_ts > ?
+                ORDER BY start_ts LIMIT 1
+            """, (channel_id, now)).fetchone()
+        return {"current": dict(current) if current else None,
+                "next": dict(next_prog) if next_prog else None}
+
+    # ─── Rehber grid'i ───
+
+    def get_grid(self, channel_ids: Sequence[int], start_ts: int, end_ts: int) -> EPGGrid:
+        """
+        Kanal aralığı × zaman penceresiyle kesişen olaylar, tek sorguda.
+
+        Sadece id/kanal/zaman/başlık okunur; açıklama odaklanınca
+        get_description() ile alınır. Başlıklar havuzda tekilleştirilir,
+        kaydırmada tekrar gelen başlıklar için yeni dizge oluşmaz.
+        """
+        channel_ids = [int(c) for c in channel_ids]
+        rows = {channel_id: i for i, channel_id in enumerate(channel_ids)}
+        placeholders = ",".join("?" * len(channel_ids))
+        with self._lock:
+            result = self.conn.execute(f"""
+                SELECT id, channel_id, start_ts, end_ts, title FROM epg_events
+                WHERE channel_id IN ({placeholders})
+                  AND start_ts > ? AND start_ts < ? AND end_ts > ?
+            """, (*channel_ids, start_ts - self._max_span, end_ts, start_ts)).fetchall()
+
+            count = len(result)
+            event = np.empty(count, dtype=np.int64)
+            row = np.empty(count, dtype=np.int32)
+            start = np.empty(count, dtype=np.int64)
+            end = np.empty(count, dtype=np.int64)
+            title = np.empty(count, dtype=np.int32)
+            intern = self._intern_title
+            for i, (event_id, channel_id, event_start, event_end, event_title) in enumerate(result):
+                event[i] = event_id
+                row[i] = rows[channel_id]
+                start[i] = event_start
+                end[i] = event_end
+                title[i] = intern(event_title)
+
+        order = np.lexsort((start, row))
+        return EPGGrid(np.array(channel_ids, dtype=np.int64), start_ts, end_ts,
+                       event[order], row[order], start[order], end[order], title[order],
+                       self.titles)
+
+    def _intern_title(self, title: str) -> int:
+        index = self._title_index.get(title)
+        if index is None:
+            index = self._title_index[title] = len(self.titles)
+            self.titles.append(title)
+        return index
+
+    def get_description(self, event_id: int) -> str:
+        """Grid olayının açıklaması (event: epg_events.id)."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT description FROM epg_events WHERE id = ?", (event_id,)).fetchone()
+        return row[0] if row else ""
+
+    def get_event(self, event_id: int) -> Optional[dict]:
+        """Grid olayının tüm alanları (odaklanınca bilgi paneli için)."""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM epg_events WHERE id = ?", (event_id,)).fetchone()
+        return dict(row) if row else None
+
     def search_programs(self, query: str, genre: str = None) -> list[dict]:
         """Program ara (başlık ve açıklama)."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._lock:
+            conn = self.conn
             sql = """
                 SELECT * FROM epg_events
                 WHERE (title LIKE ? OR description LIKE ?)
@@ -205,24 +519,23 @@ class EPGDatabase:
             if genre:
                 sql += " AND genre = ?"
                 params.append(genre)
-            sql += " ORDER BY start_time LIMIT 50"
+            sql += " ORDER BY start_ts LIMIT 50"
             return [dict(r) for r in conn.execute(sql, params).fetchall()]
 
     def get_genres(self) -> list[dict]:
         """Mevcut türleri ve sayılarını getir."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            return [dict(r) for r in conn.execute("""
+        with self._lock:
+            return [dict(r) for r in self.conn.execute("""
                 SELECT genre, COUNT(*) as count FROM epg_events
                 WHERE genre != '' GROUP BY genre ORDER BY count DESC
             """).fetchall()]
 
     def cleanup_old_events(self, days_before: int = 7):
         """Eski EPG verilerini temizle."""
-        cutoff = (datetime.now() - timedelta(days=days_before)).isoformat()
-        with sqlite3.connect(self.db_path) as conn:
+        cutoff = epoch(datetime.now() - timedelta(days=days_before))
+        with self._transaction() as conn:
             deleted = conn.execute(
-                "DELETE FROM epg_events WHERE start_time < ?", (cutoff,)
+                "DELETE FROM epg_events WHERE start_ts < ?", (cutoff,)
             ).rowcount
             print(f"🗑️  {deleted} eski EPG kaydı silindi (>{days_before} gün)")
 
@@ -314,6 +627,34 @@ class EITParser:
 
         return events
 
+    def collect(self, source, timeout: float = 30.0, actual_only: bool = True) -> list[EPGEvent]:
+        """
+        Section kaynağından (demux, TS kaydı) EIT section'larını topla.
+
+        Tekrarlanan section'lar (aynı tablo/servis/sürüm/numara) bir kez
+        ayrıştırılır.
+        """
+        events = []
+        seen = set()
+        # 0x40-0x7F: PID 0x12 üzerindeki tüm EIT tabloları
+        for _, data in source.sections({PID_EIT: (0x40, 0xC0)}, timeout):
+            if len(data) < 14:
+                continue
+            table_id = data[0]
+            if actual_only and not (table_id == self.TABLE_ID_ACTUAL_PF
+                                    or self.TABLE_ID_ACTUAL_SCHED <= table_id <= 0x5F):
+                continue
+
+            key = (table_id, bytes(data[3:12]))
+            if key in seen:
+                continue
+            section = parse_section(data, check_crc=not source.crc_checked)
+            if section is None:
+                continue
+            seen.add(key)
+            events.extend(self.parse_eit_section(section.data))
+        return events
+
     def _parse_dvb_datetime(self, data: bytes) -> Optional[datetime]:
         """DVB MJD+UTC zaman formatını parse et."""
         if len(data) < 5:
@@ -337,7 +678,7 @@ class EITParser:
         second = self._bcd_to_int(data[4])
 
         try:
-            return datetime(year, month, day, hour, minute, second)
+            return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
         except ValueError:
             return None
 
@@ -415,59 +756,108 @@ class EITParser:
             return text_data.decode("utf-8", errors="replace").strip()
 
 
-class XMLTVParser:
-    """XMLTV formatında EPG veri parser."""
+_XMLTV_ZONES: dict[str, timezone] = {"Z": timezone.utc, "UTC": timezone.utc,
+                                     "GMT": timezone.utc}
 
-    def parse_file(self, filepath: Path) -> list[EPGEvent]:
-        """XMLTV dosyasını parse et."""
-        import xml.etree.ElementTree as ET
 
-        events = []
-        tree = ET.parse(filepath)
-        root = tree.getroot()
+def parse_xmltv_time(value: str) -> Optional[datetime]:
+    """
+    XMLTV zamanı: "YYYYMMDDhhmmss +hhmm" (saniye ve dilim isteğe bağlı).
 
-        for programme in root.findall("programme"):
-            channel = programme.get("channel", "")
-            start = programme.get("start", "")
-            stop = programme.get("stop", "")
+    strptime yerine sabit konumlu dilimleme; dilim nesneleri ofset başına
+    bir kez oluşturulur. Dilim varsa sonuç saat dilimlidir, yoksa yerel
+    saat kabul edilen dilimsiz datetime döner.
+    """
+    stamp, _, offset = value.strip().partition(" ")
+    if len(stamp) > 14 and stamp[14] in "+-":        # "20230615180000+0300"
+        stamp, offset = stamp[:14], stamp[14:]
+    if len(stamp) not in (12, 14) or not stamp.isdigit():
+        return None
+
+    try:
+        tz = None
+        if offset:
+            tz = _XMLTV_ZONES.get(offset)
+            if tz is None:
+                if (len(offset) != 5 or offset[0] not in "+-" or not offset[1:].isdigit()
+                        or int(offset[3:5]) >= 60):
+                    return None
+                # ±24 saat ve üstü ofsetlerde timezone() ValueError verir
+                minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+                tz = _XMLTV_ZONES[offset] = timezone(
+                    timedelta(minutes=-minutes if offset[0] == "-" else minutes))
+        return datetime(int(stamp[0:4]), int(stamp[4:6]), int(stamp[6:8]),
+                        int(stamp[8:10]), int(stamp[10:12]),
+                        int(stamp[12:14]) if len(stamp) == 14 else 0, tzinfo=tz)
+    except ValueError:
+        return None
 
-            title_elem = programme.find("title")
-            desc_elem = programme.find("desc")
-            category_elem = programme.find("category")
 
-            title = title_elem.text if title_elem is not None else ""
-            desc = desc_elem.text if desc_elem is not None else ""
-            genre = category_elem.text if category_elem is not None else ""
+class XMLTVParser:
+    """
+    XMLTV formatında EPG veri parser.
 
-            start_time = self._parse_xmltv_time(start)
-            end_time = self._parse_xmltv_time(stop)
+    Dosya iterparse ile akış halinde okunur: her <programme> işlendikten
+    sonra kökten temizlenir, bellekte DOM birikmez. .gz dosyalar doğrudan
+    okunur. Kanal id'si XMLTV kanal adının CRC32'sidir (süreçten bağımsız,
+    her yüklemede aynı); olay id'si başlangıç dakikasıdır.
+    """
 
-            if start_time and title:
-                duration = 30  # varsayılan
-                if end_time:
-                    duration = int((end_time - start_time).total_seconds() / 60)
+    @staticmethod
+    def channel_id(channel: str) -> int:
+        return zlib.crc32(channel.encode("utf-8")) & 0x7FFFFFFF
 
-                events.append(EPGEvent(
-                    channel_id=hash(channel) & 0xFFFF,
-                    event_id=hash(f"{channel}{start}") & 0xFFFF,
-                    start_time=start_time,
-                    duration=max(duration, 1),
-                    title=title,
-                    description=desc,
-                    genre=genre,
-                ))
+    def iter_events(self, filepath: Path) -> Iterator[EPGEvent]:
+        """XMLTV olaylarını dosya sırasıyla tek tek üret (sabit bellek)."""
+        import xml.etree.ElementTree as ET
 
-        return events
+        opener = gzip.open if str(filepath).endswith(".gz") else open
+        channel_ids: dict[str, int] = {}
+        with opener(filepath, "rb") as f:
+            context = ET.iterparse(f, events=("start", "end"))
+            _, root = next(context)
+            for kind, elem in context:
+                if kind != "end" or elem.tag != "programme":
+                    continue
+                event = self._programme_event(elem, channel_ids)
+                root.clear()        # İşlenen programme (ve önceki <channel>'lar) bırakılır
+                if event is not None:
+                    yield event
+
+    def _programme_event(self, programme, channel_ids: dict[str, int]) -> Optional[EPGEvent]:
+        channel = programme.get("channel", "")
+        start_time = parse_xmltv_time(programme.get("start", ""))
+        title = programme.findtext("title")
+        if start_time is None or not title:
+            return None
+
+        duration = 30  # varsayılan
+        end_time = parse_xmltv_time(programme.get("stop", ""))
+        if end_time is not None:
+            if (end_time.tzinfo is None) != (start_time.tzinfo is None):
+                end_time = end_time.replace(tzinfo=start_time.tzinfo)
+            duration = int((end_time - start_time).total_seconds() / 60)
+
+        channel_id = channel_ids.get(channel)
+        if channel_id is None:
+            channel_id = channel_ids[channel] = self.channel_id(channel)
+        return EPGEvent(
+            channel_id=channel_id,
+            event_id=epoch(start_time) // 60,
+            start_time=start_time,
+            duration=max(duration, 1),
+            title=title,
+            description=programme.findtext("desc") or "",
+            genre=programme.findtext("category") or "",
+        )
+
+    def parse_file(self, filepath: Path) -> list[EPGEvent]:
+        """XMLTV dosyasını parse et (tüm liste; büyük dosyalarda iter_events)."""
+        return list(self.iter_events(filepath))
 
     def _parse_xmltv_time(self, time_str: str) -> Optional[datetime]:
         """XMLTV zaman formatını parse et (20230615180000 +0300)."""
-        if not time_str:
-            return None
-        try:
-            time_str = time_str.strip().split()[0]  # Timezone kısmını at
-            return datetime.strptime(time_str[:14], "%Y%m%d%H%M%S")
-        except ValueError:
-            return None
+        return parse_xmltv_time(time_str) if time_str else None
 
 
 class EPGManager:
@@ -478,54 +868,134 @@ class EPGManager:
         self.eit_parser = EITParser()
         self.xmltv_parser = XMLTVParser()
 
-    def fetch_dvb_epg(self, adapter_num: int = 0, timeout: int = 30):
-        """DVB-SI EIT tablolarından EPG topla."""
+        # now/next önbelleği: kanal → (geçerlilik sonu, sonuç); yığın (son, kanal)
+        self._now_next: dict[int, tuple[int, dict]] = {}
+        self._expiry: list[tuple[int, int]] = []
+        self._cache_lock = threading.Lock()
+        self._generation = 0        # Her geçersiz kılmada artar
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.db.subscribe(self.invalidate)
+
+    def fetch_dvb_epg(self, adapter_num: int = 0, timeout: int = 30, frontend=None):
+        """
+        DVB-SI EIT tablolarından EPG topla.
+
+        frontend: section_source() sunan arka uç (IoctlFrontend, FakeFrontend,
+        ReplayFrontend); verilmezse adaptörün demux cihazı kullanılır.
+        """
         print("📺 DVB-SI EPG verisi toplanıyor...")
 
-        # dvbv5-tools ile EIT dump
-        import subprocess
+        if frontend is None:
+            try:
+                from .frontend import IoctlFrontend
+            except ImportError:
+                from frontend import IoctlFrontend
+            frontend = IoctlFrontend(f"/dev/dvb/adapter{adapter_num}/frontend0")
+
         try:
-            result = subprocess.run(
-                ["dvbv5-scan", "-a", str(adapter_num), "--input-format=CHANNEL",
-                 "--output-format=VDR"],
-                capture_output=True, timeout=timeout
-            )
-            # Parse edilecek veri...
-            print(f"  ✅ DVB EPG verisi alındı ({len(result.stdout)} bytes)")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+            source = frontend.section_source()
+            try:
+                events = self.eit_parser.collect(source, timeout)
+            finally:
+                source.close()
+        except OSError:
             print("  ⚠️  DVB EPG alınamadı (simülasyon verisi kullanılacak)")
             self._load_simulation_epg()
+            return
+
+        self.db.save_events(events)
+        print(f"  ✅ {len(events)} EIT olayı alındı")
 
     def fetch_xmltv_epg(self, url: str):
         """XMLTV formatında internet EPG'si indir."""
         print(f"🌐 XMLTV EPG indiriliyor...")
+        suffix = ".xml.gz" if url.endswith(".gz") else ".xml"
+        temp_path = SCRIPT_DIR / f"temp_epg{suffix}"
         try:
-            temp_path = SCRIPT_DIR / "temp_epg.xml"
             urllib.request.urlretrieve(url, temp_path)
-            events = self.xmltv_parser.parse_file(temp_path)
-            self.db.save_events(events)
-            print(f"  ✅ {len(events)} program yüklendi")
+            count = self.load_xmltv_file(temp_path)
+            print(f"  ✅ {count} program yüklendi")
         except Exception as e:
             print(f"  ❌ XMLTV indirme hatası: {e}")
-
-    def get_now_next(self, channel_id: int) -> dict:
-        """Kanalın şimdiki ve sonraki programını getir."""
-        events = self.db.get_schedule(channel_id)
-        now = datetime.now()
-
-        current = None
-        next_prog = None
-
-        for event in events:
-            start = datetime.fromisoformat(event["start_time"])
-            end = start + timedelta(minutes=event["duration"])
-            if start <= now < end:
-                current = event
-            elif start > now and next_prog is None:
-                next_prog = event
-                break
-
-        return {"current": current, "next": next_prog}
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def load_xmltv_file(self, filepath: Path) -> int:
+        """
+        XMLTV dosyasını akış halinde veritabanına yaz; olay sayısını döndür.
+
+        Olaylar ayrıştırıldıkça EPG_BATCH'lik parçalarla yazılır, bellekte
+        en fazla bir parça bulunur.
+        """
+        defer = Path(filepath).stat().st_size > XMLTV_DEFER_BYTES
+        return self.db.save_events(self.xmltv_parser.iter_events(filepath), defer_indexes=defer)
+
+    # ─── now/next önbelleği ───
+
+    def get_now_next(self, channel_id: int, now: Optional[float] = None) -> dict:
+        """
+        Kanalın şimdiki ve sonraki programını getir (sonuç salt okunur).
+
+        Sonuç şimdiki olayın bittiği ana (olay yoksa sonrakinin başladığı
+        ana) kadar bellekten verilir. Süresi dolan girişler geçerlilik
+        sonu yığınından sırayla atılır; kanala yeni EIT/XMLTV verisi
+        yazılınca giriş hemen silinir.
+        """
+        now = int(time.time() if now is None else now)
+        with self._cache_lock:
+            self._expire(now)
+            entry = self._now_next.get(channel_id)
+            if entry is not None:
+                self.cache_hits += 1
+                return entry[1]
+            self.cache_misses += 1
+            generation = self._generation
+
+        result = self.db.get_now_next(channel_id, now)
+        if result["current"] is not None:
+            expires = result["current"]["end_ts"]
+        elif result["next"] is not None:
+            expires = result["next"]["start_ts"]
+        else:
+            expires = now + NOW_NEXT_EMPTY_TTL
+
+        with self._cache_lock:
+            # Sorgu sırasında yeni veri geldiyse sonuç eski olabilir, saklanmaz
+            if generation == self._generation:
+                self._now_next[channel_id] = (expires, result)
+                heapq.heappush(self._expiry, (expires, channel_id))
+        return result
+
+    def get_now_next_many(self, channel_ids: Iterable[int],
+                          now: Optional[float] = None) -> dict[int, dict]:
+        """Kanal listesi için now/next (tek zaman anında)."""
+        now = int(time.time() if now is None else now)
+        return {channel_id: self.get_now_next(channel_id, now) for channel_id in channel_ids}
+
+    def _expire(self, now: int):
+        # Yığında silinmiş/yenilenmiş girişlerin eski kayıtları kalabilir; sadece eşleşen silinir
+        while self._expiry and self._expiry[0][0] <= now:
+            expires, channel_id = heapq.heappop(self._expiry)
+            entry = self._now_next.get(channel_id)
+            if entry is not None and entry[0] == expires:
+                del self._now_next[channel_id]
+
+    def invalidate(self, channel_ids: Optional[Iterable[int]] = None):
+        """Kanalların (None: tümünün) now/next girişlerini sil."""
+        with self._cache_lock:
+            self._generation += 1
+            if channel_ids is None:
+                self._now_next.clear()
+                self._expiry.clear()
+                return
+            for channel_id in channel_ids:
+                self._now_next.pop(channel_id, None)
+            # Yığın sadece geride kalan kayıtlarla şişmesin
+            if len(self._expiry) > 4 * len(self._now_next) + 64:
+                self._expiry = [(expires, channel_id) for channel_id, (expires, _)
+                                in self._now_next.items()]
+                heapq.heapify(self._expiry)
 
     def _load_simulation_epg(self):
         """Simülasyon EPG verisi (test için)."""
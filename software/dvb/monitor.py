@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+APEXSAT AI - Sürekli Sinyal Kalitesi İzleyici
+
+Adaptör başına arka plan iş parçacığı frontend'den (ioctl, FE_READ_STATUS +
+DTV_STAT_*) sabit hızda SNR/BER/sinyal gücü/UCB örnekler ve sabit boyutlu
+NumPy halka tamponuna yazar. Okuyucular (UI sinyal çubukları, çanak
+hizalama) kilit beklemeden son değeri, pencere min/max/ortalamasını okur ya
+da abone olup her örnekte çağrılır.
+
+Kullanım:
+    monitor = SignalMonitor(adapter.frontend, rate_hz=20)
+    monitor.start()
+    monitor.latest()            # Son örnek (SignalSample)
+    monitor.summary(5.0)        # Son 5 saniyenin min/max/ortalaması
+    monitor.subscribe(cb, min_interval=0.1)
+
+    python3 monitor.py --simulate      # Sanal frontend ile canlı özet
+    python3 monitor.py --adapter 0     # Gerçek adaptör
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    from .frontend import FE_HAS_LOCK, FrontendBackend, SignalStats
+except ImportError:
+    from frontend import FE_HAS_LOCK, FrontendBackend, SignalStats
+
+
+# ─── Sabitler ────────────────────────────────────────────────────────────────
+
+DEFAULT_RATE_HZ = 20.0          # UI 10+ Hz ister; iki katı örnekle
+DEFAULT_HISTORY_S = 120.0       # Halka tamponu kapsamı
+ERROR_BACKOFF_S = 1.0           # Okuma hatasında bekleme (cihaz meşgul/kapalı)
+
+# Halka tamponu sütunları
+FIELDS = ("time", "snr", "signal_strength", "ber", "ucb", "status")
+_COL = {name: i for i, name in enumerate(FIELDS)}
+SUMMARY_FIELDS = ("snr", "signal_strength", "ber")
+
+
+@dataclass
+class SignalSample:
+    """Tek sinyal örneği (time: frontend saati, saniye)."""
+    time: float
+    snr: float
+    signal_strength: float
+    ber: float
+    ucb: int
+    status: int
+
+    @property
+    def locked(self) -> bool:
+        return bool(self.status & FE_HAS_LOCK)
+
+    def to_dict(self) -> dict:
+        """DVBAdapter.get_signal_stats() uyumlu sözlük."""
+        return {
+            "signal_strength": self.signal_strength,
+            "snr": self.snr,
+            "ber": self.ber,
+            "ucb": self.ucb,
+            "locked": self.locked,
+            "time": self.time,
+        }
+
+
+# ─── Halka Tamponu ───────────────────────────────────────────────────────────
+
+class SignalRing:
+    """
+    Sabit boyutlu örnek tamponu (tek yazar, çok okuyucu).
+
+    Yazar satırı doldurduktan sonra sayacı artırır; okuyucular sayacın
+    anlık değerine göre okur ve kilit almaz. Dolunca en eski örneğin
+    üzerine yazılır.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("Tampon kapasitesi en az 1 olmalı")
+        self.capacity = capacity
+        self._data = np.zeros((capacity, len(FIELDS)), dtype=np.float64)
+        self._count = 0             # Toplam yazılan örnek (taşma dahil)
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def total(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, stats: SignalStats):
+        self._data[self._count % self.capacity] = (
+            timestamp, stats.snr, stats.signal_strength, stats.ber, stats.ucb, stats.status)
+        self._count += 1
+
+    def latest(self) -> Optional[SignalSample]:
+        count = self._count
+        if not count:
+            return None
+        t, snr, strength, ber, ucb, status = self._data[(count - 1) % self.capacity]
+        return SignalSample(float(t), float(snr), float(strength), float(ber),
+                            int(ucb), int(status))
+
+    def window(self, seconds: Optional[float] = None) -> np.ndarray:
+        """Son `seconds` içindeki örnekler (kopya, eskiden yeniye; None: tümü)."""
+        count = self._count
+        size = min(count, self.capacity)
+        if not size:
+            return np.empty((0, len(FIELDS)))
+
+        # Dolu tamponda en eski örnek bir sonraki yazım konumundadır
+        start = count % self.capacity if count > self.capacity else 0
+        rows = np.roll(self._data[:size], -start, axis=0)
+        if seconds is not None:
+            newest = rows[-1, _COL["time"]]
+            rows = rows[rows[:, _COL["time"]] >= newest - seconds]
+        return rows
+
+
+# ─── İzleyici ────────────────────────────────────────────────────────────────
+
+Subscriber = Callable[[SignalSample], None]
+
+
+class SignalMonitor:
+    """
+    Tek frontend için arka plan sinyal örnekleyici.
+
+    Örnekleme iş parçacığı son tarihe göre zamanlanır (kayma birikmez) ve
+    örnekler arasında Event.wait ile uyur; örnek başına maliyet bir
+    read_stats() ioctl çağrısı ve tek satırlık dizi yazımıdır. Aboneler
+    örnekleme iş parçacığında çağrılır, hızlı dönmeleri gerekir (Qt'de
+    sinyal yayımla, kuyruğa koy vb.).
+    """
+
+    def __init__(self, frontend: FrontendBackend, rate_hz: float = DEFAULT_RATE_HZ,
+                 history_s: float = DEFAULT_HISTORY_S, name: str = "frontend"):
+        if rate_hz <= 0:
+            raise ValueError("Örnekleme hızı pozitif olmalı")
+        self.frontend = frontend
+        self.rate_hz = rate_hz
+        self.name = name
+        self.ring = SignalRing(max(1, int(rate_hz * history_s)))
+        self.errors = 0
+        self.last_error = ""
+
+        self._subscribers: dict[int, tuple[Subscriber, float, list]] = {}
+        self._next_token = 0
+        self._sub_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ─── Yaşam döngüsü ───
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "SignalMonitor":
+        if self.running:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"signal-{self.name}",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ─── Örnekleme ───
+
+    def sample_once(self) -> Optional[SignalSample]:
+        """Bir örnek al, tampona yaz ve abonelere dağıt (hata: None)."""
+        try:
+            stats = self.frontend.read_stats()
+        except OSError as e:
+            self.errors += 1
+            self.last_error = str(e)
+            return None
+        self.ring.append(self.frontend.clock(), stats)
+        sample = self.ring.latest()
+        self._notify(sample)
+        return sample
+
+    def _run(self):
+        period = 1.0 / self.rate_hz
+        deadline = time.monotonic()
+        while not self._stop.is_set():
+            if self.sample_once() is None:
+                self._stop.wait(ERROR_BACKOFF_S)
+                deadline = time.monotonic()
+                continue
+            deadline += period
+            delay = deadline - time.monotonic()
+            if delay < 0:
+                # Geride kaldıysak kaçırılan örnekleri telafi etme
+                deadline = time.monotonic()
+                delay = 0.0
+            self._stop.wait(delay)
+
+    # ─── Abonelik ───
+
+    def subscribe(self, callback: Subscriber, min_interval: float = 0.0) -> int:
+        """Her örnekte (en fazla min_interval saniyede bir) çağrıl; token döner."""
+        with self._sub_lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscribers[token] = (callback, min_interval, [float("-inf")])
+        return token
+
+    def unsubscribe(self, token: int):
+        with self._sub_lock:
+            self._subscribers.pop(token, None)
+
+    def _notify(self, sample: SignalSample):
+        with self._sub_lock:
+            subscribers = list(self._subscribers.values())
+        # Örnekleme titremesi aralığı kaçırmasın: yarım periyot tolerans
+        slack = 0.5 / self.rate_hz
+        for callback, min_interval, last in subscribers:
+            if sample.time - last[0] < min_interval - slack:
+                continue
+            last[0] = sample.time
+            try:
+                callback(sample)
+            except Exception as e:
+                print(f"⚠️  Sinyal abonesi hatası ({self.name}): {e}")
+
+    # ─── Okuma (bloklamaz) ───
+
+    def latest(self) -> Optional[SignalSample]:
+        return self.ring.latest()
+
+    def history(self, seconds: Optional[float] = None) -> np.ndarray:
+        """Pencere örnekleri, sütunlar FIELDS sırasında."""
+        return self.ring.window(seconds)
+
+    def summary(self, seconds: float = 5.0) -> dict:
+        """
+        Pencere özeti: SNR/güç/BER için min/max/ortalama, kilit oranı ve
+        penceredeki yeni düzeltilemeyen blok sayısı (UCB sayacı farkı).
+        """
+        rows = self.ring.window(seconds)
+        if not len(rows):
+            return {"samples": 0}
+
+        result = {"samples": len(rows),
+                  "span_s": float(rows[-1, _COL["time"]] - rows[0, _COL["time"]])}
+        for name in SUMMARY_FIELDS:
+            column = rows[:, _COL[name]]
+            result[name] = {"min": float(column.min()), "max": float(column.max()),
+                            "mean": float(column.mean())}
+        locked = (rows[:, _COL["status"]].astype(np.int64) & FE_HAS_LOCK) != 0
+        result["lock_ratio"] = float(locked.mean())
+        ucb = rows[:, _COL["ucb"]]
+        result["ucb_delta"] = int(max(ucb[-1] - ucb[0], 0))
+        return result
+
+
+# ─── Test ────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    import argparse
+
+    try:
+        from .frontend import FakeCarrier, FakeFrontend, IoctlFrontend
+        from .scanner import Transponder
+    except ImportError:
+        from frontend import FakeCarrier, FakeFrontend, IoctlFrontend
+        from scanner import Transponder
+
+    parser = argparse.ArgumentParser(description="APEXSAT AI - Sinyal izleyici")
+    parser.add_argument("--adapter", type=int, default=0, help="Adaptör numarası")
+    parser.add_argument("--simulate", action="store_true", help="Sanal frontend kullan")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE_HZ, help="Örnekleme hızı (Hz)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="İzleme süresi")
+    args = parser.parse_args()
+
+    if args.simulate:
+        tp = Transponder(11096, "H", 30000, "3/4", "DVB-S2", "8PSK")
+        frontend = FakeFrontend([FakeCarrier(tp.frequency, tp.polarization, tp.symbol_rate,
+                                             snr=11.5, signal_strength=72.0)])
+        frontend.tune(tp)
+    else:
+        frontend = IoctlFrontend(f"/dev/dvb/adapter{args.adapter}/frontend0")
+
+    received = []
+    with SignalMonitor(frontend, rate_hz=args.rate, name=f"adapter{args.adapter}") as monitor:
+        monitor.subscribe(received.append, min_interval=0.1)
+        end = time.monotonic() + args.seconds
+        while time.monotonic() < end:
+            time.sleep(1.0)
+            sample = monitor.latest()
+            if sample is not None:
+                print(f"📶 SNR {sample.snr:5.1f} dB  güç %{sample.signal_strength:5.1f}  "
+                      f"BER {sample.ber:.2e}  kilit {'✓' if sample.locked else '✗'}")
+
+    summary = monitor.summary(args.seconds)
+    print(f"\n{summary['samples']} örnek, {len(received)} abone bildirimi, "
+          f"{monitor.errors} hata")
+    for name in SUMMARY_FIELDS:
+        if name in summary:
+            s = summary[name]
+            print(f"   {name:16s} min {s['min']:.3g}  max {s['max']:.3g}  ort {s['mean']:.3g}")
+    frontend.close()
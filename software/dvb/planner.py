@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+APEXSAT AI - Tarama Planlayıcı
+
+Transponder'ları (uydu/DiSEqC portu, band, polarizasyon) gruplarına ayırır,
+grupları her geçişte tek bir LNB parametresi değişecek şekilde sıralar ve
+grup içinde frekansa göre dizer. Böylece LNB voltaj (13/18V), 22kHz tone ve
+DiSEqC geçişleri en aza iner.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+
+# Geçiş başına yaklaşık oturma süreleri (saniye)
+SWITCH_COSTS = {
+    "voltage": 0.05,    # LNB 13V ↔ 18V + LNB oturma
+    "tone": 0.02,       # 22kHz tone aç/kapa
+    "diseqc": 0.15,     # DiSEqC komutu + switch oturma
+}
+
+# Port içinde grup sırası: her adımda tek parametre değişir
+# (low/V → low/H → high/H → high/V)
+_GROUP_ORDER = [(False, 13), (False, 18), (True, 18), (True, 13)]
+
+
+@dataclass
+class PlanItem:
+    """Plandaki tek tarama işi."""
+    transponder: object             # Transponder
+    satellite: str = "turksat"
+    diseqc_port: int = 0
+
+    @property
+    def lnb_state(self) -> tuple[int, bool, int]:
+        """(DiSEqC port, tone, voltaj)"""
+        return (self.diseqc_port, self.transponder.tone, self.transponder.voltage)
+
+
+@dataclass
+class ScanGroup:
+    """Aynı LNB durumunda taranan iş grubu."""
+    satellite: str
+    diseqc_port: int
+    high_band: bool
+    voltage: int
+    items: list = field(default_factory=list)
+
+
+@dataclass
+class SwitchingCost:
+    """Bir plan için tahmini geçiş sayıları ve süre."""
+    voltage_switches: int = 0
+    tone_switches: int = 0
+    diseqc_switches: int = 0
+    seconds: float = 0.0
+
+
+def estimate_switching_cost(items: Iterable[PlanItem],
+                            initial_state: Optional[tuple] = None,
+                            costs: dict = SWITCH_COSTS) -> SwitchingCost:
+    """Sıralı iş listesi için LNB/DiSEqC geçiş maliyetini hesapla."""
+    cost = SwitchingCost()
+    state = initial_state
+
+    for item in items:
+        new_state = item.lnb_state
+        if state is None:
+            # İlk iş: her şey bir kez ayarlanır
+            cost.diseqc_switches += 1
+            cost.voltage_switches += 1
+            cost.tone_switches += 1
+        else:
+            if new_state[0] != state[0]:
+                cost.diseqc_switches += 1
+            if new_state[1] != state[1]:
+                cost.tone_switches += 1
+            if new_state[2] != state[2]:
+                cost.voltage_switches += 1
+        state = new_state
+
+    cost.seconds = (cost.voltage_switches * costs["voltage"]
+                    + cost.tone_switches * costs["tone"]
+                    + cost.diseqc_switches * costs["diseqc"])
+    return cost
+
+
+class ScanPlan:
+    """Sıralı tarama planı (scan_turksat / blind_scan tarafından tüketilir)."""
+
+    def __init__(self, groups: list[ScanGroup], costs: dict = SWITCH_COSTS):
+        self.groups = groups
+        self.costs = costs
+
+    @property
+    def items(self) -> list[PlanItem]:
+        return [item for group in self.groups for item in group.items]
+
+    @property
+    def transponders(self) -> list:
+        return [item.transponder for item in self.items]
+
+    def __iter__(self) -> Iterator[PlanItem]:
+        for group in self.groups:
+            yield from group.items
+
+    def __len__(self) -> int:
+        return sum(len(group.items) for group in self.groups)
+
+    def switching_cost(self) -> SwitchingCost:
+        return estimate_switching_cost(self, costs=self.costs)
+
+    def describe(self) -> str:
+        lines = []
+        for g in self.groups:
+            band = "High" if g.high_band else "Low"
+            pol = "H" if g.voltage == 18 else "V"
+            lines.append(f"{g.satellite} port {g.diseqc_port + 1} {band}/{pol}: "
+                         f"{len(g.items)} transponder")
+        return "\n".join(lines)
+
+
+class ScanPlanner:
+    """Transponder listesinden geçiş maliyeti düşük tarama planı üretir."""
+
+    def __init__(self, costs: dict = SWITCH_COSTS):
+        self.costs = costs
+
+    def plan(self, transponders: Iterable, satellite: str = "turksat",
+             diseqc_port: int = 0) -> ScanPlan:
+        """Tek uydu/port için plan."""
+        return self.plan_items(PlanItem(tp, satellite, diseqc_port) for tp in transponders)
+
+    def plan_items(self, items: Iterable[PlanItem]) -> ScanPlan:
+        """Birden fazla uydu/port içeren iş listesi için plan."""
+        buckets: dict[tuple, ScanGroup] = {}
+        port_order: list[tuple[str, int]] = []
+
+        for item in items:
+            tp = item.transponder
+            key = (item.satellite, item.diseqc_port, tp.tone, tp.voltage)
+            group = buckets.get(key)
+            if group is None:
+                group = ScanGroup(item.satellite, item.diseqc_port, tp.tone, tp.voltage)
+                buckets[key] = group
+                if (item.satellite, item.diseqc_port) not in port_order:
+                    port_order.append((item.satellite, item.diseqc_port))
+            group.items.append(item)
+
+        groups = []
+        for satellite, port in port_order:
+            for high_band, voltage in _GROUP_ORDER:
+                group = buckets.get((satellite, port, high_band, voltage))
+                if group:
+                    group.items.sort(key=lambda i: i.transponder.frequency)
+                    groups.append(group)
+
+        return ScanPlan(groups, self.costs)
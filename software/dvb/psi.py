@@ -0,0 +1,953 @@
+#!/usr/bin/env python3
+"""
+APEXSAT AI - MPEG-TS PSI/SI Section Parser
+
+PAT, PMT, SDT ve NIT tablolarını demux cihazından veya herhangi bir TS bayt
+akışından okuyup CRC32 doğrulamasıyla birleştirir. Kilitlenilen transponder
+için servis listesi (PID'ler, servis tipi, sağlayıcı, CA durumu) tek seferde
+çıkarılır; dvbv5-scan çalıştırılmaz.
+
+ISO/IEC 13818-1 (PSI) ve ETSI EN 300 468 (SI) standartlarına uygun.
+"""
+
+import io
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+
+# ─── Sabitler ────────────────────────────────────────────────────────────────
+
+TS_PACKET_SIZE = 188
+TS_SYNC_BYTE = 0x47
+
+PID_PAT = 0x0000
+PID_NIT = 0x0010
+PID_SDT = 0x0011
+PID_EIT = 0x0012
+
+TABLE_PAT = 0x00
+TABLE_PMT = 0x02
+TABLE_NIT_ACTUAL = 0x40
+TABLE_NIT_OTHER = 0x41
+TABLE_SDT_ACTUAL = 0x42
+
+# PSI toplama zaman aşımları (saniye) - tablo tekrar aralıklarına göre
+PSI_TIMEOUT = 3.0           # PAT+PMT+SDT (SDT ≤ 2s tekrar)
+NIT_TIMEOUT = 10.0          # NIT ≤ 10s tekrar
+
+# Servis tipleri (EN 300 468 Tablo 87)
+TV_SERVICE_TYPES = {0x01, 0x11, 0x16, 0x19, 0x1F, 0x20}
+HD_SERVICE_TYPES = {0x11, 0x19, 0x1F, 0x20}
+RADIO_SERVICE_TYPES = {0x02, 0x07, 0x0A}
+
+VIDEO_STREAM_TYPES = {
+    0x01: "mpeg2", 0x02: "mpeg2", 0x10: "mpeg4",
+    0x1B: "h264", 0x24: "h265",
+}
+AUDIO_STREAM_TYPES = {
+    0x03: "mp2", 0x04: "mp2", 0x0F: "aac", 0x11: "aac",
+    0x81: "ac3", 0x87: "eac3",
+}
+# PES private data (0x06) içindeki ses descriptor'ları
+PRIVATE_AUDIO_DESCRIPTORS = {0x6A: "ac3", 0x7A: "eac3", 0x7B: "dts", 0x7C: "aac"}
+
+DESC_CA = 0x09
+DESC_NETWORK_NAME = 0x40
+DESC_SATELLITE_DELIVERY = 0x43
+DESC_SERVICE = 0x48
+
+# Uydu teslim sistemi descriptor'ı (EN 300 468 6.2.13.2)
+DELIVERY_POLARIZATIONS = ("H", "V", "L", "R")
+DELIVERY_MODULATIONS = {0: "AUTO", 1: "QPSK", 2: "8PSK", 3: "16APSK"}
+DELIVERY_FEC = {
+    1: "1/2", 2: "2/3", 3: "3/4", 4: "5/6", 5: "7/8",
+    6: "8/9", 7: "3/5", 8: "4/5", 9: "9/10",
+}
+DELIVERY_ROLLOFFS = (0.35, 0.25, 0.20)
+
+
+# ─── CRC32 (MPEG-2) ──────────────────────────────────────────────────────────
+
+def _make_crc_table() -> list[int]:
+    table = []
+    for i in range(256):
+        crc = i << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else (crc << 1)
+        table.append(crc & 0xFFFFFFFF)
+    return table
+
+
+_CRC_TABLE = _make_crc_table()
+
+
+def crc32_mpeg(data: bytes) -> int:
+    """CRC-32/MPEG-2 (polinom 0x04C11DB7, yansıtmasız, başlangıç 0xFFFFFFFF)."""
+    crc = 0xFFFFFFFF
+    table = _CRC_TABLE
+    for b in data:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ table[(crc >> 24) ^ b]
+    return crc
+
+
+# ─── DVB Metin ───────────────────────────────────────────────────────────────
+
+_CHARSETS = {
+    0x01: "iso-8859-5", 0x02: "iso-8859-6", 0x03: "iso-8859-7",
+    0x04: "iso-8859-8", 0x05: "iso-8859-9", 0x06: "iso-8859-10",
+    0x07: "iso-8859-11", 0x09: "iso-8859-13", 0x0A: "iso-8859-14",
+    0x0B: "iso-8859-15", 0x11: "utf-16-be", 0x15: "utf-8",
+}
+
+
+def decode_dvb_text(data: bytes, default: str = "iso-8859-9") -> str:
+    """EN 300 468 Ek A metin kodlamasını çöz (Türksat varsayılanı Latin-5)."""
+    if not data:
+        return ""
+    encoding = default
+    if data[0] < 0x20:
+        if data[0] == 0x10 and len(data) >= 3:
+            encoding = f"iso-8859-{(data[1] << 8) | data[2]}"
+            data = data[3:]
+        else:
+            encoding = _CHARSETS.get(data[0], default)
+            data = data[1:]
+    try:
+        text = data.decode(encoding, errors="replace")
+    except LookupError:
+        text = data.decode(default, errors="replace")
+    # DVB kontrol kodları (0x80-0x9F: vurgu, satır sonu)
+    return "".join(ch for ch in text if not 0x80 <= ord(ch) <= 0x9F).strip()
+
+
+def encode_dvb_text(text: str) -> bytes:
+    """Metni DVB kodlamasına çevir (ASCII → ham, Türkçe → Latin-5, diğer → UTF-8)."""
+    try:
+        return text.encode("ascii")
+    except UnicodeEncodeError:
+        pass
+    try:
+        return b"\x05" + text.encode("iso-8859-9")
+    except UnicodeEncodeError:
+        return b"\x15" + text.encode("utf-8")
+
+
+def _bcd(data: bytes) -> int:
+    value = 0
+    for b in data:
+        value = value * 100 + (b >> 4) * 10 + (b & 0x0F)
+    return value
+
+
+def _to_bcd(value: int, digits: int) -> bytes:
+    text = f"{value:0{digits}d}"
+    return bytes(int(text[i:i + 2], 16) for i in range(0, digits, 2))
+
+
+def iter_descriptors(data: bytes) -> Iterator[tuple[int, bytes]]:
+    """Descriptor döngüsünü (tag, içerik) olarak gez."""
+    offset = 0
+    end = len(data)
+    while offset + 2 <= end:
+        tag = data[offset]
+        length = data[offset + 1]
+        yield tag, data[offset + 2:offset + 2 + length]
+        offset += 2 + length
+
+
+# ─── Section Başlığı ─────────────────────────────────────────────────────────
+
+@dataclass
+class Section:
+    """Uzun formatlı PSI/SI section."""
+    table_id: int
+    table_id_extension: int
+    version: int
+    current_next: bool
+    section_number: int
+    last_section_number: int
+    data: bytes                 # Tüm section (CRC dahil)
+
+    @property
+    def payload(self) -> bytes:
+        """Başlık (8 bayt) ve CRC (4 bayt) hariç içerik."""
+        return self.data[8:-4]
+
+
+def parse_section(data: bytes, check_crc: bool = True) -> Optional[Section]:
+    """Section başlığını çöz; bozuk/CRC hatalı section için None."""
+    if len(data) < 12:
+        return None
+    length = (((data[1] & 0x0F) << 8) | data[2]) + 3
+    if length > len(data) or length < 12 or not data[1] & 0x80:
+        return None
+    data = bytes(data[:length])
+    if check_crc and crc32_mpeg(data) != 0:
+        return None
+    return Section(
+        table_id=data[0],
+        table_id_extension=(data[3] << 8) | data[4],
+        version=(data[5] >> 1) & 0x1F,
+        current_next=bool(data[5] & 0x01),
+        section_number=data[6],
+        last_section_number=data[7],
+        data=data,
+    )
+
+
+# ─── Tablolar ────────────────────────────────────────────────────────────────
+
+@dataclass
+class PATable:
+    transport_stream_id: int
+    version: int
+    programs: dict = field(default_factory=dict)     # program_number → PMT PID
+    network_pid: int = PID_NIT
+
+
+@dataclass
+class ElementaryStream:
+    stream_type: int
+    pid: int
+    codec: str = ""
+    kind: str = ""              # video, audio, subtitle, teletext, data
+    scrambled: bool = False
+
+
+@dataclass
+class PMTable:
+    program_number: int
+    version: int
+    pcr_pid: int
+    streams: list = field(default_factory=list)
+    scrambled: bool = False
+
+
+@dataclass
+class ServiceDescription:
+    service_id: int
+    service_type: int = 0
+    provider: str = ""
+    name: str = ""
+    free_ca_mode: bool = False
+    running_status: int = 0
+
+
+@dataclass
+class SDTable:
+    transport_stream_id: int
+    original_network_id: int
+    version: int
+    services: dict = field(default_factory=dict)     # service_id → ServiceDescription
+
+
+@dataclass
+class SatelliteDelivery:
+    """Uydu teslim sistemi descriptor'ı (0x43)."""
+    frequency: int              # MHz
+    orbital_position: float     # derece
+    east: bool
+    polarization: str           # H, V, L, R
+    symbol_rate: int            # ksps
+    fec: str                    # 3/4, 5/6, ... veya AUTO
+    system: str                 # DVB-S, DVB-S2
+    modulation: str             # QPSK, 8PSK, 16APSK
+    rolloff: float = 0.35
+
+    @property
+    def longitude(self) -> float:
+        """İşaretli yörünge konumu (Doğu pozitif, Batı negatif)."""
+        return self.orbital_position if self.east else -self.orbital_position
+
+
+def parse_satellite_delivery(body: bytes) -> Optional[SatelliteDelivery]:
+    if len(body) < 11:
+        return None
+    flags = body[6]
+    s2 = bool(flags & 0x04)
+    sr_bcd = (_bcd(body[7:10]) * 10) + (body[10] >> 4)     # 7 hane, 100 sps birimi
+    return SatelliteDelivery(
+        frequency=round(_bcd(body[0:4]) / 100),             # 10 kHz → MHz
+        orbital_position=_bcd(body[4:6]) / 10,
+        east=bool(flags & 0x80),
+        polarization=DELIVERY_POLARIZATIONS[(flags >> 5) & 0x03],
+        symbol_rate=round(sr_bcd / 10),
+        fec=DELIVERY_FEC.get(body[10] & 0x0F, "AUTO"),
+        system="DVB-S2" if s2 else "DVB-S",
+        modulation=DELIVERY_MODULATIONS[flags & 0x03],
+        rolloff=DELIVERY_ROLLOFFS[(flags >> 3) & 0x03] if s2 and (flags >> 3) & 0x03 < 3 else 0.35,
+    )
+
+
+@dataclass
+class TransportStreamEntry:
+    transport_stream_id: int
+    original_network_id: int
+    descriptors: list = field(default_factory=list)  # (tag, içerik)
+
+    @property
+    def delivery(self) -> Optional[SatelliteDelivery]:
+        for tag, body in self.descriptors:
+            if tag == DESC_SATELLITE_DELIVERY:
+                return parse_satellite_delivery(body)
+        return None
+
+
+@dataclass
+class NITable:
+    network_id: int
+    version: int
+    network_name: str = ""
+    transports: list = field(default_factory=list)
+
+
+def parse_pat(sections: list[Section]) -> PATable:
+    first = sections[0]
+    pat = PATable(first.table_id_extension, first.version)
+    for s in sections:
+        p = s.payload
+        for i in range(0, len(p) - 3, 4):
+            number = (p[i] << 8) | p[i + 1]
+            pid = ((p[i + 2] & 0x1F) << 8) | p[i + 3]
+            if number == 0:
+                pat.network_pid = pid
+            else:
+                pat.programs[number] = pid
+    return pat
+
+
+def _classify_stream(stream_type: int, descriptors: list) -> tuple[str, str]:
+    if stream_type in VIDEO_STREAM_TYPES:
+        return "video", VIDEO_STREAM_TYPES[stream_type]
+    if stream_type in AUDIO_STREAM_TYPES:
+        return "audio", AUDIO_STREAM_TYPES[stream_type]
+    if stream_type == 0x06:
+        for tag, _ in descriptors:
+            if tag in PRIVATE_AUDIO_DESCRIPTORS:
+                return "audio", PRIVATE_AUDIO_DESCRIPTORS[tag]
+            if tag == 0x59:
+                return "subtitle", "dvbsub"
+            if tag == 0x56:
+                return "teletext", "teletext"
+    return "data", ""
+
+
+def parse_pmt(section: Section) -> PMTable:
+    d = section.data
+    pmt = PMTable(
+        program_number=section.table_id_extension,
+        version=section.version,
+        pcr_pid=((d[8] & 0x1F) << 8) | d[9],
+    )
+    info_len = ((d[10] & 0x0F) << 8) | d[11]
+    offset = 12
+    pmt.scrambled = any(tag == DESC_CA for tag, _ in iter_descriptors(d[offset:offset + info_len]))
+    offset += info_len
+
+    end = len(d) - 4
+    while offset + 5 <= end:
+        stream_type = d[offset]
+        pid = ((d[offset + 1] & 0x1F) << 8) | d[offset + 2]
+        es_len = ((d[offset + 3] & 0x0F) << 8) | d[offset + 4]
+        descriptors = list(iter_descriptors(d[offset + 5:offset + 5 + es_len]))
+        kind, codec = _classify_stream(stream_type, descriptors)
+        pmt.streams.append(ElementaryStream(
+            stream_type, pid, codec, kind,
+            scrambled=any(tag == DESC_CA for tag, _ in descriptors),
+        ))
+        offset += 5 + es_len
+    return pmt
+
+
+def parse_sdt(sections: list[Section]) -> SDTable:
+    first = sections[0]
+    d0 = first.data
+    sdt = SDTable(first.table_id_extension, (d0[8] << 8) | d0[9], first.version)
+    for s in sections:
+        d = s.data
+        offset = 11
+        end = len(d) - 4
+        while offset + 5 <= end:
+            sid = (d[offset] << 8) | d[offset + 1]
+            flags = (d[offset + 3] << 8) | d[offset + 4]
+            loop_len = flags & 0x0FFF
+            svc = ServiceDescription(
+                service_id=sid,
+                running_status=flags >> 13,
+                free_ca_mode=bool(flags & 0x1000),
+            )
+            for tag, body in iter_descriptors(d[offset + 5:offset + 5 + loop_len]):
+                if tag == DESC_SERVICE and len(body) >= 2:
+                    svc.service_type = body[0]
+                    plen = body[1]
+                    svc.provider = decode_dvb_text(body[2:2 + plen])
+                    if 2 + plen < len(body):
+                        nlen = body[2 + plen]
+                        svc.name = decode_dvb_text(body[3 + plen:3 + plen + nlen])
+            sdt.services[sid] = svc
+            offset += 5 + loop_len
+    return sdt
+
+
+def parse_nit(sections: list[Section]) -> NITable:
+    first = sections[0]
+    nit = NITable(first.table_id_extension, first.version)
+    for s in sections:
+        d = s.data
+        net_len = ((d[8] & 0x0F) << 8) | d[9]
+        for tag, body in iter_descriptors(d[10:10 + net_len]):
+            if tag == DESC_NETWORK_NAME:
+                nit.network_name = decode_dvb_text(body)
+        offset = 10 + net_len
+        ts_loop_len = ((d[offset] & 0x0F) << 8) | d[offset + 1]
+        offset += 2
+        end = min(offset + ts_loop_len, len(d) - 4)
+        while offset + 6 <= end:
+            tsid = (d[offset] << 8) | d[offset + 1]
+            onid = (d[offset + 2] << 8) | d[offset + 3]
+            td_len = ((d[offset + 4] & 0x0F) << 8) | d[offset + 5]
+            nit.transports.append(TransportStreamEntry(
+                tsid, onid, list(iter_descriptors(d[offset + 6:offset + 6 + td_len]))
+            ))
+            offset += 6 + td_len
+    return nit
+
+
+# ─── TS → Section Birleştirme ────────────────────────────────────────────────
+
+class SectionAssembler:
+    """Tek PID'in TS paketlerinden section'ları birleştirir."""
+
+    def __init__(self):
+        self._buf: Optional[bytearray] = None
+        self._cc = -1
+
+    def push(self, payload: bytes, unit_start: bool, cc: int) -> list[bytes]:
+        if self._cc >= 0 and cc == self._cc:
+            return []                               # Tekrarlanan paket
+        if self._cc >= 0 and cc != (self._cc + 1) & 0x0F:
+            self._buf = None                        # Süreklilik hatası
+        self._cc = cc
+
+        sections = []
+        if unit_start:
+            pointer = payload[0] if payload else 0
+            if self._buf is not None:
+                self._buf += payload[1:1 + pointer]
+                sections.extend(self._drain())
+            self._buf = bytearray(payload[1 + pointer:])
+        elif self._buf is not None:
+            self._buf += payload
+        else:
+            return sections
+
+        sections.extend(self._drain())
+        return sections
+
+    def _drain(self) -> list[bytes]:
+        out = []
+        buf = self._buf
+        while buf is not None and len(buf) >= 3:
+            if buf[0] == 0xFF:                      # Dolgu
+                buf = None
+                break
+            length = (((buf[1] & 0x0F) << 8) | buf[2]) + 3
+            if len(buf) < length:
+                break
+            out.append(bytes(buf[:length]))
+            buf = buf[length:]
+        self._buf = buf if buf else None
+        return out
+
+
+def _find_sync(data: bytes, offset: int) -> int:
+    """Ardışık iki paket başında 0x47 olan ilk konum (sahte sync'e karşı)."""
+    while True:
+        offset = data.find(b"\x47", offset)
+        if offset < 0:
+            return len(data)
+        nxt = offset + TS_PACKET_SIZE
+        if nxt >= len(data) or data[nxt] == TS_SYNC_BYTE:
+            return offset
+        offset += 1
+
+
+class SectionSource(ABC):
+    """
+    Section kaynağı (demux cihazı, TS dosyası, bellek).
+
+    sections() için verilen filters sözlüğü (PID → table_id veya
+    (table_id, maske)) iterasyon sırasında genişletilebilir; kaynak yeni
+    PID'leri bir sonraki adımda dinlemeye başlar (ör. PAT okunduktan sonra
+    PMT PID'leri).
+    """
+
+    crc_checked = False         # True ise kaynak CRC'yi zaten doğrulamış
+
+    @abstractmethod
+    def sections(self, filters: dict, timeout: float) -> Iterator[tuple[int, bytes]]:
+        """(PID, section) üret."""
+
+    def close(self):
+        pass
+
+
+def table_filter(value) -> tuple[int, int]:
+    """Filtre değerini (table_id, maske) biçimine çevir."""
+    if isinstance(value, tuple):
+        return value
+    return value, 0xFF
+
+
+class TSSectionSource(SectionSource):
+    """
+    TS bayt akışından section kaynağı.
+
+    Aranabilir akışlarda dosya sonunda başa dönülür (tablo karuseli); tek
+    çağrıda en fazla bir tam tur okunur.
+    """
+
+    CHUNK_PACKETS = 2048
+
+    def __init__(self, stream, loop: bool = True):
+        self.stream = stream
+        self.loop = loop
+        self._size = None
+        if loop and stream.seekable():
+            pos = stream.tell()
+            self._size = stream.seek(0, io.SEEK_END)
+            stream.seek(pos)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TSSectionSource":
+        return cls(io.BytesIO(data))
+
+    def sections(self, filters: dict, timeout: float = PSI_TIMEOUT) -> Iterator[tuple[int, bytes]]:
+        assemblers: dict[int, SectionAssembler] = {}
+        deadline = time.monotonic() + timeout
+        budget = (self._size or 0) + TS_PACKET_SIZE * self.CHUNK_PACKETS
+        consumed = 0
+        pending = b""
+
+        while True:
+            chunk = self.stream.read(TS_PACKET_SIZE * self.CHUNK_PACKETS)
+            if not chunk:
+                if self._size and consumed < budget:
+                    self.stream.seek(0)
+                    pending = b""
+                    assemblers.clear()
+                    continue
+                return
+            consumed += len(chunk)
+            data = pending + chunk
+
+            offset = _find_sync(data, 0)
+            end = len(data) - TS_PACKET_SIZE
+            while offset <= end:
+                if data[offset] != TS_SYNC_BYTE:
+                    offset = _find_sync(data, offset + 1)
+                    continue
+                b1 = data[offset + 1]
+                pid = ((b1 & 0x1F) << 8) | data[offset + 2]
+                table_id = filters.get(pid)
+                if table_id is None or b1 & 0x80:   # İstenmeyen PID / TEI
+                    offset += TS_PACKET_SIZE
+                    continue
+
+                b3 = data[offset + 3]
+                afc = (b3 >> 4) & 0x03
+                start = offset + 4
+                if afc & 0x02:
+                    start += 1 + data[offset + 4]
+                if afc & 0x01 and start < offset + TS_PACKET_SIZE:
+                    asm = assemblers.get(pid)
+                    if asm is None:
+                        asm = assemblers[pid] = SectionAssembler()
+                    sections = asm.push(data[start:offset + TS_PACKET_SIZE],
+                                        bool(b1 & 0x40), b3 & 0x0F)
+                    if sections:
+                        tid, mask = table_filter(table_id)
+                        for section in sections:
+                            if section[0] & mask == tid:
+                                yield pid, section
+                offset += TS_PACKET_SIZE
+
+            pending = data[offset:]
+            if consumed >= budget or time.monotonic() > deadline:
+                return
+
+    def close(self):
+        self.stream.close()
+
+
+# ─── Mux Tarama ──────────────────────────────────────────────────────────────
+
+@dataclass
+class ServiceInfo:
+    """PSI/SI'dan çıkarılan servis (Channel alanlarıyla aynı adlar)."""
+    service_id: int
+    name: str = ""
+    provider: str = ""
+    service_type: int = 0
+    pmt_pid: int = 0
+    pcr_pid: int = 0
+    video_pid: int = 0
+    audio_pid: int = 0
+    video_codec: str = ""
+    audio_codec: str = ""
+    scrambled: bool = False
+    streams: list = field(default_factory=list)
+
+    @property
+    def channel_type(self) -> str:
+        if self.service_type in TV_SERVICE_TYPES or (not self.service_type and self.video_pid):
+            return "TV"
+        if self.service_type in RADIO_SERVICE_TYPES or (not self.service_type and self.audio_pid):
+            return "Radio"
+        return "Data"
+
+    @property
+    def is_hd(self) -> bool:
+        return self.service_type in HD_SERVICE_TYPES or self.video_codec == "h265"
+
+    @property
+    def is_free(self) -> bool:
+        return not self.scrambled
+
+
+@dataclass
+class MuxInfo:
+    """Kilitlenilen transponder'ın PSI/SI özeti."""
+    transport_stream_id: int = 0
+    original_network_id: int = 0
+    pat_version: Optional[int] = None
+    sdt_version: Optional[int] = None
+    nit: Optional[NITable] = None
+    services: list = field(default_factory=list)
+    sections_read: int = 0
+    crc_errors: int = 0
+
+    @property
+    def versions(self) -> tuple:
+        """Artımlı tarama karşılaştırma anahtarı: (TSID, PAT sürümü, SDT sürümü)."""
+        return (self.transport_stream_id, self.pat_version, self.sdt_version)
+
+
+class _TableCollector:
+    """Section numaralarına göre tablonun tamamlanmasını izler."""
+
+    def __init__(self):
+        self.version = None
+        self.sections: dict[int, Section] = {}
+        self.last = None
+
+    def add(self, section: Section) -> bool:
+        """Section'ı ekle; tablo tamamlandıysa True."""
+        if self.version is not None and section.version != self.version:
+            self.sections.clear()                   # Sürüm değişti, baştan topla
+        self.version = section.version
+        self.last = section.last_section_number
+        self.sections[section.section_number] = section
+        return self.complete
+
+    @property
+    def complete(self) -> bool:
+        return self.last is not None and len(self.sections) == self.last + 1
+
+    def ordered(self) -> list[Section]:
+        return [self.sections[n] for n in sorted(self.sections)]
+
+
+class PSIScanner:
+    """Tek kilitte PAT + PMT + SDT (+ NIT) okuyup servis listesi çıkarır."""
+
+    def scan(self, source: SectionSource, timeout: float = PSI_TIMEOUT,
+             want_nit: bool = False, want_pmt: bool = True) -> MuxInfo:
+        mux = MuxInfo()
+        filters = {PID_PAT: TABLE_PAT, PID_SDT: TABLE_SDT_ACTUAL}
+        if want_nit:
+            filters[PID_NIT] = TABLE_NIT_ACTUAL
+            timeout = max(timeout, NIT_TIMEOUT)
+
+        pat = sdt = nit = None
+        pat_c, sdt_c, nit_c = _TableCollector(), _TableCollector(), _TableCollector()
+        pmt_pids: dict[int, set] = {}               # PMT PID → bekleyen program numaraları
+        pmts: dict[int, PMTable] = {}
+
+        for pid, raw in source.sections(filters, timeout):
+            mux.sections_read += 1
+            section = parse_section(raw, check_crc=not source.crc_checked)
+            if section is None:
+                mux.crc_errors += 1
+                continue
+            if not section.current_next:
+                continue
+
+            if pid == PID_PAT and pat is None:
+                if pat_c.add(section):
+                    pat = parse_pat(pat_c.ordered())
+                    if want_nit and pat.network_pid != PID_NIT:
+                        filters.pop(PID_NIT, None)
+                        filters[pat.network_pid] = TABLE_NIT_ACTUAL
+                    if want_pmt:
+                        for number, pmt_pid in pat.programs.items():
+                            pmt_pids.setdefault(pmt_pid, set()).add(number)
+                            filters[pmt_pid] = TABLE_PMT
+            elif pid == PID_SDT and sdt is None:
+                if section.table_id_extension == (pat.transport_stream_id if pat else section.table_id_extension):
+                    if sdt_c.add(section):
+                        sdt = parse_sdt(sdt_c.ordered())
+                        filters.pop(PID_SDT, None)
+            elif want_nit and nit is None and section.table_id == TABLE_NIT_ACTUAL:
+                if nit_c.add(section):
+                    nit = parse_nit(nit_c.ordered())
+                    filters.pop(pid, None)
+            elif pid in pmt_pids and section.table_id == TABLE_PMT:
+                number = section.table_id_extension
+                if number in pmt_pids[pid] and number not in pmts:
+                    pmts[number] = parse_pmt(section)
+                    pmt_pids[pid].discard(number)
+                    if not pmt_pids[pid]:
+                        filters.pop(pid, None)
+
+            if (pat is not None and sdt is not None
+                    and (not want_nit or nit is not None)
+                    and all(not pending for pending in pmt_pids.values())):
+                break
+
+        if pat is not None:
+            mux.transport_stream_id = pat.transport_stream_id
+            mux.pat_version = pat.version
+        if sdt is not None:
+            mux.original_network_id = sdt.original_network_id
+            mux.sdt_version = sdt.version
+        mux.nit = nit
+        mux.services = self._merge(pat, pmts, sdt)
+        return mux
+
+    def read_versions(self, source: SectionSource, timeout: float = PSI_TIMEOUT) -> MuxInfo:
+        """
+        Sadece PAT ve SDT sürüm numaralarını oku (artımlı tarama).
+
+        Her tablonun ilk geçerli section'ı yeterlidir; PMT'ler okunmaz.
+        """
+        mux = MuxInfo()
+        filters = {PID_PAT: TABLE_PAT, PID_SDT: TABLE_SDT_ACTUAL}
+        for pid, raw in source.sections(filters, timeout):
+            mux.sections_read += 1
+            section = parse_section(raw, check_crc=not source.crc_checked)
+            if section is None:
+                mux.crc_errors += 1
+                continue
+            if not section.current_next or pid not in filters:
+                continue
+            if pid == PID_PAT:
+                mux.transport_stream_id = section.table_id_extension
+                mux.pat_version = section.version
+            else:
+                mux.original_network_id = (section.data[8] << 8) | section.data[9]
+                mux.sdt_version = section.version
+            del filters[pid]
+            if not filters:
+                break
+        return mux
+
+    def _merge(self, pat: Optional[PATable], pmts: dict, sdt: Optional[SDTable]) -> list[ServiceInfo]:
+        """PAT/PMT/SDT bilgilerini servis listesinde birleştir."""
+        services = []
+        program_ids = list(pat.programs) if pat else list(sdt.services if sdt else [])
+
+        for sid in program_ids:
+            svc = ServiceInfo(service_id=sid, pmt_pid=pat.programs.get(sid, 0) if pat else 0)
+
+            desc = sdt.services.get(sid) if sdt else None
+            if desc is not None:
+                svc.name = desc.name
+                svc.provider = desc.provider
+                svc.service_type = desc.service_type
+                svc.scrambled = desc.free_ca_mode
+
+            pmt = pmts.get(sid)
+            if pmt is not None:
+                svc.pcr_pid = pmt.pcr_pid
+                svc.streams = pmt.streams
+                svc.scrambled = svc.scrambled or pmt.scrambled or any(s.scrambled for s in pmt.streams)
+                for es in pmt.streams:
+                    if es.kind == "video" and not svc.video_pid:
+                        svc.video_pid, svc.video_codec = es.pid, es.codec
+                    elif es.kind == "audio" and not svc.audio_pid:
+                        svc.audio_pid, svc.audio_codec = es.pid, es.codec
+
+            if not svc.name:
+                svc.name = f"Servis_{sid}"
+            services.append(svc)
+
+        return services
+
+
+# ─── Sentetik Mux Üretimi (test/simülasyon) ──────────────────────────────────
+
+def build_section(table_id: int, table_id_extension: int, payload: bytes,
+                  version: int = 0, section_number: int = 0,
+                  last_section_number: int = 0) -> bytes:
+    """Uzun formatlı section üret (CRC32 dahil)."""
+    length = 5 + len(payload) + 4
+    private = 0x70 if table_id >= 0x40 else 0x30    # SI: reserved_future_use=1
+    header = bytes([
+        table_id,
+        0x80 | private | ((length >> 8) & 0x0F), length & 0xFF,
+        (table_id_extension >> 8) & 0xFF, table_id_extension & 0xFF,
+        0xC1 | ((version & 0x1F) << 1),
+        section_number, last_section_number,
+    ])
+    body = header + payload
+    return body + crc32_mpeg(body).to_bytes(4, "big")
+
+
+def build_pat(tsid: int, programs: dict, network_pid: int = PID_NIT, version: int = 0) -> bytes:
+    payload = bytearray([0x00, 0x00, 0xE0 | (network_pid >> 8), network_pid & 0xFF])
+    for number, pid in sorted(programs.items()):
+        payload += bytes([number >> 8, number & 0xFF, 0xE0 | (pid >> 8), pid & 0xFF])
+    return build_section(TABLE_PAT, tsid, bytes(payload), version)
+
+
+def build_pmt(program_number: int, pcr_pid: int, streams: list[tuple[int, int, bytes]],
+              program_info: bytes = b"", version: int = 0) -> bytes:
+    payload = bytearray([0xE0 | (pcr_pid >> 8), pcr_pid & 0xFF,
+                         0xF0 | (len(program_info) >> 8), len(program_info) & 0xFF])
+    payload += program_info
+    for stream_type, pid, descriptors in streams:
+        payload += bytes([stream_type, 0xE0 | (pid >> 8), pid & 0xFF,
+                          0xF0 | (len(descriptors) >> 8), len(descriptors) & 0xFF])
+        payload += descriptors
+    return build_section(TABLE_PMT, program_number, bytes(payload), version)
+
+
+def _sdt_service_entry(sid: int, service_type: int, provider: str, name: str,
+                       free_ca: bool) -> bytes:
+    prov = encode_dvb_text(provider)
+    nm = encode_dvb_text(name)
+    desc = bytes([DESC_SERVICE, 3 + len(prov) + len(nm), service_type, len(prov)]) + prov + bytes([len(nm)]) + nm
+    flags = (4 << 13) | (0x1000 if free_ca else 0) | len(desc)      # running
+    return bytes([sid >> 8, sid & 0xFF, 0xFC, flags >> 8, flags & 0xFF]) + desc
+
+
+def build_sdt(tsid: int, onid: int, services: list[tuple], version: int = 0) -> list[bytes]:
+    """services: (sid, service_type, provider, name, free_ca) listesi."""
+    entries = [_sdt_service_entry(*svc) for svc in services]
+    chunks, current = [], b""
+    for entry in entries:
+        if len(current) + len(entry) > 1000:
+            chunks.append(current)
+            current = b""
+        current += entry
+    chunks.append(current)
+
+    prefix = bytes([onid >> 8, onid & 0xFF, 0xFF])
+    return [build_section(TABLE_SDT_ACTUAL, tsid, prefix + chunk, version, n, len(chunks) - 1)
+            for n, chunk in enumerate(chunks)]
+
+
+def build_satellite_delivery(frequency: int, polarization: str, symbol_rate: int,
+                             fec: str = "AUTO", system: str = "DVB-S2",
+                             modulation: str = "QPSK", orbital_position: float = 42.0,
+                             east: bool = True) -> bytes:
+    """Uydu teslim sistemi descriptor'ı (0x43) üret."""
+    fec_code = {v: k for k, v in DELIVERY_FEC.items()}.get(fec, 0)
+    mod_code = {v: k for k, v in DELIVERY_MODULATIONS.items()}.get(modulation, 1)
+    flags = ((0x80 if east else 0)
+             | (DELIVERY_POLARIZATIONS.index(polarization) << 5)
+             | (0x04 if system != "DVB-S" else 0)
+             | mod_code)
+    sr = _to_bcd(symbol_rate * 100, 8)                     # 7 hane (100 sps) + FEC nibble
+    body = (_to_bcd(frequency * 100, 8) + _to_bcd(round(orbital_position * 10), 4)
+            + bytes([flags]) + sr[:3] + bytes([(sr[3] & 0xF0) | fec_code]))
+    return bytes([DESC_SATELLITE_DELIVERY, len(body)]) + body
+
+
+def build_nit(network_id: int, network_name: str, transports: list[tuple[int, int, bytes]],
+              version: int = 0) -> list[bytes]:
+    """transports: (tsid, onid, descriptors) listesi; gerekirse birden çok section."""
+    name = encode_dvb_text(network_name)
+    net_desc = bytes([DESC_NETWORK_NAME, len(name)]) + name
+
+    loops, current = [], bytearray()
+    for tsid, onid, descriptors in transports:
+        entry = bytes([tsid >> 8, tsid & 0xFF, onid >> 8, onid & 0xFF,
+                       0xF0 | (len(descriptors) >> 8), len(descriptors) & 0xFF]) + descriptors
+        if len(current) + len(entry) > 1000 - len(net_desc):
+            loops.append(current)
+            current = bytearray()
+        current += entry
+    loops.append(current)
+
+    sections = []
+    for n, loop in enumerate(loops):
+        payload = (bytes([0xF0 | (len(net_desc) >> 8), len(net_desc) & 0xFF]) + net_desc
+                   + bytes([0xF0 | (len(loop) >> 8), len(loop) & 0xFF]) + bytes(loop))
+        sections.append(build_section(TABLE_NIT_ACTUAL, network_id, payload, version, n, len(loops) - 1))
+    return sections
+
+
+def packetize(pid: int, sections: list[bytes], continuity: int = 0) -> bytes:
+    """Section'ları TS paketlerine böl (her section yeni pakette başlar)."""
+    out = bytearray()
+    cc = continuity
+    for section in sections:
+        data = b"\x00" + section                    # pointer_field = 0
+        first = True
+        while data:
+            chunk, data = data[:184], data[184:]
+            header = bytes([TS_SYNC_BYTE, (0x40 if first else 0) | (pid >> 8), pid & 0xFF,
+                            0x10 | cc])
+            out += header + chunk + b"\xFF" * (184 - len(chunk))
+            cc = (cc + 1) & 0x0F
+            first = False
+    return bytes(out)
+
+
+def _service_type_of(service) -> int:
+    if getattr(service, "service_type", 0):
+        return service.service_type
+    if service.channel_type == "Radio":
+        return 0x02
+    if service.channel_type == "TV":
+        return 0x19 if service.is_hd else 0x01
+    return 0x0C
+
+
+def build_mux(services: list, tsid: int = 1, onid: int = 1,
+              pat_version: int = 0, sdt_version: int = 0,
+              nit: Optional[list[bytes]] = None, repeat: int = 1) -> bytes:
+    """
+    Servis listesinden PAT/PMT/SDT(/NIT) içeren TS üret.
+
+    services: Channel veya ServiceInfo benzeri nesneler (service_id, name,
+    provider, channel_type, is_hd, is_free, pmt_pid, pcr_pid, video_pid,
+    audio_pid).
+    """
+    programs = {}
+    pmt_packets = bytearray()
+    sdt_entries = []
+    for i, svc in enumerate(services):
+        pmt_pid = svc.pmt_pid or (0x100 + i)
+        programs[svc.service_id] = pmt_pid
+        streams = []
+        if svc.video_pid:
+            streams.append((0x1B if svc.is_hd else 0x02, svc.video_pid, b""))
+        if svc.audio_pid:
+            streams.append((0x04, svc.audio_pid, b""))
+        program_info = b"" if svc.is_free else bytes([DESC_CA, 4, 0x06, 0x04, 0xE1, 0x00])
+        pcr_pid = svc.pcr_pid or svc.video_pid or svc.audio_pid or 0x1FFF
+        pmt_packets += packetize(pmt_pid, [build_pmt(svc.service_id, pcr_pid, streams, program_info)])
+        sdt_entries.append((svc.service_id, _service_type_of(svc), svc.provider or "",
+                            svc.name, not svc.is_free))
+
+    pat = packetize(PID_PAT, [build_pat(tsid, programs, version=pat_version)])
+    sdt = packetize(PID_SDT, build_sdt(tsid, onid, sdt_entries, version=sdt_version))
+    nit_packets = packetize(PID_NIT, nit) if nit else b""
+
+    carousel = pat + bytes(pmt_packets) + sdt + nit_packets
+    return carousel * repeat
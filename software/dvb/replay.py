@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+APEXSAT AI - Kayıtlı TS Oynatma Frontend'i
+
+Transponder başına kaydedilmiş .ts dosyalarını sanal bir DVB adaptör gibi
+sunar. Tune/durum arayüzü FakeFrontend'den gelir; section_source() kilitli
+transponder'ın dosyasını okur, stream_path() ise MediaPipeline'a filesrc
+olarak verilir. Böylece PSI/EIT ayrıştırma ve tarama akışı donanım olmadan,
+disk hızında çalışır.
+
+Dosya adları:
+    <frekans><pol>[_<SR>][_<sistem>].ts
+    ör. 11054H.ts, 11054H_30000.ts, 12380V_2400_DVB-S.ts
+
+SR veya sistem dosya adında yoksa verilen transponder listesinden alınır.
+
+Kullanım:
+    python3 replay.py captures/              # Dizindeki muxların PSI özeti
+    python3 replay.py captures/ --generate   # Simülasyon kanallarından kayıt üret
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+try:
+    from .frontend import FE_HAS_LOCK, FakeCarrier, FakeFrontend
+    from .psi import SectionSource, TSSectionSource
+except ImportError:
+    from frontend import FE_HAS_LOCK, FakeCarrier, FakeFrontend
+    from psi import SectionSource, TSSectionSource
+
+
+CAPTURE_PATTERN = re.compile(r"^(\d{4,5})([HVLR])(?:_(\d+))?(?:_(DVB-S2?))?\.ts$", re.IGNORECASE)
+DEFAULT_SYMBOL_RATE = 27500     # ksps - dosya adında ve listede yoksa
+
+
+@dataclass
+class ReplayCarrier(FakeCarrier):
+    """Kayıt dosyasına bağlı sanal taşıyıcı."""
+    ts_path: str = ""
+
+
+class _DelayedSectionSource(SectionSource):
+    """Her section'dan önce bekleyerek tablo tekrar aralığını taklit eder."""
+
+    def __init__(self, source: SectionSource, sleep: Callable[[float], None], delay: float):
+        self.source = source
+        self.sleep = sleep
+        self.delay = delay
+        self.crc_checked = source.crc_checked
+
+    def sections(self, filters: dict, timeout: float) -> Iterator[tuple[int, bytes]]:
+        for item in self.source.sections(filters, timeout):
+            self.sleep(self.delay)
+            yield item
+
+    def close(self):
+        self.source.close()
+
+
+def scan_captures(directory: Path, transponders: Iterable = ()) -> list[ReplayCarrier]:
+    """Dizindeki kayıtlardan taşıyıcı listesi oluştur."""
+    known = {(tp.frequency, tp.polarization): tp for tp in transponders}
+    carriers = []
+    for path in sorted(Path(directory).glob("*.ts")):
+        match = CAPTURE_PATTERN.match(path.name)
+        if not match:
+            continue
+        freq, pol = int(match.group(1)), match.group(2).upper()
+        tp = known.get((freq, pol))
+        symbol_rate = int(match.group(3) or (tp.symbol_rate if tp else DEFAULT_SYMBOL_RATE))
+        system = (match.group(4) or (tp.system if tp else "AUTO")).upper()
+        carriers.append(ReplayCarrier(freq, pol, symbol_rate, system, ts_path=str(path)))
+    return carriers
+
+
+def write_captures(carriers: Iterable[FakeCarrier], directory: Path, repeat: int = 1) -> list[Path]:
+    """Sanal taşıyıcıların PSI karusellerini kayıt dosyası olarak yaz."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for c in carriers:
+        path = directory / f"{c.frequency}{c.polarization}_{c.symbol_rate}_{c.system}.ts"
+        path.write_bytes(c.mux() * repeat)
+        paths.append(path)
+    return paths
+
+
+class ReplayFrontend(FakeFrontend):
+    """
+    Kayıtlı TS dosyalarıyla çalışan frontend.
+
+    Gecikme enjeksiyonu:
+        lock_time       - tune → FE_HAS_LOCK süresi
+        tune_latency    - tune() çağrısının kendisi
+        section_latency - her section okumasından önce
+    Sanal saatle (VirtualClock) bu süreler beklenmeden modellenir.
+    """
+
+    def __init__(self, directory: Path, transponders: Iterable = (),
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep,
+                 lock_time: float = 0.05, tune_latency: float = 0.0,
+                 section_latency: float = 0.0):
+        carriers = scan_captures(directory, transponders)
+        for c in carriers:
+            c.lock_time = lock_time
+        super().__init__(carriers, clock=clock, sleep=sleep, noise_db=0.0)
+        self.directory = Path(directory)
+        self.tune_latency = tune_latency
+        self.section_latency = section_latency
+
+    def tune(self, tp):
+        super().tune(tp)
+        if self.tune_latency:
+            self.sleep(self.tune_latency)
+
+    def stream_path(self) -> Optional[str]:
+        """Kilitli transponder'ın kayıt dosyası (MediaPipeline filesrc)."""
+        c = self.tuned_carrier
+        if c is None or not self.read_status() & FE_HAS_LOCK:
+            return None
+        return c.ts_path
+
+    def section_source(self) -> SectionSource:
+        path = self.stream_path()
+        if path is None:
+            return TSSectionSource.from_bytes(b"")
+        source = TSSectionSource(open(path, "rb"))
+        if self.section_latency:
+            return _DelayedSectionSource(source, self.sleep, self.section_latency)
+        return source
+
+
+# ─── Test ────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    import argparse
+
+    try:
+        from .psi import PSIScanner
+        from .scanner import DVBScanner
+    except ImportError:
+        from psi import PSIScanner
+        from scanner import DVBScanner
+
+    parser = argparse.ArgumentParser(description="APEXSAT AI - TS kayıt oynatıcı")
+    parser.add_argument("directory", type=Path, help="Kayıt dizini")
+    parser.add_argument("--generate", action="store_true",
+                        help="Simülasyon kanallarından kayıt dosyaları üret")
+    args = parser.parse_args()
+
+    if args.generate:
+        fake = DVBScanner.simulation_frontend()
+        paths = write_captures(fake.carriers, args.directory)
+        print(f"💾 {len(paths)} kayıt yazıldı: {args.directory}")
+
+    print("=" * 50)
+    print("  APEXSAT AI - Kayıt Özeti")
+    print("=" * 50)
+
+    psi = PSIScanner()
+    for carrier in scan_captures(args.directory):
+        start = time.perf_counter()
+        with open(carrier.ts_path, "rb") as f:
+            mux = psi.scan(TSSectionSource(f))
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  {carrier.frequency} {carrier.polarization} SR:{carrier.symbol_rate} "
+              f"TSID {mux.transport_stream_id}: {len(mux.services)} servis ({elapsed:.1f} ms)")
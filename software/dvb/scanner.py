@@ -5,37 +5,57 @@ Türksat 42°E odaklı, tüm Ku-Band uydularla uyumlu.
 
 Kullanım:
     python3 scanner.py --scan turksat       # Türksat hızlı tarama (bilinen transponderlar)
-    python3 scanner.py --blind-scan         # Blind scan (tüm frekans aralığı)
+    python3 scanner.py --blind-scan         # Blind scan (spektrum taraması + aday tune)
     python3 scanner.py --nit-scan           # NIT tabanlı otomatik tarama
+    python3 scanner.py --scan multi         # Çoklu uydu (DiSEqC/USALS) taraması
+    python3 scanner.py --blind-scan --resume  # Yarım kalan taramayı sürdür
     python3 scanner.py --adapter 0          # DVB adaptör seçimi
     python3 scanner.py --list-channels      # Bulunan kanalları listele
     python3 scanner.py --export m3u         # M3U playlist olarak dışa aktar
 
 Gereksinimler:
-    - Linux DVB subsystem (dvb-core, dvb-frontend)
-    - dvbv5-tools (dvb-fe-tool, dvbv5-scan, dvbv5-zap)
+    - Linux DVB subsystem (dvb-core, dvb-frontend) - tune/durum ioctl ile,
+      PAT/PMT/SDT demux section filtreleriyle okunur
     - Python 3.11+
 """
 
 import json
 import os
-import subprocess
+import re
 import sys
 import time
 import argparse
 import sqlite3
-import xml.etree.ElementTree as ET
+import threading
+from abc import ABC, abstractmethod
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+try:
+    from .frontend import (FakeCarrier, FakeFrontend, FrontendBackend, FrontendCapabilities,
+                           IoctlFrontend, LockWaitResult, SignalStats, VirtualClock,
+                           device_identity)
+    from .planner import PlanItem, ScanPlan, ScanPlanner, estimate_switching_cost
+    from .psi import MuxInfo, NITable, PSIScanner, SatelliteDelivery, ServiceInfo, build_nit, build_satellite_delivery
+except ImportError:
+    from frontend import (FakeCarrier, FakeFrontend, FrontendBackend, FrontendCapabilities,
+                          IoctlFrontend, LockWaitResult, SignalStats, VirtualClock,
+                          device_identity)
+    from planner import PlanItem, ScanPlan, ScanPlanner, estimate_switching_cost
+    from psi import MuxInfo, NITable, PSIScanner, SatelliteDelivery, ServiceInfo, build_nit, build_satellite_delivery
 
 
 # ─── Sabitler ────────────────────────────────────────────────────────────────
 
 SCRIPT_DIR = Path(__file__).parent
 TRANSPONDER_DB = SCRIPT_DIR / "turksat_transponders.json"
+NIT_TRANSPONDER_DB = SCRIPT_DIR / "nit_transponders.json"     # NIT taramasından güncel liste
 CHANNEL_DB = SCRIPT_DIR / "channels.db"
+CAPABILITY_CACHE = SCRIPT_DIR / "frontend_caps.json"        # Cihaz kimliği → FE_GET_INFO
 DVB_ADAPTER_PATH = "/dev/dvb"
 
 # Ku-Band LNB parametreleri
@@ -52,6 +72,46 @@ BLIND_SCAN_RANGE = {
     "step": 2,       # MHz adım
 }
 
+# Spektrum taraması (blind scan 1. aşama)
+SPECTRUM_SWEEP = {
+    "step": 1,            # MHz - güç ölçüm adımı
+    "symbol_rate": 1000,  # ksps - ölçüm filtresi (≈1.35 MHz çözünürlük)
+    "threshold_db": 3.0,  # Gürültü tabanı üstü eşik
+}
+
+# Uyarlamalı blind scan (kaba adımda sinyal varlığı → bölgede ince arama)
+ADAPTIVE_SCAN = {
+    "coarse_step": 8,     # MHz - sinyal varlığı adımı (taranacak en dar taşıyıcıdan dar olmalı)
+    "fine_step": 2,       # MHz - kenar arama ve çapa kaydırma çözünürlüğü
+    "rolloff": 0.35,      # Bant genişliği tahmini: SR × (1 + rolloff)
+    "retry_trials": 4,    # Kilitlenmeyen çapa kaydırılınca denenecek en olası kombinasyon
+    "anchor_offsets": (0, -1, 1, 2),    # İnce adım cinsinden çapa kaydırmaları (sırayla)
+}
+BLIND_SYSTEMS = ["DVB-S2", "DVB-S"]
+
+# NIT taraması
+NIT_HOME_ATTEMPTS = 3           # NIT okunamazsa denenecek ana transponder sayısı
+NIT_FREQ_TOLERANCE = 2          # MHz - aynı mux sayılan frekans farkı
+TURKSAT_ORBITAL = 42.0          # derece (Doğu pozitif, Batı negatif)
+DEFAULT_SATELLITE = "turksat"   # Uydu belirtilmeyen kanal/transponder kayıtları
+
+# SQLite ayarları (kalıcı bağlantı)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",          # Okuyucular (UI) yazıcıyı beklemez
+    "PRAGMA synchronous=NORMAL",        # WAL'da commit başına fsync yok
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",          # ~8 MB sayfa önbelleği
+    "PRAGMA busy_timeout=5000",
+)
+
+# Tarama kontrol noktası: bu kadar aday tamamlanınca sonuçlar diske yazılır
+CHECKPOINT_BATCH = 16
+
+# Dışa aktarma: imleçten parça başına satır ve dosya yazım tamponu
+EXPORT_BATCH = 500
+EXPORT_BUFFER = 1 << 16
+EXPORT_FORMATS = {"m3u": ".m3u8", "csv": ".csv", "enigma2": ".tv", "xmltv": ".xml"}
+
 # Desteklenen symbol rate'ler
 COMMON_SYMBOL_RATES = [2400, 3125, 5000, 6000, 13000, 22000, 27500, 30000, 45000]
 
@@ -109,6 +169,12 @@ class Transponder:
         """22kHz tone (high band için aktif)."""
         return self.is_high_band
 
+    @classmethod
+    def from_delivery(cls, d: SatelliteDelivery, note: str = "") -> "Transponder":
+        """NIT uydu teslim sistemi descriptor'ından transponder oluştur."""
+        return cls(d.frequency, d.polarization, d.symbol_rate, d.fec,
+                   d.system, d.modulation if d.modulation != "AUTO" else "QPSK", note)
+
     def to_dvbv5_format(self) -> str:
         """dvbv5-scan uyumlu transponder satırı."""
         lines = [
@@ -138,6 +204,51 @@ class Channel:
     is_hd: bool = False
     provider: str = ""
     category: str = ""
+    service_type: int = 0           # SDT service_type (0x01 SD, 0x19 HD, 0x02 radyo...)
+    transport_stream_id: int = 0
+    original_network_id: int = 0
+    satellite: str = DEFAULT_SATELLITE
+
+    @classmethod
+    def from_service(cls, service: ServiceInfo, tp: "Transponder", mux: MuxInfo,
+                     satellite: str = DEFAULT_SATELLITE) -> "Channel":
+        """PSI/SI servis bilgisinden kanal oluştur."""
+        return cls(
+            name=service.name,
+            service_id=service.service_id,
+            transponder_freq=tp.frequency,
+            transponder_pol=tp.polarization,
+            video_pid=service.video_pid,
+            audio_pid=service.audio_pid,
+            pcr_pid=service.pcr_pid,
+            pmt_pid=service.pmt_pid,
+            channel_type=service.channel_type,
+            is_free=service.is_free,
+            is_hd=service.is_hd,
+            provider=service.provider,
+            service_type=service.service_type,
+            transport_stream_id=mux.transport_stream_id,
+            original_network_id=mux.original_network_id,
+            satellite=satellite,
+        )
+
+
+@dataclass
+class TuneTiming:
+    """Tek bir tune denemesinin faz süreleri (milisaniye)."""
+    frequency: int
+    polarization: str
+    symbol_rate: int
+    system: str
+    tune_ms: float = 0.0
+    signal_ms: Optional[float] = None
+    carrier_ms: Optional[float] = None
+    lock_ms: Optional[float] = None
+    wait_ms: float = 0.0
+    parse_ms: float = 0.0
+    total_ms: float = 0.0
+    locked: bool = False
+    reason: str = ""
 
 
 @dataclass
@@ -150,6 +261,123 @@ class ScanResult:
     data_services: int = 0
     scan_duration: float = 0.0
     channels: list = field(default_factory=list)
+    timings: list = field(default_factory=list)
+    locked_transponders: list = field(default_factory=list)   # (Transponder, SNR, uydu)
+    muxes: dict = field(default_factory=dict)                 # (uydu, frekans, pol) → MuxInfo
+    unchanged: list = field(default_factory=list)             # Sürümü değişmeyen transponderlar
+    skipped: int = 0                                          # Tuner desteklemediği için denenmeyen
+    diff: Optional["ScanDiff"] = None
+
+    def add_channels(self, channels: list[Channel]):
+        """Kanalları ekle ve tür sayaçlarını güncelle."""
+        self.channels.extend(channels)
+        self.channels_found += len(channels)
+        for ch in channels:
+            if ch.channel_type == "TV":
+                self.tv_channels += 1
+            elif ch.channel_type == "Radio":
+                self.radio_channels += 1
+            else:
+                self.data_services += 1
+
+    def merge(self, other: "ScanResult"):
+        """Başka bir taramanın (ör. paralel tuner) sonuçlarını birleştir."""
+        self.transponders_scanned += other.transponders_scanned
+        self.transponders_locked += other.transponders_locked
+        # Kontrol noktasıyla yazılmış kanallar listede yok; sayaçlar ayrıca toplanır
+        self.channels.extend(other.channels)
+        self.channels_found += other.channels_found
+        self.tv_channels += other.tv_channels
+        self.radio_channels += other.radio_channels
+        self.data_services += other.data_services
+        self.timings.extend(other.timings)
+        self.locked_transponders.extend(other.locked_transponders)
+        self.muxes.update(other.muxes)
+        self.unchanged.extend(other.unchanged)
+        self.skipped += other.skipped
+
+    def clear_buffers(self):
+        """Diske yazılmış kanal/transponder/mux listelerini bırak (sayaçlar kalır)."""
+        self.channels.clear()
+        self.locked_transponders.clear()
+        self.muxes.clear()
+
+    def timing_summary(self) -> dict:
+        """Kilitlenen / kilitlenemeyen denemeler için ortalama süreler (ms)."""
+        locked = [t for t in self.timings if t.locked]
+        unlocked = [t for t in self.timings if not t.locked]
+
+        def avg(values):
+            values = [v for v in values if v is not None]
+            return sum(values) / len(values) if values else 0.0
+
+        return {
+            "attempts": len(self.timings),
+            "avg_lock_ms": avg(t.lock_ms for t in locked),
+            "avg_locked_total_ms": avg(t.total_ms for t in locked),
+            "avg_unlocked_total_ms": avg(t.total_ms for t in unlocked),
+            "avg_parse_ms": avg(t.parse_ms for t in locked),
+        }
+
+
+@dataclass
+class ScanDiff:
+    """
+    Artımlı taramada servis değişiklikleri.
+
+    Servisler DVB üçlüsüyle (ONID, TSID, SID) eşleştirilir, ad bir öznitelik
+    olarak karşılaştırılır; aynı uyduda farklı transponderda bulunan servis
+    "taşındı" sayılır. Üçlüsü olmayan eski satırlar aynı mux'taki service_id
+    ile eşleşir.
+    """
+    added: list = field(default_factory=list)       # Channel
+    removed: list = field(default_factory=list)     # dict (veritabanı satırı)
+    moved: list = field(default_factory=list)       # (Channel, eski frekans, eski pol)
+    renamed: list = field(default_factory=list)     # (Channel, eski ad)
+    changed_muxes: int = 0
+    unchanged_muxes: int = 0
+
+    def describe(self) -> list[str]:
+        lines = [f"🔁 Değişen mux: {self.changed_muxes}, değişmeyen: {self.unchanged_muxes}"]
+        lines += [f"  ➕ {ch.name} ({ch.transponder_freq} {ch.transponder_pol})" for ch in self.added]
+        lines += [f"  ➖ {row['name']} ({row['transponder_freq']} {row['transponder_pol']})"
+                  for row in self.removed]
+        lines += [f"  ↪️  {ch.name}: {freq} {pol} → {ch.transponder_freq} {ch.transponder_pol}"
+                  for ch, freq, pol in self.moved]
+        lines += [f"  ✏️  {old_name} → {ch.name} ({ch.transponder_freq} {ch.transponder_pol})"
+                  for ch, old_name in self.renamed]
+        return lines
+
+
+def transponders_from_nit(nit: NITable, orbital_position: float = TURKSAT_ORBITAL,
+                          tolerance: int = NIT_FREQ_TOLERANCE) -> list[Transponder]:
+    """
+    NIT'teki uydu teslim sistemi descriptor'larından transponder listesi.
+
+    orbital_position işaretli boylamdır (Batı negatif: 42.0°W ≠ 42.0°E);
+    başka yörünge konumundaki girişler atlanır; aynı polarizasyonda
+    tolerance MHz içindeki tekrarlar ve aynı TSID'li girişler tek sayılır.
+    """
+    result: list[Transponder] = []
+    seen_ts = set()
+    for entry in nit.transports:
+        d = entry.delivery
+        if d is None or abs(d.longitude - orbital_position) > 0.5:
+            continue
+        ts_key = (entry.original_network_id, entry.transport_stream_id)
+        if ts_key in seen_ts or any(
+            tp.polarization == d.polarization and abs(tp.frequency - d.frequency) <= tolerance
+            for tp in result
+        ):
+            continue
+        seen_ts.add(ts_key)
+        result.append(Transponder.from_delivery(d, note=f"NIT TSID {entry.transport_stream_id}"))
+    result.sort(key=lambda tp: (tp.frequency, tp.polarization))
+    return result
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else seconds * 1000
 
 
 # ─── DVB Donanım Kontrol ────────────────────────────────────────────────────
@@ -157,73 +385,206 @@ class ScanResult:
 class DVBAdapter:
     """Linux DVB adaptör yöneticisi."""
 
-    def __init__(self, adapter_num: int = 0, frontend_num: int = 0):
+    caps_cache = CAPABILITY_CACHE
+
+    def __init__(self, adapter_num: int = 0, frontend_num: int = 0,
+                 backend: Optional[FrontendBackend] = None):
         self.adapter_num = adapter_num
         self.frontend_num = frontend_num
         self.adapter_path = f"{DVB_ADAPTER_PATH}/adapter{adapter_num}"
         self.frontend_path = f"{self.adapter_path}/frontend{frontend_num}"
         self.demux_path = f"{self.adapter_path}/demux{frontend_num}"
         self.dvr_path = f"{self.adapter_path}/dvr{frontend_num}"
+        self._backend = backend
+        self._monitor = None
+        self._caps: Optional[FrontendCapabilities] = None
+        self._caps_stamp = None
+
+    @property
+    def frontend(self) -> FrontendBackend:
+        """Frontend arka ucu (varsayılan: ioctl, cihaz ilk kullanımda açılır)."""
+        if self._backend is None:
+            self._backend = IoctlFrontend(self.frontend_path)
+        return self._backend
+
+    def signal_monitor(self, rate_hz: Optional[float] = None):
+        """Arka plan sinyal izleyicisi (ilk çağrıda başlatılır)."""
+        if self._monitor is None:
+            try:
+                from .monitor import DEFAULT_RATE_HZ, SignalMonitor
+            except ImportError:
+                from monitor import DEFAULT_RATE_HZ, SignalMonitor
+            self._monitor = SignalMonitor(self.frontend, rate_hz or DEFAULT_RATE_HZ,
+                                          name=f"adapter{self.adapter_num}")
+        return self._monitor.start()
+
+    def close(self):
+        if self._monitor is not None:
+            self._monitor.stop()
+            self._monitor = None
+        if self._backend is not None:
+            self._backend.close()
 
     def exists(self) -> bool:
         return os.path.exists(self.frontend_path)
 
+    def capabilities(self) -> Optional[FrontendCapabilities]:
+        """
+        Frontend yetenekleri (delivery system, frekans/SR sınırları, caps).
+
+        Gerçek cihazda FE_GET_INFO/DTV_ENUM_DELSYS bir kez sorgulanır ve
+        caps_cache'e cihaz kimliğiyle yazılır; cihaz yeniden takılınca
+        (/dev düğümü yeniden oluşur) önbellek geçersiz sayılır. Bilinmiyorsa
+        None (tarayıcı filtre uygulamaz).
+        """
+        backend = self.frontend
+        if not isinstance(backend, IoctlFrontend):
+            return backend.capabilities()
+
+        try:
+            st = os.stat(self.frontend_path)
+        except OSError:
+            return None
+        stamp = [st.st_rdev, st.st_ctime_ns]
+        if stamp != self._caps_stamp:
+            self._caps = self._load_capabilities(backend)
+            self._caps_stamp = stamp
+        return self._caps
+
+    def _load_capabilities(self, backend: IoctlFrontend) -> Optional[FrontendCapabilities]:
+        identity = device_identity(self.frontend_path)
+        if identity is None:
+            return None
+        key, stamp = identity
+
+        try:
+            cache = json.loads(self.caps_cache.read_text())
+        except (OSError, ValueError):
+            cache = {}
+        entry = cache.get(key)
+        if entry and entry.get("stamp") == stamp:
+            return FrontendCapabilities.from_dict(entry["caps"])
+
+        try:
+            caps = backend.capabilities()
+        except OSError as e:
+            print(f"⚠️  Frontend yetenekleri okunamadı: {e}")
+            return None
+
+        cache[key] = {"stamp": stamp, "caps": caps.to_dict()}
+        tmp = self.caps_cache.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(cache, ensure_ascii=False, indent=2))
+            os.replace(tmp, self.caps_cache)
+        except OSError:
+            pass    # Salt okunur kurulum: önbelleksiz devam
+        return caps
+
     def get_info(self) -> dict:
-        """Frontend bilgilerini al."""
+        """Frontend bilgilerini al (önbellekli FE_GET_INFO)."""
         try:
-            result = subprocess.run(
-                ["dvb-fe-tool", "-a", str(self.adapter_num)],
-                capture_output=True, text=True, timeout=5
-            )
-            info = {"raw": result.stdout}
-            for line in result.stdout.splitlines():
-                if ":" in line:
-                    key, _, value = line.partition(":")
-                    info[key.strip()] = value.strip()
-            return info
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            caps = self.capabilities()
+        except OSError as e:
             return {"error": str(e)}
+        if caps is None:
+            return {"error": f"Frontend bilgisi yok: {self.frontend_path}"}
+        return caps.to_dict()
 
     def get_signal_stats(self) -> dict:
-        """Sinyal istatistiklerini al (SNR, BER, sinyal gücü)."""
+        """
+        Sinyal istatistiklerini al (SNR, BER, sinyal gücü).
+
+        İzleyici çalışıyorsa son örnek döner (ioctl çağrısı yapılmaz).
+        """
+        if self._monitor is not None and self._monitor.running:
+            sample = self._monitor.latest()
+            if sample is not None:
+                return sample.to_dict()
         try:
-            result = subprocess.run(
-                ["dvb-fe-tool", "-a", str(self.adapter_num), "-m"],
-                capture_output=True, text=True, timeout=5
-            )
-            stats = {}
-            for line in result.stdout.splitlines():
-                if "Signal" in line:
-                    stats["signal_strength"] = line.split(":")[-1].strip()
-                elif "SNR" in line or "C/N" in line:
-                    stats["snr"] = line.split(":")[-1].strip()
-                elif "BER" in line:
-                    stats["ber"] = line.split(":")[-1].strip()
-                elif "Lock" in line or "lock" in line:
-                    stats["locked"] = "Yes" in line or "1" in line
-            return stats
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            return self.frontend.read_stats().to_dict()
+        except OSError as e:
             return {"error": str(e)}
 
 
 # ─── Kanal Veritabanı ────────────────────────────────────────────────────────
 
+# Türkçe harf katlama: arama "cnn turk" ↔ "CNN Türk", "habertürk" ↔ "Haberturk"
+_TURKISH_FOLD = str.maketrans("ıİIşŞçÇğĞöÖüÜâÂîÎûÛ", "iiissccggoouuaaiiuu")
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+
+def fold_turkish(text: Optional[str]) -> str:
+    """Büyük/küçük harf ve Türkçe aksan farklarını kaldır."""
+    return (text or "").translate(_TURKISH_FOLD).lower()
+
+
+def fts_query(text: str) -> str:
+    """Kullanıcı metnini FTS5 önek sorgusuna çevir ("cnn tü" → '"cnn"* "tu"*')."""
+    return " ".join(f'"{token}"*' for token in _SEARCH_TOKEN.findall(fold_turkish(text)))
+
+
 class ChannelDatabase:
-    """SQLite tabanlı kanal veritabanı."""
+    """
+    SQLite tabanlı kanal veritabanı.
+
+    Tek kalıcı bağlantı (WAL) kullanılır; toplu yazımlar tek transaction'da
+    executemany ile yapılır. Bağlantı iş parçacıkları arasında kilitle
+    paylaşılır.
+
+    Aynı servis birden fazla transponder/uyduda yayınlanabilir; services
+    tablosu her DVB üçlüsü (original_network_id, transport_stream_id,
+    service_id) için tercih edilen kaynağı (HD, sonra en yüksek SNR) tutar.
+    Tablo her yazımda sadece etkilenen üçlüler için güncellenir, bellekte
+    de sözlük olarak tutulur (üçlüyle O(1) arama). ONID 0 (ayrılmış) olan
+    kanalların SI bilgisi bilinmez, tekilleştirilmez.
+
+    Kanal araması channels_fts (FTS5) tablosundan yapılır; tablo Türkçe
+    katlanmış metni saklar. Yeni satırlar yazımdan sonra toplu indekslenir,
+    güncelleme/silme tetikleyicilerle izlenir. Tetikleyiciler tr_fold() SQL
+    fonksiyonunu kullandığından channels tablosuna yalnızca bu sınıf üzerinden
+    yazılmalıdır. SQLite FTS5 olmadan derlenmişse LIKE'a düşülür.
+    """
+
+    # Sıralama ağırlıkları (bm25): ad > sağlayıcı > kategori
+    FTS_WEIGHTS = (10.0, 2.0, 1.0)
 
     def __init__(self, db_path: Path = CHANNEL_DB):
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.create_function("tr_fold", 1, fold_turkish, deterministic=True)
+        for pragma in SQLITE_PRAGMAS:
+            self.conn.execute(pragma)
+        self.fts_enabled = False
+        self._services: Optional[dict[tuple[int, int, int], tuple[int, int]]] = None
         self._init_db()
 
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Kilitli, tek commit'li yazım bloğu."""
+        with self._lock:
+            try:
+                with self.conn:
+                    yield self.conn
+            except BaseException:
+                self._services = None       # Geri alınan yazım önbelleğe işlenmiş olabilir
+                raise
+
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript("""
+        with self._transaction() as conn:
+            conn.executescript(f"""
                 CREATE TABLE IF NOT EXISTS channels (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     name TEXT NOT NULL,
                     service_id INTEGER,
                     transponder_freq INTEGER,
                     transponder_pol TEXT,
+                    satellite TEXT NOT NULL DEFAULT 'turksat',
                     video_pid INTEGER DEFAULT 0,
                     audio_pid INTEGER DEFAULT 0,
                     pcr_pid INTEGER DEFAULT 0,
@@ -233,24 +594,16 @@ class ChannelDatabase:
                     is_hd INTEGER DEFAULT 0,
                     provider TEXT DEFAULT '',
                     category TEXT DEFAULT '',
+                    service_type INTEGER DEFAULT 0,
+                    transport_stream_id INTEGER DEFAULT 0,
+                    original_network_id INTEGER DEFAULT 0,
                     position INTEGER DEFAULT 0,
                     favorite INTEGER DEFAULT 0,
                     locked INTEGER DEFAULT 0,
                     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
 
-                CREATE TABLE IF NOT EXISTS transponders (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    frequency INTEGER NOT NULL,
-                    polarization TEXT NOT NULL,
-                    symbol_rate INTEGER,
-                    fec TEXT,
-                    system TEXT,
-                    modulation TEXT,
-                    signal_quality REAL DEFAULT 0,
-                    last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(frequency, polarization)
-                );
+                {self._TRANSPONDERS_TABLE}
 
                 CREATE TABLE IF NOT EXISTS favorites (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -260,79 +613,848 @@ class ChannelDatabase:
                     FOREIGN KEY (channel_id) REFERENCES channels(id)
                 );
 
+                CREATE TABLE IF NOT EXISTS scan_sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    mode TEXT NOT NULL,
+                    params TEXT DEFAULT '{{}}',
+                    status TEXT DEFAULT 'running',
+                    total INTEGER DEFAULT 0,
+                    completed INTEGER DEFAULT 0,
+                    channels_found INTEGER DEFAULT 0,
+                    started TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS scan_candidates (
+                    session_id INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    frequency INTEGER,
+                    polarization TEXT,
+                    symbol_rate INTEGER,
+                    fec TEXT,
+                    system TEXT,
+                    modulation TEXT,
+                    note TEXT DEFAULT '',
+                    satellite TEXT DEFAULT 'turksat',
+                    diseqc_port INTEGER DEFAULT 0,
+                    status TEXT DEFAULT 'pending',
+                    channels INTEGER DEFAULT 0,
+                    covered REAL,                   -- Uyarlamalı blind scan: taranan üst sınır (MHz)
+                    PRIMARY KEY (session_id, position),
+                    FOREIGN KEY (session_id) REFERENCES scan_sessions(id)
+                );
+
+                CREATE TABLE IF NOT EXISTS lock_history (
+                    satellite TEXT NOT NULL,
+                    symbol_rate INTEGER NOT NULL,
+                    system TEXT NOT NULL,
+                    attempts INTEGER DEFAULT 0,
+                    locks INTEGER DEFAULT 0,
+                    updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (satellite, symbol_rate, system)
+                );
+
+                CREATE TABLE IF NOT EXISTS services (
+                    original_network_id INTEGER NOT NULL,
+                    transport_stream_id INTEGER NOT NULL,
+                    service_id INTEGER NOT NULL,
+                    channel_id INTEGER NOT NULL,
+                    sources INTEGER DEFAULT 1,
+                    is_hd INTEGER DEFAULT 0,
+                    snr REAL DEFAULT 0,
+                    PRIMARY KEY (original_network_id, transport_stream_id, service_id)
+                ) WITHOUT ROWID;
+
                 CREATE INDEX IF NOT EXISTS idx_channels_name ON channels(name);
                 CREATE INDEX IF NOT EXISTS idx_channels_type ON channels(channel_type);
-                CREATE INDEX IF NOT EXISTS idx_channels_freq ON channels(transponder_freq);
             """)
+            self._migrate(conn)
+            self._ensure_service_key(conn)
+            self._init_services(conn)
+            self.fts_enabled = self._init_fts(conn)
+
+    _TRANSPONDERS_TABLE = """
+        CREATE TABLE IF NOT EXISTS transponders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            satellite TEXT NOT NULL DEFAULT 'turksat',
+            frequency INTEGER NOT NULL,
+            polarization TEXT NOT NULL,
+            symbol_rate INTEGER,
+            fec TEXT,
+            system TEXT,
+            modulation TEXT,
+            signal_quality REAL DEFAULT 0,
+            transport_stream_id INTEGER,
+            original_network_id INTEGER,
+            pat_version INTEGER,
+            sdt_version INTEGER,
+            last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(satellite, frequency, polarization)
+        );
+    """
+
+    # Eski veritabanlarına sonradan eklenen sütunlar
+    _MIGRATIONS = {
+        "channels": {
+            "service_type": "INTEGER DEFAULT 0",
+            "transport_stream_id": "INTEGER DEFAULT 0",
+            "original_network_id": "INTEGER DEFAULT 0",
+            "satellite": "TEXT NOT NULL DEFAULT 'turksat'",
+        },
+        "transponders": {
+            "transport_stream_id": "INTEGER",
+            "original_network_id": "INTEGER",
+            "pat_version": "INTEGER",
+            "sdt_version": "INTEGER",
+        },
+        "scan_candidates": {
+            "covered": "REAL",
+        },
+    }
+
+    def _migrate(self, conn: sqlite3.Connection):
+        for table, columns in self._MIGRATIONS.items():
+            existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for column, decl in columns.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+        self._migrate_transponder_key(conn)
+
+    def _migrate_transponder_key(self, conn: sqlite3.Connection):
+        """
+        Uydusuz eski transponder tablosunu (UNIQUE(frekans, pol)) yeniden kur.
+
+        SQLite tablo kısıtını değiştiremediği için tablo yeniden oluşturulup
+        satırlar kopyalanır; eski kayıtlar DEFAULT_SATELLITE'a atanır.
+        """
+        existing = [row[1] for row in conn.execute("PRAGMA table_info(transponders)")]
+        if "satellite" in existing:
+            return
+        conn.execute("ALTER TABLE transponders RENAME TO transponders_old")
+        conn.execute(self._TRANSPONDERS_TABLE)
+        columns = ", ".join(existing)
+        conn.execute(f"INSERT INTO transponders ({columns}) SELECT {columns} FROM transponders_old")
+        conn.execute("DROP TABLE transponders_old")
+
+    def _ensure_service_key(self, conn: sqlite3.Connection):
+        """
+        (uydu, transponder, service_id) benzersiz indeksini oluştur.
+
+        Eski sürümlerin her taramada eklediği tekrar satırlar önce temizlenir
+        (en eski satır kalır, favoriler ona taşınır). Uydusuz eski indeks
+        zaten tekil satırları kapsadığından sadece yeniden oluşturulur.
+        """
+        columns = [row[2] for row in conn.execute("PRAGMA index_info(idx_channels_service)")]
+        if "satellite" in columns:
+            return
+        if columns:
+            conn.execute("DROP INDEX idx_channels_service")
+        else:
+            conn.executescript("""
+                CREATE TEMP TABLE channel_keep AS
+                    SELECT MIN(id) AS keep_id, satellite, transponder_freq, transponder_pol,
+                           service_id
+                    FROM channels GROUP BY satellite, transponder_freq, transponder_pol, service_id;
+
+                UPDATE favorites SET channel_id = (
+                    SELECT k.keep_id FROM channels c JOIN channel_keep k
+                        ON c.satellite IS k.satellite
+                       AND c.transponder_freq IS k.transponder_freq
+                       AND c.transponder_pol IS k.transponder_pol
+                       AND c.service_id IS k.service_id
+                    WHERE c.id = favorites.channel_id
+                ) WHERE channel_id NOT IN (SELECT keep_id FROM channel_keep);
+
+                DELETE FROM channels WHERE id NOT IN (SELECT keep_id FROM channel_keep);
+                DROP TABLE channel_keep;
+
+                DROP INDEX IF EXISTS idx_channels_freq;
+            """)
+        conn.execute("""
+            CREATE UNIQUE INDEX idx_channels_service
+                ON channels(satellite, transponder_freq, transponder_pol, service_id)
+        """)
+
+    # ─── Servis tekilleştirme ───
+
+    # Üçlü başına kaynakları sırala: HD önce, sonra transponder SNR'ı, eşitlikte eski satır
+    _SERVICE_RANKING = """
+        INSERT OR REPLACE INTO services
+            (original_network_id, transport_stream_id, service_id, channel_id, sources, is_hd, snr)
+        SELECT original_network_id, transport_stream_id, service_id, id, sources, is_hd, snr
+        FROM (
+            SELECT c.id, c.original_network_id, c.transport_stream_id, c.service_id, c.is_hd,
+                   COALESCE(t.signal_quality, 0) AS snr,
+                   ROW_NUMBER() OVER triplet AS rank,
+                   COUNT(*) OVER (PARTITION BY c.original_network_id, c.transport_stream_id,
+                                               c.service_id) AS sources
+            FROM channels c
+            LEFT JOIN transponders t
+                ON t.satellite = c.satellite AND t.frequency = c.transponder_freq
+               AND t.polarization = c.transponder_pol
+            WHERE c.original_network_id > 0 {filter}
+            WINDOW triplet AS (
+                PARTITION BY c.original_network_id, c.transport_stream_id, c.service_id
+                ORDER BY c.is_hd DESC, COALESCE(t.signal_quality, 0) DESC, c.id
+            )
+        ) WHERE rank = 1
+    """
+
+    def _init_services(self, conn: sqlite3.Connection):
+        """Üçlü indeksini oluştur; servis tablosu yeni oluşturulduysa doldur."""
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' "
+                              "AND name = 'idx_channels_triplet'").fetchone()
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_channels_triplet
+                ON channels(original_network_id, transport_stream_id, service_id)
+        """)
+        if not exists:
+            conn.execute("DELETE FROM services")
+            conn.execute(self._SERVICE_RANKING.format(filter=""))
+
+    @staticmethod
+    def _channel_triplets(channels: list[Channel]) -> set[tuple[int, int, int]]:
+        return {(ch.original_network_id, ch.transport_stream_id, ch.service_id)
+                for ch in channels if ch.original_network_id}
+
+    @staticmethod
+    def _channel_transponders(channels: list[Channel]) -> set[tuple[str, int, str]]:
+        return {(ch.satellite, ch.transponder_freq, ch.transponder_pol) for ch in channels}
+
+    @staticmethod
+    def _transponder_triplets(conn: sqlite3.Connection,
+                              keys: set[tuple[str, int, str]]) -> set[tuple[int, int, int]]:
+        """
+        Verilen (uydu, frekans, pol) transponderlarındaki kanalların üçlüleri.
+
+        Yazımdan önce çağrılır: üçlüsü değişen ya da silinen satırların eski
+        üçlüleri de yenilenmelidir.
+        """
+        triplets = set()
+        for satellite, freq, pol in keys:
+            triplets.update(conn.execute("""
+                SELECT original_network_id, transport_stream_id, service_id FROM channels
+                WHERE satellite = ? AND transponder_freq = ? AND transponder_pol = ?
+                  AND original_network_id > 0
+            """, (satellite, freq, pol)).fetchall())
+        return {tuple(t) for t in triplets}
+
+    def _refresh_services(self, conn: sqlite3.Connection, triplets: set[tuple[int, int, int]]):
+        """Sadece verilen üçlülerin tercih edilen kaynağını yeniden seç."""
+        if not triplets:
+            return
+        conn.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS dirty_services (
+                original_network_id INTEGER, transport_stream_id INTEGER, service_id INTEGER,
+                PRIMARY KEY (original_network_id, transport_stream_id, service_id)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("DELETE FROM dirty_services")
+        conn.executemany("INSERT OR IGNORE INTO dirty_services VALUES (?, ?, ?)", triplets)
+        # Kaynağı kalmayan üçlüler silinir, kalanlar yeniden sıralanır
+        conn.execute("""
+            DELETE FROM services WHERE (original_network_id, transport_stream_id, service_id)
+                IN (SELECT * FROM dirty_services)
+        """)
+        conn.execute(self._SERVICE_RANKING.format(filter="""
+            AND (c.original_network_id, c.transport_stream_id, c.service_id)
+                IN (SELECT * FROM dirty_services)
+        """))
+
+        if self._services is not None:
+            for triplet in triplets:
+                self._services.pop(triplet, None)
+            for onid, tsid, sid, channel_id, sources in conn.execute("""
+                SELECT s.original_network_id, s.transport_stream_id, s.service_id,
+                       s.channel_id, s.sources
+                FROM dirty_services d JOIN services s USING
+                    (original_network_id, transport_stream_id, service_id)
+            """):
+                self._services[(onid, tsid, sid)] = (channel_id, sources)
+
+    def _service_index(self) -> dict[tuple[int, int, int], tuple[int, int]]:
+        """(ONID, TSID, SID) → (tercih edilen kanal id, kaynak sayısı); ilk erişimde yüklenir."""
+        with self._lock:
+            if self._services is None:
+                self._services = {
+                    (onid, tsid, sid): (channel_id, sources)
+                    for onid, tsid, sid, channel_id, sources in self.conn.execute("""
+                        SELECT original_network_id, transport_stream_id, service_id,
+                               channel_id, sources FROM services
+                    """)
+                }
+            return self._services
+
+    def preferred_channel_id(self, original_network_id: int, transport_stream_id: int,
+                             service_id: int) -> Optional[int]:
+        """DVB üçlüsünün tercih edilen kaynağının kanal id'si (O(1), sorgu yok)."""
+        entry = self._service_index().get((original_network_id, transport_stream_id, service_id))
+        return entry[0] if entry else None
+
+    def get_service(self, original_network_id: int, transport_stream_id: int,
+                    service_id: int) -> Optional[dict]:
+        """DVB üçlüsünün tercih edilen kanal satırı ve kaynak sayısı."""
+        entry = self._service_index().get((original_network_id, transport_stream_id, service_id))
+        if entry is None:
+            return None
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM channels WHERE id = ?", (entry[0],)).fetchone()
+        return dict(row, sources=entry[1]) if row else None
+
+    def service_sources(self, original_network_id: int, transport_stream_id: int,
+                        service_id: int) -> list[dict]:
+        """Servisin tüm kaynakları, tercih sırasıyla (SNR transponder tablosundan)."""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT c.*, COALESCE(t.signal_quality, 0) AS snr FROM channels c
+                LEFT JOIN transponders t
+                    ON t.satellite = c.satellite AND t.frequency = c.transponder_freq
+                   AND t.polarization = c.transponder_pol
+                WHERE c.original_network_id = ? AND c.transport_stream_id = ? AND c.service_id = ?
+                ORDER BY c.is_hd DESC, snr DESC, c.id
+            """, (original_network_id, transport_stream_id, service_id)).fetchall()
+        return [dict(row) for row in rows]
+
+    def _init_fts(self, conn: sqlite3.Connection) -> bool:
+        """Arama indeksini ve eşitleme tetikleyicilerini oluştur."""
+        created = not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'channels_fts'").fetchone()
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS channels_fts USING fts5(
+                    name, provider, category,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '1 2 3'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False            # FTS5 yok
+
+        # Eklemeler satır başına tetikleyici yerine _index_new_channels() ile
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS channels_fts_delete AFTER DELETE ON channels BEGIN
+                DELETE FROM channels_fts WHERE rowid = old.id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS channels_fts_update AFTER UPDATE OF name, provider, category ON channels
+            WHEN old.name IS NOT new.name OR old.provider IS NOT new.provider
+                 OR old.category IS NOT new.category
+            BEGIN
+                DELETE FROM channels_fts WHERE rowid = old.id;
+                INSERT INTO channels_fts(rowid, name, provider, category)
+                VALUES (new.id, tr_fold(new.name), tr_fold(new.provider), tr_fold(new.category));
+            END;
+        """)
+        if created:
+            self._rebuild_fts(conn)
+        return True
+
+    @staticmethod
+    def _rebuild_fts(conn: sqlite3.Connection):
+        conn.execute("DELETE FROM channels_fts")
+        ChannelDatabase._index_new_channels(conn, 0)
+
+    @staticmethod
+    def _last_channel_id(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COALESCE(MAX(id), 0) FROM channels").fetchone()[0]
+
+    @staticmethod
+    def _index_new_channels(conn: sqlite3.Connection, after_id: int):
+        """id'si after_id'den büyük (yeni eklenen) kanalları arama indeksine ekle."""
+        conn.execute("""
+            INSERT INTO channels_fts(rowid, name, provider, category)
+            SELECT id, tr_fold(name), tr_fold(provider), tr_fold(category)
+            FROM channels WHERE id > ?
+        """, (after_id,))
 
     def save_channels(self, channels: list[Channel]):
-        with sqlite3.connect(self.db_path) as conn:
+        """
+        Kanalları tek transaction'da kaydet.
+
+        (uydu, transponder, service_id) zaten varsa satır yerinde güncellenir; id,
+        sıra, favori ve kilit bilgisi korunur.
+        """
+        with self._transaction() as conn:
+            dirty = self._transponder_triplets(conn, self._channel_transponders(channels))
+            self._upsert_channels(conn, channels)
+            self._refresh_services(conn, dirty | self._channel_triplets(channels))
+
+    def _upsert_channels(self, conn: sqlite3.Connection, channels: list[Channel]):
+        last_id = self._last_channel_id(conn)
+        conn.executemany("""
+            INSERT INTO channels
+            (name, service_id, satellite, transponder_freq, transponder_pol,
+             video_pid, audio_pid, pcr_pid, pmt_pid,
+             channel_type, is_free, is_hd, provider, category,
+             service_type, transport_stream_id, original_network_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(satellite, transponder_freq, transponder_pol, service_id) DO UPDATE SET
+                name = excluded.name,
+                video_pid = excluded.video_pid,
+                audio_pid = excluded.audio_pid,
+                pcr_pid = excluded.pcr_pid,
+                pmt_pid = excluded.pmt_pid,
+                channel_type = excluded.channel_type,
+                is_free = excluded.is_free,
+                is_hd = excluded.is_hd,
+                provider = excluded.provider,
+                category = COALESCE(NULLIF(excluded.category, ''), category),
+                service_type = excluded.service_type,
+                transport_stream_id = excluded.transport_stream_id,
+                original_network_id = excluded.original_network_id,
+                last_updated = CURRENT_TIMESTAMP
+        """, [(
+            ch.name, ch.service_id, ch.satellite, ch.transponder_freq, ch.transponder_pol,
+            ch.video_pid, ch.audio_pid, ch.pcr_pid, ch.pmt_pid,
+            ch.channel_type, ch.is_free, ch.is_hd, ch.provider, ch.category,
+            ch.service_type, ch.transport_stream_id, ch.original_network_id,
+        ) for ch in channels])
+        if self.fts_enabled:
+            self._index_new_channels(conn, last_id)
+
+    def save_transponder(self, tp: Transponder, signal_quality: float = 0,
+                         satellite: str = DEFAULT_SATELLITE):
+        self.save_transponders([(tp, signal_quality, satellite)])
+
+    def save_transponders(self, transponders: list[tuple[Transponder, float, str]],
+                          muxes: Optional[dict] = None):
+        """
+        (Transponder, sinyal kalitesi, uydu) listesini tek transaction'da kaydet.
+
+        muxes: (uydu, frekans, pol) → MuxInfo; verilen transponderların TSID
+        ve PAT/SDT sürümleri de saklanır (artımlı tarama için).
+        """
+        with self._transaction() as conn:
+            self._upsert_transponders(conn, transponders, muxes)
+            # SNR değişimi tercih edilen kaynağı değiştirebilir
+            self._refresh_services(conn, self._transponder_triplets(
+                conn, {(sat, tp.frequency, tp.polarization) for tp, _, sat in transponders}))
+
+    @staticmethod
+    def _upsert_transponders(conn: sqlite3.Connection,
+                             transponders: list[tuple[Transponder, float, str]],
+                             muxes: Optional[dict] = None):
+        muxes = muxes or {}
+        rows = []
+        for tp, quality, satellite in transponders:
+            mux = muxes.get((satellite, tp.frequency, tp.polarization))
+            rows.append((
+                satellite, tp.frequency, tp.polarization, tp.symbol_rate, tp.fec,
+                tp.system, tp.modulation, quality,
+                mux.transport_stream_id if mux else None,
+                mux.original_network_id if mux else None,
+                mux.pat_version if mux else None,
+                mux.sdt_version if mux else None,
+            ))
+        conn.executemany("""
+            INSERT INTO transponders
+            (satellite, frequency, polarization, symbol_rate, fec, system, modulation,
+             signal_quality, transport_stream_id, original_network_id, pat_version, sdt_version)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(satellite, frequency, polarization) DO UPDATE SET
+                symbol_rate = excluded.symbol_rate,
+                fec = excluded.fec,
+                system = excluded.system,
+                modulation = excluded.modulation,
+                signal_quality = excluded.signal_quality,
+                transport_stream_id = COALESCE(excluded.transport_stream_id, transport_stream_id),
+                original_network_id = COALESCE(excluded.original_network_id, original_network_id),
+                pat_version = COALESCE(excluded.pat_version, pat_version),
+                sdt_version = COALESCE(excluded.sdt_version, sdt_version),
+                last_scanned = CURRENT_TIMESTAMP
+        """, rows)
+
+    def get_transponder_versions(self) -> dict:
+        """(uydu, frekans, pol) → (TSID, PAT sürümü, SDT sürümü); sürümü bilinenler."""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT satellite, frequency, polarization, transport_stream_id,
+                       pat_version, sdt_version
+                FROM transponders WHERE pat_version IS NOT NULL
+            """).fetchall()
+        return {(sat, f, p): (tsid, pat, sdt) for sat, f, p, tsid, pat, sdt in rows}
+
+    def sync_transponder_channels(self, frequency: int, polarization: str,
+                                  channels: list[Channel], satellite: str = DEFAULT_SATELLITE):
+        """
+        Bir transponder'ın kanallarını yeni listeyle eşitle.
+
+        Aynı service_id'li satırlar yerinde güncellenir (id, sıra, favori
+        korunur), yeniler eklenir, kaybolanlar silinir.
+        """
+        with self._transaction() as conn:
+            last_id = self._last_channel_id(conn)
+            dirty = self._transponder_triplets(conn, {(satellite, frequency, polarization)})
+            existing: dict[int, int] = {
+                sid: row_id for sid, row_id in conn.execute("""
+                    SELECT service_id, id FROM channels
+                    WHERE satellite = ? AND transponder_freq = ? AND transponder_pol = ?
+                """, (satellite, frequency, polarization))
+            }
+
+            updates, inserts = [], {}
             for ch in channels:
-                conn.execute("""
-                    INSERT OR REPLACE INTO channels
-                    (name, service_id, transponder_freq, transponder_pol,
-                     video_pid, audio_pid, pcr_pid, pmt_pid,
-                     channel_type, is_free, is_hd, provider, category)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    ch.name, ch.service_id, ch.transponder_freq, ch.transponder_pol,
-                    ch.video_pid, ch.audio_pid, ch.pcr_pid, ch.pmt_pid,
-                    ch.channel_type, ch.is_free, ch.is_hd, ch.provider, ch.category
-                ))
-
-    def save_transponder(self, tp: Transponder, signal_quality: float = 0):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO transponders
-                (frequency, polarization, symbol_rate, fec, system, modulation, signal_quality)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (tp.frequency, tp.polarization, tp.symbol_rate, tp.fec,
-                  tp.system, tp.modulation, signal_quality))
-
-    def get_all_channels(self, channel_type: Optional[str] = None) -> list[dict]:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            if channel_type:
-                rows = conn.execute(
-                    "SELECT * FROM channels WHERE channel_type = ? ORDER BY position, name",
-                    (channel_type,)
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM channels ORDER BY position, name"
-                ).fetchall()
+                values = (ch.name, ch.video_pid, ch.audio_pid, ch.pcr_pid, ch.pmt_pid,
+                          ch.channel_type, ch.is_free, ch.is_hd, ch.provider,
+                          ch.service_type, ch.transport_stream_id, ch.original_network_id)
+                row_id = existing.pop(ch.service_id, None)
+                if row_id is not None:
+                    updates.append(values + (row_id,))
+                else:
+                    inserts[ch.service_id] = (ch.service_id, satellite, frequency, polarization) + values
+
+            conn.executemany("""
+                UPDATE channels SET name = ?, video_pid = ?, audio_pid = ?, pcr_pid = ?, pmt_pid = ?,
+                    channel_type = ?, is_free = ?, is_hd = ?, provider = ?,
+                    service_type = ?, transport_stream_id = ?, original_network_id = ?,
+                    last_updated = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, updates)
+            conn.executemany("""
+                INSERT INTO channels
+                (service_id, satellite, transponder_freq, transponder_pol, name,
+                 video_pid, audio_pid, pcr_pid, pmt_pid, channel_type, is_free, is_hd, provider,
+                 service_type, transport_stream_id, original_network_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, list(inserts.values()))
+            if self.fts_enabled:
+                self._index_new_channels(conn, last_id)
+            conn.executemany("DELETE FROM channels WHERE id = ?",
+                             [(row_id,) for row_id in existing.values()])
+            self._refresh_services(conn, dirty | self._channel_triplets(channels))
+
+    # Tekil liste: üçlüsü indekslenmiş kanallardan sadece tercih edilen kaynak
+    _UNIQUE_FILTER = """
+        COALESCE((SELECT s.channel_id FROM services s
+                  WHERE s.original_network_id = c.original_network_id
+                    AND s.transport_stream_id = c.transport_stream_id
+                    AND s.service_id = c.service_id), c.id) = c.id
+    """
+
+    def _channel_query(self, channel_type: Optional[str], unique: bool) -> tuple[str, tuple]:
+        where, params = [], ()
+        if channel_type:
+            where.append("c.channel_type = ?")
+            params = (channel_type,)
+        if unique:
+            where.append(self._UNIQUE_FILTER)
+        query = "SELECT c.* FROM channels c"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        return query + " ORDER BY c.position, c.name", params
+
+    def get_all_channels(self, channel_type: Optional[str] = None,
+                         unique: bool = False) -> list[dict]:
+        """unique=True: aynı servisin diğer transponder/uydulardaki kopyaları hariç."""
+        with self._lock:
+            rows = self.conn.execute(*self._channel_query(channel_type, unique)).fetchall()
             return [dict(row) for row in rows]
 
-    def search_channels(self, query: str) -> list[dict]:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                "SELECT * FROM channels WHERE name LIKE ? ORDER BY name",
-                (f"%{query}%",)
+    def iter_channels(self, channel_type: Optional[str] = None, batch: int = EXPORT_BATCH,
+                      unique: bool = False) -> Iterator[sqlite3.Row]:
+        """
+        Kanalları get_all_channels() sırasıyla parça parça döndür.
+
+        Ayrı bir okuma bağlantısı kullanılır: WAL anlık görüntüsü okunurken
+        tarama yazımları beklemez ve paylaşılan bağlantının kilidi tutulmaz.
+        Bellekte en fazla `batch` satır bulunur.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            cursor = conn.execute(*self._channel_query(channel_type, unique))
+            while True:
+                rows = cursor.fetchmany(batch)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+
+    def count_by_type(self, unique: bool = False) -> dict[str, int]:
+        """Kanal türü → kanal sayısı."""
+        where = f"WHERE {self._UNIQUE_FILTER}" if unique else ""
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT c.channel_type, COUNT(*) FROM channels c {where} GROUP BY c.channel_type"
+            ).fetchall()
+        return {channel_type: count for channel_type, count in rows}
+
+    def search_channels(self, query: str, limit: int = -1) -> list[dict]:
+        """
+        Ad, sağlayıcı ve kategoride önek araması; en iyi eşleşme önce.
+
+        Her kelime bir önektir ve hepsi eşleşmelidir: "cnn tü" → CNN Türk.
+        Önek eşleşmesi yoksa katlanmış adda alt dize aranır ("türk" →
+        Habertürk).
+        """
+        if not self.fts_enabled:
+            return self._search_like(query, limit)
+
+        match = fts_query(query)
+        if not match:
+            return []
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT c.* FROM channels_fts
+                JOIN channels c ON c.id = channels_fts.rowid
+                WHERE channels_fts MATCH ?
+                ORDER BY bm25(channels_fts, ?, ?, ?), c.name
+                LIMIT ?
+            """, (match, *self.FTS_WEIGHTS, limit)).fetchall()
+        if not rows:
+            return self._search_like(query, limit)
+        return [dict(row) for row in rows]
+
+    def _search_like(self, query: str, limit: int = -1) -> list[dict]:
+        """Tam tarama (katlanmış ad üzerinde): FTS5 yoksa ya da önek bulunamazsa."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM channels WHERE tr_fold(name) LIKE ? ORDER BY name LIMIT ?",
+                (f"%{fold_turkish(query).strip()}%", limit)
             ).fetchall()
             return [dict(row) for row in rows]
 
     def get_channel_count(self) -> dict:
-        with sqlite3.connect(self.db_path) as conn:
-            total = conn.execute("SELECT COUNT(*) FROM channels").fetchone()[0]
-            tv = conn.execute("SELECT COUNT(*) FROM channels WHERE channel_type='TV'").fetchone()[0]
-            radio = conn.execute("SELECT COUNT(*) FROM channels WHERE channel_type='Radio'").fetchone()[0]
-            hd = conn.execute("SELECT COUNT(*) FROM channels WHERE is_hd=1").fetchone()[0]
-            fta = conn.execute("SELECT COUNT(*) FROM channels WHERE is_free=1").fetchone()[0]
-            return {"total": total, "tv": tv, "radio": radio, "hd": hd, "fta": fta}
+        """Tüm sayaçlar tek tablo taramasında."""
+        with self._lock:
+            row = self.conn.execute("""
+                SELECT COUNT(*) AS total,
+                       COALESCE(SUM(channel_type = 'TV'), 0) AS tv,
+                       COALESCE(SUM(channel_type = 'Radio'), 0) AS radio,
+                       COALESCE(SUM(is_hd = 1), 0) AS hd,
+                       COALESCE(SUM(is_free = 1), 0) AS fta,
+                       COUNT(*) - (SELECT COALESCE(SUM(sources - 1), 0) FROM services) AS unique_services
+                FROM channels
+            """).fetchone()
+        return dict(row)
+
+    # ─── Tarama oturumları (kaldığı yerden devam) ───
+
+    def create_scan_session(self, mode: str, params: dict, items: list[PlanItem]) -> int:
+        """
+        Yeni tarama oturumu ve aday listesini kaydet.
+
+        Aynı moddaki yarım kalmış oturumlar 'abandoned' olarak kapatılır.
+        """
+        with self._transaction() as conn:
+            self._close_sessions(conn, "mode = ? AND status = 'running'", (mode,), "abandoned")
+            session_id = conn.execute(
+                "INSERT INTO scan_sessions (mode, params, total) VALUES (?, ?, ?)",
+                (mode, json.dumps(params, sort_keys=True), len(items))
+            ).lastrowid
+            conn.executemany("""
+                INSERT INTO scan_candidates
+                (session_id, position, frequency, polarization, symbol_rate, fec,
+                 system, modulation, note, satellite, diseqc_port)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (session_id, position, item.transponder.frequency, item.transponder.polarization,
+                 item.transponder.symbol_rate, item.transponder.fec, item.transponder.system,
+                 item.transponder.modulation, item.transponder.note,
+                 item.satellite, item.diseqc_port)
+                for position, item in enumerate(items)
+            ])
+        return session_id
+
+    def find_scan_session(self, mode: str, params: dict) -> Optional[dict]:
+        """Aynı mod ve parametrelerle yarım kalmış son oturum."""
+        with self._lock:
+            row = self.conn.execute("""
+                SELECT * FROM scan_sessions
+                WHERE mode = ? AND params = ? AND status = 'running'
+                ORDER BY id DESC LIMIT 1
+            """, (mode, json.dumps(params, sort_keys=True))).fetchone()
+        return dict(row) if row else None
+
+    def pending_scan_candidates(self, session_id: int) -> list[tuple[int, PlanItem]]:
+        """Oturumun henüz taranmamış adayları: (sıra, PlanItem)."""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT * FROM scan_candidates
+                WHERE session_id = ? AND status = 'pending' ORDER BY position
+            """, (session_id,)).fetchall()
+        return [
+            (r["position"], PlanItem(
+                Transponder(r["frequency"], r["polarization"], r["symbol_rate"], r["fec"],
+                            r["system"], r["modulation"], r["note"]),
+                r["satellite"], r["diseqc_port"]))
+            for r in rows
+        ]
+
+    def scan_coverage(self, session_id: int) -> dict[tuple[str, str, bool], float]:
+        """
+        Oturumun tamamlanan adaylarından taranmış üst sınırlar:
+        (uydu, pol, high band) → MHz (uyarlamalı blind scan sürdürülürken).
+        """
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT satellite, polarization, frequency, covered FROM scan_candidates
+                WHERE session_id = ? AND status != 'pending' AND covered IS NOT NULL
+            """, (session_id,)).fetchall()
+        coverage: dict[tuple[str, str, bool], float] = {}
+        for r in rows:
+            key = (r["satellite"], r["polarization"], r["frequency"] >= LNB_UNIVERSAL["switch_freq"])
+            coverage[key] = max(coverage.get(key, r["covered"]), r["covered"])
+        return coverage
+
+    def checkpoint_scan(self, session_id: int, finished: list[tuple[int, str, int, Optional[float]]],
+                        result: ScanResult):
+        """
+        Tamamlanan adayları ve bulunan kanalları tek transaction'da yaz.
+
+        finished: (sıra, durum, kanal sayısı, taranan üst sınır). Aday ancak kanallarıyla birlikte
+        "tamamlandı" olur; kesintide en fazla son yarım grup tekrar taranır.
+        """
+        with self._transaction() as conn:
+            dirty = self._transponder_triplets(conn, self._channel_transponders(result.channels) | {
+                (sat, tp.frequency, tp.polarization) for tp, _, sat in result.locked_transponders})
+            self._upsert_transponders(conn, result.locked_transponders, result.muxes)
+            self._upsert_channels(conn, result.channels)
+            self._refresh_services(conn, dirty | self._channel_triplets(result.channels))
+            conn.executemany("""
+                UPDATE scan_candidates SET status = ?, channels = ?, covered = ?
+                WHERE session_id = ? AND position = ?
+            """, [(status, count, covered, session_id, position)
+                  for position, status, count, covered in finished])
+            conn.execute("""
+                UPDATE scan_sessions SET
+                    completed = (SELECT COUNT(*) FROM scan_candidates
+                                 WHERE session_id = ? AND status != 'pending'),
+                    channels_found = channels_found + ?,
+                    updated = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (session_id, len(result.channels), session_id))
+
+    def finish_scan_session(self, session_id: int, status: str = "done"):
+        """Oturumu kapat; aday satırları silinir, özet satırı kalır."""
+        with self._transaction() as conn:
+            self._close_sessions(conn, "id = ?", (session_id,), status)
+
+    @staticmethod
+    def _close_sessions(conn: sqlite3.Connection, where: str, params: tuple, status: str):
+        ids = [(r[0],) for r in conn.execute(f"SELECT id FROM scan_sessions WHERE {where}", params)]
+        conn.executemany("DELETE FROM scan_candidates WHERE session_id = ?", ids)
+        conn.executemany(
+            "UPDATE scan_sessions SET status = ?, updated = CURRENT_TIMESTAMP WHERE id = ?",
+            [(status, session_id) for (session_id,) in ids])
+
+    # ─── Kilit geçmişi (uyarlamalı blind scan) ───
+
+    def lock_history(self, satellite: str) -> dict[tuple[int, str], list[int]]:
+        """Uydudaki önceki tune denemeleri: (symbol rate, sistem) → [deneme, kilit]."""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT symbol_rate, system, attempts, locks FROM lock_history
+                WHERE satellite = ?
+            """, (satellite,)).fetchall()
+        return {(r["symbol_rate"], r["system"]): [r["attempts"], r["locks"]] for r in rows}
+
+    def record_lock_history(self, satellite: str, counts: dict[tuple[int, str], list[int]]):
+        """Deneme/kilit sayılarını geçmişe ekle."""
+        with self._transaction() as conn:
+            conn.executemany("""
+                INSERT INTO lock_history (satellite, symbol_rate, system, attempts, locks)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(satellite, symbol_rate, system) DO UPDATE SET
+                    attempts = attempts + excluded.attempts,
+                    locks = locks + excluded.locks,
+                    updated = CURRENT_TIMESTAMP
+            """, [(satellite, sr, system, attempts, locks)
+                  for (sr, system), (attempts, locks) in counts.items()])
+
+
+class ScanCheckpoint:
+    """
+    Tarama ilerlemesini CHECKPOINT_BATCH adayda bir veritabanına yazar.
+
+    Yazılan kanallar ScanResult'tan bırakılır; uzun blind scan'lerde bellek
+    kullanımı sabit kalır (sayaçlar ve süre ölçümleri korunur).
+    """
+
+    def __init__(self, db: ChannelDatabase, session_id: int, result: ScanResult,
+                 total: int, batch_size: int = CHECKPOINT_BATCH):
+        self.db = db
+        self.session_id = session_id
+        self.result = result
+        self.total = total
+        self.batch_size = batch_size
+        self._finished: list[tuple[int, str, int, Optional[float]]] = []
+
+    def done(self, position: int, locked: bool, channels: int, covered: Optional[float] = None):
+        status = "locked" if locked else "no_lock"
+        self._finished.append((position, status, channels, covered))
+        if len(self._finished) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._finished and not self.result.channels:
+            return
+        self.db.checkpoint_scan(self.session_id, self._finished, self.result)
+        self.result.clear_buffers()
+        self._finished = []
+
+    def close(self, completed: bool):
+        """Kalanları yaz; tüm adaylar bittiyse oturumu kapat."""
+        self.flush()
+        if completed:
+            self.db.finish_scan_session(self.session_id)
+        else:
+            print(f"\n💾 Tarama oturumu #{self.session_id} kaydedildi, "
+                  f"--resume ile kaldığı yerden devam edilebilir")
 
 
 # ─── Tarama Motoru ───────────────────────────────────────────────────────────
 
+# Kilit beklemesi bitince: (transponder, bekleme sonucu, sinyal istatistiği | None)
+LockCallback = Callable[[Transponder, LockWaitResult, Optional[SignalStats]], None]
+
+
 class DVBScanner:
     """DVB-S/S2 transponder tarama motoru."""
 
-    def __init__(self, adapter: DVBAdapter, db: ChannelDatabase):
+    def __init__(self, adapter: DVBAdapter, db: ChannelDatabase, diseqc=None):
         self.adapter = adapter
         self.db = db
+        self.diseqc = diseqc            # DiSEqCController (isteğe bağlı)
+        self.satellite = DEFAULT_SATELLITE      # Taranan transponder'ın uydusu
+        self.planner = ScanPlanner()
+        self.psi = PSIScanner()
         self.scan_result = ScanResult()
+        self._diseqc_port: Optional[int] = None
+        self._lock_history: dict[str, dict] = {}        # uydu → (SR, sistem) → [deneme, kilit]
+        self._pending_history: dict[str, dict] = {}     # Henüz yazılmamış denemeler
+        self._covered: dict[tuple, float] = {}      # (uydu, pol, high band) → taranan üst sınır
+
+    @staticmethod
+    def known_transponders() -> list[Transponder]:
+        """NIT taramasından kaydedilmiş güncel liste, yoksa statik JSON listesi."""
+        if NIT_TRANSPONDER_DB.exists():
+            return DVBScanner.load_transponders(NIT_TRANSPONDER_DB)
+        return DVBScanner.load_transponders()
+
+    @staticmethod
+    def save_transponder_list(transponders: list[Transponder],
+                              json_path: Optional[Path] = None) -> Path:
+        """Transponder listesini turksat_transponders.json biçiminde yaz."""
+        json_path = json_path or NIT_TRANSPONDER_DB
+        with open(TRANSPONDER_DB) as f:
+            satellite = json.load(f)["satellite"]
+        data = {
+            "satellite": satellite,
+            "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "transponders": [
+                {"freq": tp.frequency, "pol": tp.polarization, "sr": tp.symbol_rate,
+                 "fec": tp.fec, "system": tp.system, "modulation": tp.modulation,
+                 "note": tp.note}
+                for tp in transponders
+            ],
+        }
+        json_path.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+        return json_path
 
-    def load_transponders(self, json_path: Path = TRANSPONDER_DB) -> list[Transponder]:
+    @staticmethod
+    def load_transponders(json_path: Path = TRANSPONDER_DB) -> list[Transponder]:
         """Transponder listesini JSON'dan yükle."""
         with open(json_path) as f:
             data = json.load(f)
@@ -365,107 +1487,163 @@ class DVBScanner:
         output_path.write_text("\n".join(lines))
         return output_path
 
-    def scan_transponder(self, tp: Transponder, timeout: int = 10) -> list[Channel]:
-        """Tek bir transponder'ı tara ve kanalları bul."""
+    def _unsupported(self, tp: Transponder) -> str:
+        """Tuner bu transponder'ı tune edemiyorsa nedeni (yetenekler bilinmiyorsa boş)."""
+        caps = self.adapter.capabilities()
+        return caps.unsupported(tp) if caps is not None else ""
+
+    def _select_port(self, item: PlanItem):
+        """Plan öğesinin uydusunu seç, DiSEqC portuna geç (sadece port değiştiğinde)."""
+        self.satellite = item.satellite
+        if self.diseqc is None or item.diseqc_port == self._diseqc_port:
+            return
+        tp = item.transponder
+        self.diseqc.switch_port_1_0(item.diseqc_port, tp.polarization, tp.is_high_band)
+        self._diseqc_port = item.diseqc_port
+
+    def scan_item(self, item: PlanItem, known: Optional[dict] = None,
+                  on_lock: Optional[LockCallback] = None) -> list[Channel]:
+        """
+        Plan öğesini tara: uydu/DiSEqC portunu seç, transponder'ı tara.
+
+        known: (uydu, frekans, pol) → kayıtlı sürümler (artımlı tarama).
+        """
+        tp = item.transponder
+        self._select_port(item)
+        versions = known.get((item.satellite, tp.frequency, tp.polarization)) if known else None
+        return self.scan_transponder(tp, known_versions=versions, on_lock=on_lock)
+
+    def scan_transponder(self, tp: Transponder, timeout: Optional[float] = None,
+                         known_versions: Optional[tuple] = None,
+                         want_nit: bool = False,
+                         on_lock: Optional[LockCallback] = None) -> list[Channel]:
+        """
+        Tek bir transponder'ı tara ve kanalları bul.
+
+        timeout verilmezse kilitlenme süresi symbol rate'e göre ölçeklenir.
+        known_versions (TSID, PAT sürümü, SDT sürümü) verilirse önce sadece
+        sürümler okunur; değişmemişse PMT/SDT ayrıştırılmaz ve transponder
+        scan_result.unchanged'a eklenir. want_nit ile aynı kilitte NIT de
+        okunur (scan_result.muxes[...].nit). on_lock kilit beklemesi biter
+        bitmez (PSI okunmadan) çağrılır; sinyal istatistiği sadece kilitte.
+        Cihaz hatası (OSError) TuneTiming.reason'a yazılır; frontend aygıtı
+        yoksa (FileNotFoundError) hata yükseltilir ve tarama durur.
+        """
         channels = []
 
+        reason = self._unsupported(tp)
+        if reason:
+            self.scan_result.skipped += 1
+            print(f"  ⏭️  Atlandı: {tp.frequency} MHz {tp.polarization} ({reason})")
+            return channels
+
         print(f"  📡 Taranıyor: {tp.frequency} MHz {tp.polarization} "
               f"SR:{tp.symbol_rate} {tp.system} {tp.modulation}")
 
-        # dvbv5-zap ile transponder'a kilitlenme denemesi
-        zap_cmd = [
-            "dvbv5-zap",
-            "-a", str(self.adapter.adapter_num),
-            "-c", "/dev/null",
-            "-S", str(timeout),
-            "-r",  # record mode (lock only)
-            "--lnbf=UNIVERSAL",
-        ]
-
-        # Transponder parametreleri
-        tune_cmd = [
-            "dvb-fe-tool",
-            "-a", str(self.adapter.adapter_num),
-            "--set-delsys", tp.system.replace("-", ""),
-            "--freq", str(tp.if_frequency * 1000),  # kHz
-            "--sr", str(tp.symbol_rate * 1000),
-            "--fec", tp.fec.replace("/", ""),
-            "--modulation", tp.modulation,
-            "--voltage", str(tp.voltage),
-        ]
-        if tp.tone:
-            tune_cmd.append("--tone=on")
+        timing = TuneTiming(tp.frequency, tp.polarization, tp.symbol_rate, tp.system)
+        frontend = self.adapter.frontend
+        clock = frontend.clock
+        start = clock()
 
         try:
-            # Transponder'a kilitle
-            result = subprocess.run(
-                tune_cmd,
-                capture_output=True, text=True, timeout=timeout + 5
-            )
-
-            # Sinyal kontrolü
-            time.sleep(2)
-            stats = self.adapter.get_signal_stats()
-
-            if stats.get("locked"):
+            # Transponder'a kilitle (ioctl, frontend açık kalır)
+            frontend.tune(tp)
+            timing.tune_ms = (clock() - start) * 1000
+
+            # Olay/durum tabanlı kilit bekleme (erken çıkış / erken vazgeçme)
+            wait = frontend.wait_for_lock(tp.symbol_rate, timeout)
+            timing.wait_ms = wait.elapsed * 1000
+            timing.signal_ms = _ms(wait.signal_time)
+            timing.carrier_ms = _ms(wait.carrier_time)
+            timing.lock_ms = _ms(wait.lock_time)
+            timing.locked = wait.locked
+            timing.reason = wait.reason
+            stats = frontend.read_stats() if wait.locked else None
+            if on_lock is not None:
+                on_lock(tp, wait, stats)
+
+            if wait.locked:
                 self.scan_result.transponders_locked += 1
-                print(f"    ✅ Kilitlendi! SNR: {stats.get('snr', 'N/A')}")
+                print(f"    ✅ Kilitlendi! ({timing.lock_ms:.0f} ms) SNR: {stats.snr:.1f} dB")
 
-                # PAT/PMT taraması ile kanal keşfi
-                found = self._parse_pat_pmt(tp)
-                channels.extend(found)
-                self.db.save_transponder(tp, float(stats.get("snr", "0").replace("dB", "")))
+                parse_start = clock()
+                if known_versions is not None and self._versions_unchanged(known_versions):
+                    timing.parse_ms = (clock() - parse_start) * 1000
+                    self.scan_result.unchanged.append(tp)
+                    print("    ⏭️  PAT/SDT sürümü değişmedi")
+                else:
+                    # PAT/PMT/SDT section'ları ile kanal keşfi
+                    found = self._parse_psi(tp, want_nit)
+                    timing.parse_ms = (clock() - parse_start) * 1000
+                    channels.extend(found)
+                    self.scan_result.locked_transponders.append((tp, stats.snr, self.satellite))
             else:
-                print(f"    ❌ Kilitlenemedi")
-
-        except subprocess.TimeoutExpired:
-            print(f"    ⏰ Zaman aşımı")
-        except FileNotFoundError:
-            print(f"    ⚠️  dvb-fe-tool bulunamadı (simülasyon modunda)")
-            # Simülasyon: gerçek donanım olmadan test için
-            channels = self._simulate_channels(tp)
-
+                print(f"    ❌ Kilitlenemedi ({wait.reason}, {timing.wait_ms:.0f} ms)")
+
+        except FileNotFoundError as e:
+            # Frontend aygıtı yok: taramayı durdur. Sanal kanallar yalnızca
+            # --simulate ile (simulation_frontend) üretilir.
+            print(f"    ❌ Frontend bulunamadı: {e}")
+            raise
+        except OSError as e:
+            timing.reason = str(e)
+            print(f"    ⚠️  Frontend hatası: {e}")
+
+        timing.total_ms = (clock() - start) * 1000
+        self.scan_result.timings.append(timing)
         self.scan_result.transponders_scanned += 1
         return channels
 
-    def _parse_pat_pmt(self, tp: Transponder) -> list[Channel]:
-        """PAT/PMT tablolarını parse ederek kanalları bul."""
-        channels = []
-
+    def _versions_unchanged(self, known_versions: tuple) -> bool:
+        source = self.adapter.frontend.section_source()
         try:
-            # dvbv5-scan ile otomatik kanal keşfi
-            scan_file = SCRIPT_DIR / "temp_scan.conf"
-            self.generate_dvbv5_scan_file([tp], scan_file)
-
-            result = subprocess.run(
-                [
-                    "dvbv5-scan",
-                    "-a", str(self.adapter.adapter_num),
-                    "-o", str(SCRIPT_DIR / "temp_channels.conf"),
-                    str(scan_file),
-                ],
-                capture_output=True, text=True, timeout=30
-            )
-
-            # Çıktıyı parse et
-            for line in result.stdout.splitlines():
-                if "Service" in line and ":" in line:
-                    parts = line.split(":")
-                    if len(parts) >= 2:
-                        ch = Channel(
-                            name=parts[1].strip(),
-                            service_id=0,
-                            transponder_freq=tp.frequency,
-                            transponder_pol=tp.polarization,
-                        )
-                        channels.append(ch)
-
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+            mux = self.psi.read_versions(source)
+        finally:
+            source.close()
+        return mux.pat_version is not None and mux.versions == tuple(known_versions)
+
+    def _parse_psi(self, tp: Transponder, want_nit: bool = False) -> list[Channel]:
+        """PAT/PMT/SDT (ve istenirse NIT) section'larını okuyup kanalları çıkar."""
+        source = self.adapter.frontend.section_source()
+        try:
+            mux = self.psi.scan(source, want_nit=want_nit)
+        finally:
+            source.close()
+        self.scan_result.muxes[(self.satellite, tp.frequency, tp.polarization)] = mux
+
+        if mux.crc_errors:
+            print(f"    ⚠️  {mux.crc_errors} section CRC hatası")
+        print(f"    📋 TSID {mux.transport_stream_id} / ONID {mux.original_network_id}: "
+              f"{len(mux.services)} servis ({mux.sections_read} section)")
+        return [Channel.from_service(svc, tp, mux, self.satellite) for svc in mux.services]
+
+    @classmethod
+    def simulation_frontend(cls, transponders: Optional[list[Transponder]] = None,
+                            clock: Optional[VirtualClock] = None) -> FakeFrontend:
+        """
+        Simülasyon kanallarını yayınlayan sanal frontend.
 
-        return channels
+        Kanallar PAT/PMT/SDT karuseli olarak sunulur, yani tarama gerçek PSI
+        ayrıştırma yolundan geçer. Sanal saat sayesinde beklemesiz çalışır.
+        """
+        if transponders is None:
+            transponders = cls.load_transponders()
+        clock = clock or VirtualClock()
+        nit = build_nit(1, "Türksat", [
+            (i + 1, 1, build_satellite_delivery(tp.frequency, tp.polarization, tp.symbol_rate,
+                                                tp.fec, tp.system, tp.modulation))
+            for i, tp in enumerate(transponders)
+        ])
+        carriers = [
+            FakeCarrier(tp.frequency, tp.polarization, tp.symbol_rate, tp.system,
+                        channels=cls._simulate_channels(tp), transport_stream_id=i + 1,
+                        nit_sections=nit)
+            for i, tp in enumerate(transponders)
+        ]
+        return FakeFrontend(carriers, clock=clock, sleep=clock.sleep)
 
-    def _simulate_channels(self, tp: Transponder) -> list[Channel]:
+    @staticmethod
+    def _simulate_channels(tp: Transponder) -> list[Channel]:
         """Simülasyon modu - donanım olmadan test için örnek kanallar."""
         simulated = {
             10970: [
@@ -530,277 +1708,885 @@ class DVBScanner:
             Channel(f"Servis_{tp.frequency}_{tp.polarization}_2", 9901, tp.frequency, tp.polarization),
         ])
 
-    def scan_turksat(self, progress_callback=None) -> ScanResult:
-        """Türksat 42°E bilinen transponder taraması."""
+    def _open_session(self, mode: str, params: dict, resume: bool,
+                      build_plan: Callable[[], Optional[ScanPlan]]) -> Optional[tuple]:
+        """
+        Kontrol noktalı tarama oturumu aç → (ScanCheckpoint, [(sıra, PlanItem)]).
+
+        resume ise aynı mod/parametrelerle yarım kalmış oturumun bekleyen
+        adayları döner ve uyarlamalı taramanın kapsadığı aralıklar tamamlanan
+        adaylardan geri yüklenir; yoksa build_plan() ile yeni oturum açılır.
+        Plan üretilemezse None.
+        """
+        session = self.db.find_scan_session(mode, params) if resume else None
+        if session is not None:
+            print(f"\n♻️  Oturum #{session['id']} sürdürülüyor: "
+                  f"{session['completed']}/{session['total']} aday tamamlanmış, "
+                  f"{session['channels_found']} kanal kayıtlı")
+            self._covered = self.db.scan_coverage(session["id"])
+            checkpoint = ScanCheckpoint(self.db, session["id"], self.scan_result, session["total"])
+            return checkpoint, self.db.pending_scan_candidates(session["id"])
+        if resume:
+            print("\nℹ️  Yarım kalmış oturum yok, yeni tarama başlatılıyor")
+
+        self._covered.clear()
+        plan = build_plan()
+        if plan is None:
+            return None
+        items = plan.items
+        session_id = self.db.create_scan_session(mode, params, items)
+        return ScanCheckpoint(self.db, session_id, self.scan_result, len(items)), list(enumerate(items))
+
+    def _run_items(self, items: list[tuple[int, PlanItem]],
+                   probe: Callable[[int, PlanItem], list[Channel]],
+                   checkpoint: Optional[ScanCheckpoint] = None):
+        """Adayları sırayla tara; sonuçlar (varsa) kontrol noktasına işlenir."""
+        completed = False
+        try:
+            for position, item in items:
+                self._run_item(position, item, probe, checkpoint)
+            completed = True
+        finally:
+            self._finish_items(checkpoint, completed)
+
+    def _run_item(self, position: int, item: PlanItem,
+                  probe: Callable[[int, PlanItem], list[Channel]],
+                  checkpoint: Optional[ScanCheckpoint] = None) -> list[Channel]:
+        """Tek adayı tara; denemeler kilit geçmişine, sonuç kontrol noktasına işlenir."""
+        locked_before = self.scan_result.transponders_locked
+        mark = len(self.scan_result.timings)
+        channels = probe(position, item)
+        self._record_trials(item.satellite, self.scan_result.timings[mark:])
+        self.scan_result.add_channels(channels)
+        if checkpoint is not None:
+            locked = self.scan_result.transponders_locked > locked_before
+            checkpoint.done(position, locked, len(channels),
+                            self._covered.get(self._covered_key(item)))
+        return channels
+
+    def _finish_items(self, checkpoint: Optional[ScanCheckpoint], completed: bool):
+        """Kilit geçmişini ve kontrol noktasında kalanları yaz."""
+        self._flush_trials()
+        if checkpoint is not None:
+            checkpoint.close(completed)
+
+    # ─── Kilit geçmişi ───
+
+    def _history(self, satellite: str) -> dict:
+        if satellite not in self._lock_history:
+            self._lock_history[satellite] = self.db.lock_history(satellite)
+        return self._lock_history[satellite]
+
+    def _record_trials(self, satellite: str, timings: list[TuneTiming]):
+        """Tune denemelerini geçmişe işle (bellekte hemen, veritabanına tarama sonunda)."""
+        if not timings:
+            return
+        history = self._history(satellite)
+        pending = self._pending_history.setdefault(satellite, {})
+        for t in timings:
+            for counts in (history, pending):
+                entry = counts.setdefault((t.symbol_rate, t.system), [0, 0])
+                entry[0] += 1
+                entry[1] += t.locked
+
+    def _flush_trials(self):
+        for satellite, counts in self._pending_history.items():
+            self.db.record_lock_history(satellite, counts)
+        self._pending_history.clear()
+
+    def _ranked_trials(self, satellite: str) -> list[tuple[int, str]]:
+        """
+        Blind scan symbol rate × sistem denemeleri, olasıdan olası olmayana.
+
+        Olasılık, bu uyduda kilitlenen taşıyıcılar içindeki payın Laplace
+        düzeltmeli tahminidir: (kilit + 1) / (toplam kilit + kombinasyon
+        sayısı). Geçmiş yoksa geniş symbol rate'ler önce denenir.
+        """
+        history = self._history(satellite)
+        trials = [(sr, system) for sr in sorted(COMMON_SYMBOL_RATES, reverse=True)
+                  for system in BLIND_SYSTEMS]
+        trials += sorted(k for k in history if k not in trials and k[1] in BLIND_SYSTEMS)
+        total = sum(locks for _, locks in history.values())
+
+        def probability(trial: tuple[int, str]) -> float:
+            return (history.get(trial, (0, 0))[1] + 1) / (total + len(trials))
+
+        return sorted(trials, key=probability, reverse=True)
+
+    def scan_turksat(self, progress_callback=None, plan: Optional[ScanPlan] = None,
+                     incremental: bool = False, resume: bool = False) -> ScanResult:
+        """
+        Türksat 42°E bilinen transponder taraması.
+
+        Sonuçlar CHECKPOINT_BATCH transponderda bir kaydedilir; resume ile
+        yarım kalmış son tarama kaldığı yerden sürdürülür.
+
+        incremental: PAT/SDT sürümü kayıtlı değerle aynı olan muxlar yeniden
+        ayrıştırılmaz; sadece değişen muxların kanalları güncellenir ve
+        eklenen/silinen/taşınan servisler raporlanır (fark hesabı için tüm
+        sonuç bellekte tutulur, kontrol noktası kullanılmaz).
+        """
         print("=" * 60)
-        print("  APEXSAT AI - Türksat 42°E Kanal Tarama")
+        print("  APEXSAT AI - Türksat 42°E Kanal Tarama"
+              + (" (artımlı)" if incremental else ""))
         print("=" * 60)
 
-        transponders = self.load_transponders()
-        total = len(transponders)
         start_time = time.time()
-        all_channels = []
+        checkpoint, items, total, known = self.open_turksat_scan(plan, incremental, resume)
 
-        print(f"\n📋 Toplam {total} transponder taranacak\n")
-
-        for i, tp in enumerate(transponders, 1):
+        def probe(position: int, item: PlanItem) -> list[Channel]:
+            i = position + 1
             if progress_callback:
-                progress_callback(i, total, tp)
+                progress_callback(i, total, item.transponder)
 
             pct = (i / total) * 100
             print(f"\n[{i}/{total}] ({pct:.0f}%) ───────────────────────────")
 
-            channels = self.scan_transponder(tp)
-            all_channels.extend(channels)
-
-            for ch in channels:
-                if ch.channel_type == "TV":
-                    self.scan_result.tv_channels += 1
-                elif ch.channel_type == "Radio":
-                    self.scan_result.radio_channels += 1
-                else:
-                    self.scan_result.data_services += 1
-
+            channels = self.scan_item(item, known)
             print(f"    Bulunan: {len(channels)} kanal")
+            return channels
 
-        self.scan_result.channels = all_channels
-        self.scan_result.channels_found = len(all_channels)
+        self._run_items(items, probe, checkpoint)
         self.scan_result.scan_duration = time.time() - start_time
 
-        # Veritabanına kaydet
-        self.db.save_channels(all_channels)
+        # Kontrol noktası kullanılmadıysa veritabanına burada kaydet
+        if incremental:
+            self.save_incremental()
 
         self._print_scan_summary()
         return self.scan_result
 
-    def blind_scan(self, pol: str = "both") -> ScanResult:
-        """Blind scan - tüm Ku-Band frekans aralığını tara."""
+    def open_turksat_scan(self, plan: Optional[ScanPlan] = None, incremental: bool = False,
+                          resume: bool = False) -> tuple[Optional[ScanCheckpoint], list, int, dict]:
+        """
+        Türksat taramasını hazırla → (kontrol noktası, [(sıra, PlanItem)], toplam, sürümler).
+
+        Artımlı taramada kontrol noktası yoktur (None); sürümler
+        scan_item(known=...) için kayıtlı PAT/SDT sürümleridir.
+        """
+        known = self.db.get_transponder_versions() if incremental else {}
+
+        def build_plan() -> ScanPlan:
+            if plan is not None:
+                return plan
+            transponders = [tp for tp in self.known_transponders() if not self._unsupported(tp)]
+            new_plan = self.planner.plan(transponders)
+            naive = estimate_switching_cost(PlanItem(tp) for tp in transponders)
+            print(f"\n🔀 LNB geçiş tahmini: {naive.seconds:.2f}s (liste sırası) → "
+                  f"{new_plan.switching_cost().seconds:.2f}s (plan)")
+            return new_plan
+
+        if incremental:
+            checkpoint, items = None, list(enumerate(build_plan().items))
+            total = len(items)
+        else:
+            checkpoint, items = self._open_session("turksat", {}, resume, build_plan)
+            total = checkpoint.total
+
+        print(f"\n📋 Toplam {len(items)} transponder taranacak\n")
+        return checkpoint, items, total, known
+
+    def blind_scan(self, pol: str = "both", method: str = "spectrum",
+                   resume: bool = False) -> ScanResult:
+        """
+        Blind scan - tüm Ku-Band frekans aralığını tara.
+
+        method="spectrum": Önce hızlı güç taraması ile spektrum çıkarılır,
+        sadece bulunan taşıyıcılar tahmini symbol rate ile tune edilir.
+        method="step": Frekans × symbol rate × sistem kaba kuvvet taraması.
+        method="adaptive": Kaba adımda FE_HAS_SIGNAL ile sinyal aranır, sadece
+        sinyalli bölgeler ince adımla ve geçmiş kilit olasılığı sırasındaki
+        symbol rate/sistem denemeleriyle taranır.
+
+        Adaylar ve bulunan kanallar parça parça kaydedilir; resume ile yarım
+        kalan tarama (spektrum taraması tekrarlanmadan) sürdürülür.
+        """
         print("=" * 60)
         print("  APEXSAT AI - Blind Scan (Ku-Band)")
         print("=" * 60)
 
+        polarizations = ["H", "V"] if pol == "both" else [pol.upper()]
+        start_time = time.time()
+
+        if method == "step":
+            build_plan, probe = (lambda: self._blind_step_plan(polarizations)), self._probe_step
+        elif method == "adaptive":
+            build_plan = lambda: self._blind_adaptive_plan(polarizations)
+            probe = self._probe_adaptive
+        else:
+            build_plan, probe = (lambda: self._blind_spectrum_plan(polarizations)), self._probe_spectrum
+
+        opened = self._open_session("blind", {"pol": pol, "method": method}, resume, build_plan)
+        if opened is not None:
+            checkpoint, items = opened
+            print(f"\n📋 Toplam {len(items)} aday taranacak\n")
+            self._run_items(items, lambda position, item: probe(position, item, checkpoint.total),
+                            checkpoint)
+
+        self.scan_result.scan_duration = time.time() - start_time
+        self._print_scan_summary()
+        return self.scan_result
+
+    def sweep_spectrum(self, polarization: str) -> tuple[list[int], list[float]]:
+        """Ku-Band güç taraması (kilit beklenmeden AGC okuması)."""
+        start_freq = BLIND_SCAN_RANGE["start"]
+        end_freq = BLIND_SCAN_RANGE["end"]
+        step = SPECTRUM_SWEEP["step"]
+        sr = SPECTRUM_SWEEP["symbol_rate"]
+        frontend = self.adapter.frontend
+
+        freqs = list(range(start_freq, end_freq + 1, step))
+        power = [
+            frontend.measure_power(Transponder(f, polarization, sr, "AUTO", "DVB-S2", "QPSK"))
+            for f in freqs
+        ]
+        return freqs, power
+
+    def _blind_spectrum_plan(self, polarizations: list[str]) -> Optional[ScanPlan]:
+        """Spektrum öncelikli blind scan planı: güç taraması → taşıyıcı algılama."""
+        try:
+            from .spectrum import detect_carriers
+        except ImportError:
+            from spectrum import detect_carriers
+
+        candidates = []
+
+        print(f"\n🔍 Spektrum taraması: {BLIND_SCAN_RANGE['start']}-{BLIND_SCAN_RANGE['end']} MHz, "
+              f"{SPECTRUM_SWEEP['step']} MHz adım, Polarizasyon: {', '.join(polarizations)}")
+
+        for p in polarizations:
+            try:
+                freqs, power = self.sweep_spectrum(p)
+            except FileNotFoundError:
+                print(f"⚠️  Frontend bulunamadı, spektrum taraması yapılamıyor")
+                return None
+
+            carriers = detect_carriers(freqs, power, symbol_rates=COMMON_SYMBOL_RATES,
+                                       threshold_db=SPECTRUM_SWEEP["threshold_db"])
+            print(f"  📊 {p}: {len(freqs)} ölçüm, {len(carriers)} taşıyıcı adayı")
+            candidates.extend((c, p) for c in carriers)
+
+        # Adayları LNB geçişleri en aza inecek şekilde sırala
+        return self.planner.plan(
+            Transponder(round(c.frequency), p, c.symbol_rate, "AUTO", "DVB-S2", "8PSK",
+                        note=f"+{c.level_db:.1f} dB")
+            for c, p in candidates
+        )
+
+    def _probe_spectrum(self, position: int, item: PlanItem, total: int) -> list[Channel]:
+        """Spektrumda bulunan taşıyıcıyı tahmini symbol rate ile tune et."""
+        probe = item.transponder
+        print(f"[{position + 1}/{total}] {probe.frequency} MHz {probe.polarization} "
+              f"~{probe.symbol_rate} ksps ({probe.note})")
+        self._select_port(item)
+
+        found = []
+        for system in ["DVB-S2", "DVB-S"]:
+            mod = "QPSK" if system == "DVB-S" else "8PSK"
+            tp = Transponder(probe.frequency, probe.polarization, probe.symbol_rate,
+                             "AUTO", system, mod)
+            locked_before = self.scan_result.transponders_locked
+            found.extend(self.scan_transponder(tp))
+            if self.scan_result.transponders_locked > locked_before:
+                break
+        return found
+
+    def _blind_step_plan(self, polarizations: list[str]) -> ScanPlan:
+        """Kaba kuvvet blind scan planı (polarizasyon/band grupları içinde frekans sırası)."""
         start_freq = BLIND_SCAN_RANGE["start"]
         end_freq = BLIND_SCAN_RANGE["end"]
         step = BLIND_SCAN_RANGE["step"]
-        polarizations = ["H", "V"] if pol == "both" else [pol.upper()]
 
-        start_time = time.time()
-        all_channels = []
-        total_steps = ((end_freq - start_freq) // step) * len(polarizations)
-        current = 0
+        plan = self.planner.plan(
+            Transponder(freq, p, COMMON_SYMBOL_RATES[0], "AUTO", "DVB-S", "QPSK")
+            for p in polarizations
+            for freq in range(start_freq, end_freq + 1, step)
+        )
 
         print(f"\n🔍 Frekans aralığı: {start_freq}-{end_freq} MHz")
         print(f"📊 Adım: {step} MHz, Polarizasyon: {', '.join(polarizations)}")
-        print(f"📋 Toplam adım: {total_steps}\n")
-
-        for freq in range(start_freq, end_freq + 1, step):
-            for p in polarizations:
-                current += 1
-                # Her symbol rate'i dene
-                for sr in COMMON_SYMBOL_RATES:
-                    for system in ["DVB-S", "DVB-S2"]:
-                        mod = "QPSK" if system == "DVB-S" else "8PSK"
-                        tp = Transponder(freq, p, sr, "AUTO", system, mod)
-
-                        if current % 50 == 0:
-                            pct = (current / total_steps) * 100
-                            print(f"[{current}/{total_steps}] ({pct:.0f}%) {freq} MHz {p}")
-
-                        channels = self.scan_transponder(tp, timeout=5)
-                        if channels:
-                            all_channels.extend(channels)
-                            break  # Bu frekansta kanal bulundu, diğer sr'leri atla
-                    if channels:
-                        break
-
-        self.scan_result.channels = all_channels
-        self.scan_result.channels_found = len(all_channels)
+        print(f"📋 Toplam adım: {len(plan)}")
+        return plan
+
+    def _probe_step(self, position: int, item: PlanItem, total: int) -> list[Channel]:
+        """Tek frekans adımında her symbol rate × sistemi dene."""
+        freq, p = item.transponder.frequency, item.transponder.polarization
+        current = position + 1
+        if current % 50 == 0:
+            pct = (current / total) * 100
+            print(f"[{current}/{total}] ({pct:.0f}%) {freq} MHz {p}")
+
+        self._select_port(item)
+        for sr, system in self._ranked_trials(item.satellite):
+            mod = "QPSK" if system == "DVB-S" else "8PSK"
+            channels = self.scan_transponder(Transponder(freq, p, sr, "AUTO", system, mod))
+            if channels:
+                return channels  # Bu frekansta kanal bulundu, diğer sr'leri atla
+        return []
+
+    @staticmethod
+    def _coarse_points(polarizations: list[str]) -> list[Transponder]:
+        """Uyarlamalı blind scan'in kaba adımlı sinyal varlığı noktaları."""
+        return [
+            Transponder(freq, p, SPECTRUM_SWEEP["symbol_rate"], "AUTO", "DVB-S2", "QPSK")
+            for p in polarizations
+            for freq in range(BLIND_SCAN_RANGE["start"], BLIND_SCAN_RANGE["end"] + 1,
+                              ADAPTIVE_SCAN["coarse_step"])
+        ]
+
+    def _blind_adaptive_plan(self, polarizations: list[str]) -> ScanPlan:
+        """Uyarlamalı blind scan planı: kaba adımlı sinyal varlığı noktaları."""
+        start_freq = BLIND_SCAN_RANGE["start"]
+        end_freq = BLIND_SCAN_RANGE["end"]
+        step = ADAPTIVE_SCAN["coarse_step"]
+        plan = self.planner.plan(self._coarse_points(polarizations))
+
+        print(f"\n🔍 Uyarlamalı tarama: {start_freq}-{end_freq} MHz, kaba adım {step} MHz, "
+              f"ince adım {ADAPTIVE_SCAN['fine_step']} MHz, Polarizasyon: {', '.join(polarizations)}")
+        print(f"📋 Kaba nokta: {len(plan)}")
+        return plan
+
+    def _signal_present(self, freq: float, pol: str) -> bool:
+        tp = Transponder(round(freq), pol, SPECTRUM_SWEEP["symbol_rate"], "AUTO", "DVB-S2", "QPSK")
+        return self.adapter.frontend.has_signal(tp)
+
+    def _lock_anchored(self, edge: float, pol: str,
+                       trials: list[tuple[int, str]]) -> Optional[tuple[list[Channel], float]]:
+        """
+        Alt kenarı edge olan taşıyıcıyı kilitle → (kanallar, bant genişliği).
+
+        Her symbol rate için merkez edge + bant genişliği / 2 alınır.
+        """
+        for sr, system in trials:
+            bandwidth = sr * (1 + ADAPTIVE_SCAN["rolloff"]) / 1000
+            mod = "QPSK" if system == "DVB-S" else "8PSK"
+            tp = Transponder(round(edge + bandwidth / 2), pol, sr, "AUTO", system, mod)
+            locked_before = self.scan_result.transponders_locked
+            channels = self.scan_transponder(tp)
+            if self.scan_result.transponders_locked > locked_before:
+                return channels, bandwidth
+        return None
+
+    @staticmethod
+    def _covered_key(item: PlanItem) -> tuple[str, str, bool]:
+        return item.satellite, item.transponder.polarization, item.transponder.is_high_band
+
+    def _probe_adaptive(self, position: int, item: PlanItem, total: int) -> list[Channel]:
+        """
+        Kaba noktada sinyal varsa alt kenarı ikili aramayla bul, bölgedeki
+        taşıyıcıları kenardan başlayarak art arda kilitle.
+        """
+        freq, p = item.transponder.frequency, item.transponder.polarization
+        key = self._covered_key(item)
+        coarse, fine = ADAPTIVE_SCAN["coarse_step"], ADAPTIVE_SCAN["fine_step"]
+        covered = self._covered.get(key, BLIND_SCAN_RANGE["start"])
+        if freq < covered:
+            return []       # Önceki bölgenin içinde kaldı
+
+        current = position + 1
+        if current % 50 == 0:
+            print(f"[{current}/{total}] ({current / total * 100:.0f}%) {freq} MHz {p}")
+
+        self._select_port(item)
+        if not self._signal_present(freq, p):
+            return []
+
+        absent, present = max(freq - coarse, covered), freq
+        while present - absent > fine:
+            mid = (absent + present) / 2
+            if self._signal_present(mid, p):
+                present = mid
+            else:
+                absent = mid
+
+        channels = []
+        cursor = (absent + present) / 2
+        offsets = ADAPTIVE_SCAN["anchor_offsets"]
+        while cursor <= BLIND_SCAN_RANGE["end"]:
+            # Kenar tahmini (rolloff, örtüşen taşıyıcılar) şaşarsa çapayı kaydır;
+            # kaydırılmış çapalarda sadece en olası kombinasyonlar denenir
+            trials = self._ranked_trials(item.satellite)
+            locked = None
+            for i, offset in enumerate(offsets):
+                anchor = cursor + offset * fine
+                locked = self._lock_anchored(
+                    anchor, p, trials if i == 0 else trials[:ADAPTIVE_SCAN["retry_trials"]])
+                if locked is not None:
+                    break
+            if locked is None:
+                cursor += max(offsets) * fine
+                break
+
+            found, bandwidth = locked
+            channels.extend(found)
+            cursor = anchor + bandwidth     # Üst kenar = bitişik taşıyıcının alt kenarı
+            if not self._signal_present(cursor + fine, p):
+                break
+
+        self._covered[key] = cursor + fine
+        return channels
+
+    # ─── Çoklu uydu ───
+
+    @classmethod
+    def satellite_transponders(cls, name: str) -> Optional[list[Transponder]]:
+        """Uydunun bilinen transponder listesi (<uydu>_transponders.json), yoksa None."""
+        if name == "turksat":
+            return cls.known_transponders()
+        path = SCRIPT_DIR / f"{name}_transponders.json"
+        return cls.load_transponders(path) if path.exists() else None
+
+    def scan_satellites(self, satellites: Optional[list[str]] = None, positioner=None,
+                        resume: bool = False) -> ScanResult:
+        """
+        Çoklu uydu taraması (SATELLITE_POSITIONS).
+
+        Uydular toplam motor hareketi (switch modunda port geçişi) en az
+        olacak sırayla gezilir; her uydunun tüm transponderları tek
+        konumlandırmada taranır. Uydu değişiminde motor komutu önce
+        gönderilir, önceki uydunun sonuçları motor dönerken yazılır.
+        Transponder listesi olmayan uydular uyarlamalı blind scan ile
+        taranır.
+        """
+        try:
+            from .diseqc import SATELLITE_POSITIONS, DishPositioner
+        except ImportError:
+            from diseqc import SATELLITE_POSITIONS, DishPositioner
+
+        names = satellites or list(SATELLITE_POSITIONS)
+        unknown = [n for n in names if n not in SATELLITE_POSITIONS]
+        if unknown:
+            raise ValueError(f"Bilinmeyen uydu: {', '.join(unknown)} "
+                             f"(mevcut: {', '.join(SATELLITE_POSITIONS)})")
+
+        frontend = self.adapter.frontend
+        if positioner is None:
+            positioner = DishPositioner(self.diseqc, clock=frontend.clock, sleep=frontend.sleep)
+        order = positioner.order(names)
+
+        print("=" * 60)
+        print(f"  APEXSAT AI - Çoklu Uydu Taraması ({len(order)} uydu, {positioner.mode})")
+        print("=" * 60)
+        if positioner.mode == "usals":
+            print(f"\n🛰️  Motor rotası: {positioner.route_cost(names):.0f}s (liste sırası) → "
+                  f"{positioner.route_cost(order):.0f}s: {' → '.join(order)}")
+
+        lists = {name: self.satellite_transponders(name) for name in order}
+        start_time = time.time()
+
+        def build_plan() -> ScanPlan:
+            items = []
+            for name in order:
+                port = SATELLITE_POSITIONS[name].diseqc_port if positioner.mode == "switch" else 0
+                transponders = lists[name]
+                if transponders is None:
+                    transponders = self._coarse_points(["H", "V"])
+                items.extend(PlanItem(tp, name, port) for tp in transponders)
+            return self.planner.plan_items(items)
+
+        params = {"satellites": order, "positioner": positioner.mode}
+        checkpoint, items = self._open_session("multi", params, resume, build_plan)
+        total = checkpoint.total
+        print(f"\n📋 Toplam {len(items)} aday taranacak")
+
+        def arrive(name: str):
+            sat = SATELLITE_POSITIONS[name]
+            travel = positioner.goto(name)
+            source = "liste" if lists[name] is not None else "uyarlamalı blind scan"
+            print(f"\n🛰️  {sat.name} ({sat.orbital_position}) - {source}, "
+                  f"motor {travel:.1f}s")
+            # Motor dönerken önceki uydunun sonuçlarını yaz
+            checkpoint.flush()
+            self._flush_trials()
+            positioner.wait()
+
+        def probe(position: int, item: PlanItem) -> list[Channel]:
+            if item.satellite != positioner.current:
+                arrive(item.satellite)
+            if lists[item.satellite] is None:
+                return self._probe_adaptive(position, item, total)
+
+            print(f"\n[{position + 1}/{total}] {item.satellite} ───────────────────────────")
+            return self.scan_item(item)
+
+        self._run_items(items, probe, checkpoint)
         self.scan_result.scan_duration = time.time() - start_time
 
-        self.db.save_channels(all_channels)
         self._print_scan_summary()
+        if positioner.moves:
+            print(f"  🛰️  Motor: {positioner.moves} hareket, {positioner.travel_deg:.1f}°, "
+                  f"{positioner.travel_s:.1f}s (boşta beklenen {positioner.waited_s:.1f}s)")
         return self.scan_result
 
-    def nit_scan(self) -> ScanResult:
-        """NIT (Network Information Table) tabanlı tarama."""
+    def nit_scan(self, orbital_position: float = TURKSAT_ORBITAL,
+                 transponders: Optional[list[Transponder]] = None,
+                 nit_list: Optional[Path] = None) -> ScanResult:
+        """
+        NIT (Network Information Table) tabanlı tarama.
+
+        Ana transponder'da tek kilitle PAT/PMT/SDT ile birlikte NIT okunur;
+        uydu teslim sistemi descriptor'larından (0x43) transponder listesi
+        çıkarılır, planlanır ve taranır. Aday liste verilmezse
+        known_transponders() kullanılır; bulunan liste nit_list'e (varsayılan
+        NIT_TRANSPONDER_DB) yazılır.
+        """
         print("=" * 60)
         print("  APEXSAT AI - NIT Tabanlı Otomatik Tarama")
         print("=" * 60)
 
-        # İlk transponder'a kilitle ve NIT'i oku
-        transponders = self.load_transponders()
-        if not transponders:
+        candidates = transponders if transponders is not None else self.known_transponders()
+        if not candidates:
             print("❌ Transponder listesi boş!")
             return self.scan_result
 
-        home_tp = transponders[0]
-        print(f"\n📡 Ana transponder: {home_tp.frequency} MHz {home_tp.polarization}")
-        print("🔍 NIT tablosu okunuyor...\n")
-
-        # dvbv5-scan NIT modunda
-        try:
-            scan_file = SCRIPT_DIR / "nit_scan.conf"
-            self.generate_dvbv5_scan_file([home_tp], scan_file)
-
-            result = subprocess.run(
-                [
-                    "dvbv5-scan",
-                    "-a", str(self.adapter.adapter_num),
-                    "-N",  # NIT tabanlı tarama
-                    str(scan_file),
-                ],
-                capture_output=True, text=True, timeout=120
-            )
-            print(result.stdout)
-
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        start_time = time.time()
+        home_tp, nit = None, None
+        for tp in candidates[:NIT_HOME_ATTEMPTS]:
+            print(f"\n📡 Ana transponder: {tp.frequency} MHz {tp.polarization}")
+            self.scan_result.add_channels(self.scan_transponder(tp, want_nit=True))
+            mux = self.scan_result.muxes.get((self.satellite, tp.frequency, tp.polarization))
+            if mux is not None and mux.nit is not None:
+                home_tp, nit = tp, mux.nit
+                break
+            print("    ⚠️  NIT okunamadı")
+
+        if nit is None:
             print("⚠️  NIT taraması başarısız, standart taramaya geçiliyor...")
-            return self.scan_turksat()
+            if transponders is None:
+                return self.scan_turksat()
+            return self.scan_turksat(plan=self.planner.plan(
+                [tp for tp in candidates if not self._unsupported(tp)]))
+
+        discovered = transponders_from_nit(nit, orbital_position)
+        known = {(tp.frequency, tp.polarization) for tp in candidates}
+        new = [tp for tp in discovered if (tp.frequency, tp.polarization) not in known]
+        missing = len(known - {(tp.frequency, tp.polarization) for tp in discovered})
+        print(f"\n🌐 NIT: {nit.network_name or nit.network_id} - {len(discovered)} transponder "
+              f"({len(new)} yeni, {missing} listede artık yok)")
+        self.save_transponder_list(discovered, nit_list)
+
+        # Ana transponder aynı kilitte tarandı
+        remaining = [
+            tp for tp in discovered
+            if not (tp.polarization == home_tp.polarization
+                    and abs(tp.frequency - home_tp.frequency) <= NIT_FREQ_TOLERANCE)
+        ]
+        plan = self.planner.plan(remaining)
+        total = len(plan)
+        for i, item in enumerate(plan, 1):
+            print(f"\n[{i}/{total}] ───────────────────────────")
+            self.scan_result.add_channels(self.scan_item(item))
 
+        self.scan_result.scan_duration = time.time() - start_time
+        self.save_results()
+        self._print_scan_summary()
         return self.scan_result
 
-    def _print_scan_summary(self):
+    def save_results(self, result: Optional[ScanResult] = None):
+        """Tarama sonucunu (kanallar + kilitlenen transponderlar) kaydet."""
+        result = result or self.scan_result
+        self.db.save_transponders(result.locked_transponders, result.muxes)
+        self.db.save_channels(result.channels)
+
+    def save_incremental(self, result: Optional[ScanResult] = None) -> ScanDiff:
+        """
+        Sadece yeniden ayrıştırılan muxların kanallarını eşitle ve farkı
+        hesapla; değişmeyen muxlara dokunulmaz.
+        """
+        result = result or self.scan_result
+        diff = ScanDiff(changed_muxes=len(result.muxes), unchanged_muxes=len(result.unchanged))
+
+        old_rows = self.db.get_all_channels()
+        by_triplet: dict[tuple, list[dict]] = {}
+        legacy: dict[tuple, list[dict]] = {}        # Üçlüsü kaydedilmemiş satırlar
+        for r in old_rows:
+            if r["original_network_id"] or r["transport_stream_id"]:
+                key = (r["original_network_id"], r["transport_stream_id"], r["service_id"])
+                by_triplet.setdefault(key, []).append(r)
+            else:
+                key = (r["satellite"], r["transponder_freq"], r["transponder_pol"], r["service_id"])
+                legacy.setdefault(key, []).append(r)
+
+        matched = set()
+        by_mux: dict[tuple, list[Channel]] = {key: [] for key in result.muxes}
+
+        for ch in result.channels:
+            mux = (ch.satellite, ch.transponder_freq, ch.transponder_pol)
+            by_mux.setdefault(mux, []).append(ch)
+            # Aynı üçlü başka uyduda da yayınlanabilir; taşınma sadece aynı uyduda
+            candidates = [r for r in by_triplet.get((ch.original_network_id,
+                                                     ch.transport_stream_id, ch.service_id), [])
+                          if r["satellite"] == ch.satellite]
+            candidates = candidates or legacy.get(mux + (ch.service_id,), [])
+            same_mux = [r for r in candidates
+                        if (r["satellite"], r["transponder_freq"], r["transponder_pol"]) == mux]
+            if same_mux:
+                old = same_mux[0]
+                if old["name"] != ch.name:
+                    diff.renamed.append((ch, old["name"]))
+            elif candidates:
+                old = candidates[0]
+                diff.moved.append((ch, old["transponder_freq"], old["transponder_pol"]))
+            else:
+                diff.added.append(ch)
+                continue
+            matched.add(old["id"])
+
+        diff.removed = [
+            r for r in old_rows
+            if (r["satellite"], r["transponder_freq"], r["transponder_pol"]) in by_mux
+            and r["id"] not in matched
+        ]
+
+        for (satellite, freq, pol), channels in by_mux.items():
+            self.db.sync_transponder_channels(freq, pol, channels, satellite)
+        self.db.save_transponders(result.locked_transponders, result.muxes)
+
+        result.diff = diff
+        return diff
+
+    def _print_scan_summary(self, result: Optional[ScanResult] = None):
         """Tarama sonuç özetini yazdır."""
-        r = self.scan_result
+        r = result or self.scan_result
         print("\n" + "=" * 60)
         print("  TARAMA SONUÇLARI")
         print("=" * 60)
         print(f"  ⏱️  Süre: {r.scan_duration:.1f} saniye")
         print(f"  📡 Taranan transponder: {r.transponders_scanned}")
         print(f"  🔒 Kilitlenen: {r.transponders_locked}")
+        if r.skipped:
+            print(f"  ⏭️  Tuner desteklemiyor: {r.skipped}")
         print(f"  📺 TV kanalları: {r.tv_channels}")
         print(f"  📻 Radyo kanalları: {r.radio_channels}")
         print(f"  📊 Veri servisleri: {r.data_services}")
         print(f"  ─────────────────────────────")
         print(f"  📋 TOPLAM: {r.channels_found} kanal")
+        if r.timings:
+            t = r.timing_summary()
+            print(f"  ─────────────────────────────")
+            print(f"  🔒 Ort. kilitlenme: {t['avg_lock_ms']:.0f} ms "
+                  f"(tune+parse: {t['avg_locked_total_ms']:.0f} ms)")
+            print(f"  ❌ Ort. başarısız deneme: {t['avg_unlocked_total_ms']:.0f} ms")
+        if r.diff is not None:
+            print(f"  ─────────────────────────────")
+            for line in r.diff.describe():
+                print(f"  {line}")
         print("=" * 60)
 
 
 # ─── Dışa Aktarma ───────────────────────────────────────────────────────────
 
-class ChannelExporter:
-    """Kanal listesi dışa aktarma."""
+class ExportWriter(ABC):
+    """
+    Akış halinde dışa aktarma biçimi.
+
+    Dosya başlık, kanal başına satırlar ve kapanış olarak parça parça
+    yazılır; bellekte tüm liste tutulmaz. channel_type verilmişse sadece o
+    türdeki kanallar yazılır.
+    """
+    label = ""
+    channel_type: Optional[str] = None
+
+    def __init__(self, path: Path, total: int = 0, channel_type: Optional[str] = None):
+        self.path = path
+        self.total = total          # Başlıkta gösterilen kanal sayısı
+        if channel_type is not None:
+            self.channel_type = channel_type
+        self.count = 0
+
+    def accepts(self, ch) -> bool:
+        return self.channel_type is None or ch["channel_type"] == self.channel_type
+
+    def header(self) -> Iterable[str]:
+        return ()
+
+    @abstractmethod
+    def rows(self, ch) -> Iterable[str]:
+        """Kanalın satırları."""
+
+    def footer(self) -> Iterable[str]:
+        return ()
+
+    def done(self) -> str:
+        return f"✅ {self.label} dışa aktarıldı: {self.path} ({self.count} kanal)"
+
+
+class M3UWriter(ExportWriter):
+    """M3U/M3U8 playlist."""
+    label = "M3U"
+
+    def header(self):
+        return ("#EXTM3U",
+                "# APEXSAT AI - Türksat 42°E Kanal Listesi",
+                f"# Oluşturulma: {time.strftime('%Y-%m-%d %H:%M:%S')}",
+                f"# Toplam: {self.total} kanal",
+                "")
+
+    def rows(self, ch):
+        group = ch["category"] or ch["provider"] or "Genel"
+        ch_type = "TV" if ch["channel_type"] == "TV" else "Radio"
+        hd = " HD" if ch["is_hd"] else ""
+        return (f'#EXTINF:-1 tvg-name="{ch["name"]}" '
+                f'tvg-type="{ch_type}" '
+                f'group-title="{group}",{ch["name"]}{hd}',
+                # DVB URL formatı
+                f"dvb://frequency={ch['transponder_freq']}&polarization={ch['transponder_pol']}"
+                f"&service_id={ch['service_id'] or 0}",
+                "")
 
-    def __init__(self, db: ChannelDatabase):
-        self.db = db
 
-    def export_m3u(self, output_path: Path, channel_type: Optional[str] = None) -> Path:
-        """M3U/M3U8 playlist formatında dışa aktar."""
-        channels = self.db.get_all_channels(channel_type)
+class Enigma2Writer(ExportWriter):
+    """Enigma2 (Dreambox/VU+) bouquet, sadece TV."""
+    label = "Enigma2 bouquet"
+    channel_type = "TV"
 
-        lines = [
-            "#EXTM3U",
-            f"# APEXSAT AI - Türksat 42°E Kanal Listesi",
-            f"# Oluşturulma: {time.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"# Toplam: {len(channels)} kanal",
-            "",
-        ]
+    def header(self):
+        return ("#NAME APEXSAT Türksat",)
 
-        for ch in channels:
-            group = ch.get("category") or ch.get("provider") or "Genel"
-            ch_type = "TV" if ch["channel_type"] == "TV" else "Radio"
-            hd = " HD" if ch.get("is_hd") else ""
+    def rows(self, ch):
+        # Enigma2 servis referans formatı
+        return (f"#SERVICE 1:0:1:{ch['service_id'] or 0:X}:0:0:0:0:0:0:",
+                f"#DESCRIPTION {ch['name']}")
 
-            lines.append(
-                f'#EXTINF:-1 tvg-name="{ch["name"]}" '
-                f'tvg-type="{ch_type}" '
-                f'group-title="{group}",{ch["name"]}{hd}'
-            )
-            # DVB URL formatı
-            freq = ch["transponder_freq"]
-            pol = ch["transponder_pol"]
-            sid = ch.get("service_id", 0)
-            lines.append(f"dvb://frequency={freq}&polarization={pol}&service_id={sid}")
-            lines.append("")
 
-        output_path.write_text("\n".join(lines), encoding="utf-8")
-        print(f"✅ M3U dışa aktarıldı: {output_path} ({len(channels)} kanal)")
-        return output_path
+class CSVWriter(ExportWriter):
+    """CSV (metin alanlarında çift tırnak ikilenir)."""
+    label = "CSV"
 
-    def export_enigma2(self, output_path: Path) -> Path:
-        """Enigma2 (Dreambox/VU+) bouquet formatında dışa aktar."""
-        channels = self.db.get_all_channels("TV")
+    @staticmethod
+    def _quote(text) -> str:
+        return '"' + str(text or "").replace('"', '""') + '"'
 
-        lines = ["#NAME APEXSAT Türksat"]
-        for ch in channels:
-            # Enigma2 servis referans formatı
-            sid = ch.get("service_id", 0)
-            lines.append(f"#SERVICE 1:0:1:{sid:X}:0:0:0:0:0:0:")
-            lines.append(f"#DESCRIPTION {ch['name']}")
+    def header(self):
+        return ("Kanal Adı,Tür,HD,FTA,Frekans,Pol,Video PID,Audio PID,Servis ID,Sağlayıcı",)
 
-        output_path.write_text("\n".join(lines), encoding="utf-8")
-        print(f"✅ Enigma2 bouquet dışa aktarıldı: {output_path}")
-        return output_path
+    def rows(self, ch):
+        return (f'{self._quote(ch["name"])},{ch["channel_type"]},'
+                f'{"Evet" if ch["is_hd"] else "Hayır"},'
+                f'{"Evet" if ch["is_free"] else "Hayır"},'
+                f'{ch["transponder_freq"]},{ch["transponder_pol"]},'
+                f'{ch["video_pid"] or 0},{ch["audio_pid"] or 0},'
+                f'{ch["service_id"] or 0},{self._quote(ch["provider"])}',)
 
-    def export_csv(self, output_path: Path) -> Path:
-        """CSV formatında dışa aktar."""
-        channels = self.db.get_all_channels()
 
-        lines = ["Kanal Adı,Tür,HD,FTA,Frekans,Pol,Video PID,Audio PID,Servis ID,Sağlayıcı"]
-        for ch in channels:
-            lines.append(
-                f'"{ch["name"]}",{ch["channel_type"]},'
-                f'{"Evet" if ch.get("is_hd") else "Hayır"},'
-                f'{"Evet" if ch.get("is_free") else "Hayır"},'
-                f'{ch["transponder_freq"]},{ch["transponder_pol"]},'
-                f'{ch.get("video_pid", 0)},{ch.get("audio_pid", 0)},'
-                f'{ch.get("service_id", 0)},"{ch.get("provider", "")}"'
-            )
+class XMLTVWriter(ExportWriter):
+    """XMLTV kanal listesi (EPG için temel), sadece TV; ağaç kurulmadan yazılır."""
+    label = "XMLTV"
+    channel_type = "TV"
 
-        output_path.write_text("\n".join(lines), encoding="utf-8")
-        print(f"✅ CSV dışa aktarıldı: {output_path} ({len(channels) - 1} kanal)")
-        return output_path
+    def header(self):
+        return ("<?xml version='1.0' encoding='utf-8'?>",
+                '<tv source-info-name="APEXSAT AI" generator-info-name="APEXSAT DVB Scanner">')
 
-    def export_xmltv(self, output_path: Path) -> Path:
-        """XMLTV formatında kanal listesi (EPG için temel)."""
-        channels = self.db.get_all_channels("TV")
+    def rows(self, ch):
+        return (f"  <channel id={quoteattr(str(ch['service_id'] or 0))}>",
+                f'    <display-name lang="tr">{escape(ch["name"])}</display-name>',
+                "  </channel>")
 
-        root = ET.Element("tv", {
-            "source-info-name": "APEXSAT AI",
-            "generator-info-name": "APEXSAT DVB Scanner"
-        })
+    def footer(self):
+        return ("</tv>",)
 
-        for ch in channels:
-            ch_elem = ET.SubElement(root, "channel", {"id": str(ch.get("service_id", 0))})
-            name_elem = ET.SubElement(ch_elem, "display-name", {"lang": "tr"})
-            name_elem.text = ch["name"]
-
-        tree = ET.ElementTree(root)
-        ET.indent(tree, space="  ")
-        tree.write(output_path, encoding="unicode", xml_declaration=True)
-        print(f"✅ XMLTV dışa aktarıldı: {output_path}")
-        return output_path
 
+def _write_lines(f, lines: Iterable[str]):
+    if lines:
+        f.write("\n".join(lines) + "\n")
 
-# ─── Ana Program ─────────────────────────────────────────────────────────────
 
-def check_dvb_tools():
-    """DVB araçlarının yüklü olup olmadığını kontrol et."""
-    tools = ["dvb-fe-tool", "dvbv5-scan", "dvbv5-zap"]
-    missing = []
-    for tool in tools:
-        try:
-            subprocess.run([tool, "--version"], capture_output=True, timeout=3)
-        except FileNotFoundError:
-            missing.append(tool)
-        except subprocess.TimeoutExpired:
-            pass  # Çalışıyor ama yanıt vermedi - sorun yok
-
-    if missing:
-        print("⚠️  Eksik DVB araçları:", ", ".join(missing))
-        print("   Yüklemek için: sudo apt install dvb-tools dvbv5-tools")
-        print("   Simülasyon modunda devam ediliyor...\n")
-        return False
-    return True
+EXPORT_WRITERS: dict[str, type[ExportWriter]] = {
+    "m3u": M3UWriter,
+    "csv": CSVWriter,
+    "enigma2": Enigma2Writer,
+    "xmltv": XMLTVWriter,
+}
+
+
+class ChannelExporter:
+    """
+    Kanal listesi dışa aktarma.
+
+    Kanallar veritabanı imlecinden parça parça okunup tamponlu dosyalara
+    satır satır yazılır; bellek kullanımı kanal sayısından bağımsızdır.
+    export() birden fazla biçimi tek veritabanı geçişinde yazar.
+    """
+
+    def __init__(self, db: ChannelDatabase, unique: bool = True):
+        self.db = db
+        self.unique = unique        # Aynı servisin kopyalarından sadece tercih edilen kaynak
+
+    def export(self, targets: dict[str, Path],
+               channel_type: Optional[str] = None) -> dict[str, Path]:
+        """Biçim → dosya yolu; tüm biçimler tek imleç geçişinde yazılır."""
+        unknown = set(targets) - set(EXPORT_WRITERS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen dışa aktarma biçimi: {', '.join(sorted(unknown))}")
+
+        counts = self.db.count_by_type(self.unique)
+        writers = []
+        for fmt, path in targets.items():
+            writer = EXPORT_WRITERS[fmt](path, channel_type=channel_type)
+            writer.total = (counts.get(writer.channel_type, 0) if writer.channel_type
+                            else sum(counts.values()))
+            writers.append(writer)
+
+        # Tüm yazıcılar aynı türü istiyorsa süzme sorguda yapılır
+        types = {w.channel_type for w in writers}
+        query_type = types.pop() if len(types) == 1 else None
+
+        with ExitStack() as stack:
+            files = [stack.enter_context(open(w.path, "w", encoding="utf-8",
+                                              buffering=EXPORT_BUFFER))
+                     for w in writers]
+            for w, f in zip(writers, files):
+                _write_lines(f, w.header())
+            for ch in self.db.iter_channels(query_type, unique=self.unique):
+                for w, f in zip(writers, files):
+                    if w.accepts(ch):
+                        _write_lines(f, w.rows(ch))
+                        w.count += 1
+            for w, f in zip(writers, files):
+                _write_lines(f, w.footer())
+
+        for w in writers:
+            print(w.done())
+        return {fmt: w.path for fmt, w in zip(targets, writers)}
+
+    def export_all(self, output_dir: Path, stem: str = "apexsat_channels") -> dict[str, Path]:
+        """Tüm biçimleri tek geçişte output_dir altına yaz."""
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return self.export({fmt: output_dir / f"{stem}{ext}"
+                            for fmt, ext in EXPORT_FORMATS.items()})
+
+    def export_m3u(self, output_path: Path, channel_type: Optional[str] = None) -> Path:
+        """M3U/M3U8 playlist formatında dışa aktar."""
+        return self.export({"m3u": output_path}, channel_type)["m3u"]
+
+    def export_enigma2(self, output_path: Path) -> Path:
+        """Enigma2 (Dreambox/VU+) bouquet formatında dışa aktar."""
+        return self.export({"enigma2": output_path})["enigma2"]
+
+    def export_csv(self, output_path: Path) -> Path:
+        """CSV formatında dışa aktar."""
+        return self.export({"csv": output_path})["csv"]
 
+    def export_xmltv(self, output_path: Path) -> Path:
+        """XMLTV formatında kanal listesi (EPG için temel)."""
+        return self.export({"xmltv": output_path})["xmltv"]
+
+
+# ─── Ana Program ─────────────────────────────────────────────────────────────
 
 def check_dvb_adapter(adapter_num: int = 0) -> bool:
-    """DVB adaptörünün bağlı olup olmadığını kontrol et."""
+    """DVB adaptörünün bağlı olup olmadığını kontrol et, yeteneklerini göster."""
     adapter = DVBAdapter(adapter_num)
     if not adapter.exists():
         print(f"⚠️  DVB adaptör bulunamadı: {adapter.frontend_path}")
-        print("   USB DVB-S2 tuner bağlayın veya simülasyon modunda devam edin.\n")
+        print("   USB DVB-S2 tuner bağlayın veya --simulate ile donanımsız tarayın.\n")
         return False
+    # Yetenekler önbellekten (ya da tek FE_GET_INFO ile) okunur
+    caps = adapter.capabilities()
+    adapter.close()
+    if caps is not None:
+        print(f"📡 {caps.name}: {', '.join(caps.delivery_systems)}\n")
     return True
 
 
@@ -813,29 +2599,57 @@ def main():
   %(prog)s --scan turksat              Türksat 42°E hızlı tarama
   %(prog)s --blind-scan                Blind scan (tüm Ku-Band)
   %(prog)s --blind-scan --pol H        Sadece Horizontal blind scan
+  %(prog)s --blind-scan --blind-method step  Kaba kuvvet (frekans × SR) blind scan
+  %(prog)s --blind-scan --blind-method adaptive  Kaba → ince, kilit geçmişine göre sıralı
+  %(prog)s --blind-scan --resume       Kesilen blind scan'i kaldığı yerden sürdür
   %(prog)s --nit-scan                  NIT tabanlı otomatik tarama
+  %(prog)s --scan multi                Tüm uydular (USALS motor, en kısa rota)
+  %(prog)s --scan multi --satellites turksat,hotbird --positioner switch
+  %(prog)s --scan turksat --adapters all  Tüm tunerlarla paralel tarama
+  %(prog)s --scan turksat --adapters 0,1,2,3 --simulate  4 sanal tunerla paralel tarama
+  %(prog)s --scan turksat --simulate   Donanımsız tarama (sanal PSI karuselleri)
+  %(prog)s --scan turksat --incremental  Sadece PAT/SDT sürümü değişen muxları yeniden tara
+  %(prog)s --scan turksat --replay captures/  Kayıtlı .ts dosyalarından tarama
   %(prog)s --list-channels             Bulunan kanalları listele
   %(prog)s --list-channels --type TV   Sadece TV kanalları
   %(prog)s --search "TRT"              Kanal ara
   %(prog)s --export m3u                M3U playlist dışa aktar
   %(prog)s --export csv                CSV olarak dışa aktar
   %(prog)s --export enigma2            Enigma2 bouquet dışa aktar
+  %(prog)s --export all                Tüm biçimler (tek veritabanı geçişi)
   %(prog)s --stats                     Kanal istatistikleri
         """
     )
 
-    parser.add_argument("--scan", choices=["turksat", "all"], help="Tarama modu")
+    parser.add_argument("--scan", choices=["turksat", "all", "multi"], help="Tarama modu")
+    parser.add_argument("--satellites", type=str,
+                        help="Çoklu uydu taramasında uydular (virgülle, varsayılan: hepsi)")
+    parser.add_argument("--positioner", choices=["usals", "switch"], default="usals",
+                        help="Uydu değiştirme yöntemi (USALS motor / DiSEqC switch)")
     parser.add_argument("--blind-scan", action="store_true", help="Blind scan başlat")
     parser.add_argument("--nit-scan", action="store_true", help="NIT tabanlı tarama")
     parser.add_argument("--adapter", type=int, default=0, help="DVB adaptör numarası")
+    parser.add_argument("--adapters", type=str,
+                        help="Paralel tarama için adaptörler ('all' veya '0,1,2')")
     parser.add_argument("--pol", choices=["H", "V", "both"], default="both", help="Polarizasyon filtresi")
+    parser.add_argument("--blind-method", choices=["spectrum", "step", "adaptive"],
+                        default="spectrum",
+                        help="Blind scan yöntemi (spektrum öncelikli / kaba kuvvet / uyarlamalı)")
     parser.add_argument("--list-channels", action="store_true", help="Kanal listesini göster")
     parser.add_argument("--type", choices=["TV", "Radio", "Data"], help="Kanal türü filtresi")
+    parser.add_argument("--all-sources", action="store_true",
+                        help="Listede/dışa aktarmada aynı servisin tüm kaynaklarını göster")
     parser.add_argument("--search", type=str, help="Kanal adı ara")
-    parser.add_argument("--export", choices=["m3u", "csv", "enigma2", "xmltv"], help="Dışa aktarma formatı")
+    parser.add_argument("--export", choices=[*EXPORT_FORMATS, "all"], help="Dışa aktarma formatı")
     parser.add_argument("--output", type=str, help="Dışa aktarma dosya yolu")
     parser.add_argument("--stats", action="store_true", help="Kanal istatistikleri")
     parser.add_argument("--simulate", action="store_true", help="Simülasyon modu (donanım olmadan test)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Artımlı tarama (PAT/SDT sürümü değişmeyen muxları atla)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Yarım kalmış taramayı kaldığı yerden sürdür (--scan / --blind-scan)")
+    parser.add_argument("--replay", type=str, metavar="DIR",
+                        help="Transponder başına kayıtlı .ts dosyalarını oynat (donanım olmadan)")
 
     args = parser.parse_args()
 
@@ -844,29 +2658,108 @@ def main():
                 args.list_channels, args.search, args.export, args.stats]):
         args.scan = "turksat"
 
+    # Paralel tarama sadece bilinen transponder listesini (turksat/all) tarar
+    if args.adapters:
+        unsupported = [flag for flag, used in (
+            ("--scan multi", args.scan == "multi"), ("--blind-scan", args.blind_scan),
+            ("--nit-scan", args.nit_scan), ("--incremental", args.incremental)) if used]
+        if unsupported:
+            parser.error(f"--adapters ile desteklenmiyor: {', '.join(unsupported)}")
+        if not args.scan:
+            parser.error("--adapters sadece --scan turksat/all ile kullanılabilir")
+        if args.adapters == "all" and (args.simulate or args.replay):
+            parser.error("--simulate/--replay ile adaptör listesi verin (örn. --adapters 0,1)")
+        if args.adapters != "all" and not re.fullmatch(r"\d+(,\d+)*", args.adapters):
+            parser.error(f"Geçersiz adaptör listesi: {args.adapters}")
+
+    def make_backend() -> Optional[FrontendBackend]:
+        """--replay / --simulate için sanal frontend (adaptör başına ayrı)."""
+        if args.replay:
+            try:
+                from .replay import ReplayFrontend
+            except ImportError:
+                from replay import ReplayFrontend
+            clock = VirtualClock()
+            return ReplayFrontend(Path(args.replay), DVBScanner.load_transponders(),
+                                  clock=clock, sleep=clock.sleep)
+        if args.simulate:
+            return DVBScanner.simulation_frontend()
+        return None
+
     db = ChannelDatabase()
 
-    # Tarama komutları
-    if args.scan or args.blind_scan or args.nit_scan:
-        has_tools = check_dvb_tools()
-        has_adapter = check_dvb_adapter(args.adapter)
+    # Paralel (çoklu tuner) tarama
+    if args.scan and args.adapters:
+        try:
+            from .coordinator import ParallelScanCoordinator, discover_adapters
+        except ImportError:
+            from coordinator import ParallelScanCoordinator, discover_adapters
+
+        if args.adapters == "all":
+            adapters = discover_adapters()
+        else:
+            adapters = [DVBAdapter(int(n), backend=make_backend())
+                        for n in args.adapters.split(",")]
+        if not adapters:
+            print("⚠️  DVB adaptör bulunamadı")
+            return
+        if not (args.replay or args.simulate):
+            if not all(check_dvb_adapter(a.adapter_num) for a in adapters):
+                return
+        if args.replay:
+            print(f"📼 Kayıt oynatma: {args.replay} ({len(adapters)} tuner)\n")
+        elif args.simulate:
+            print(f"🔄 Simülasyon modunda çalışıyor ({len(adapters)} sanal tuner)...\n")
+
+        coordinator = ParallelScanCoordinator(adapters, db)
+        try:
+            result = coordinator.scan_turksat(resume=args.resume)
+        except KeyboardInterrupt:
+            print("\n⏹️  Tarama kullanıcı tarafından durduruldu")
+        finally:
+            coordinator.close()
 
-        adapter = DVBAdapter(args.adapter)
+    # Tarama komutları
+    elif args.scan or args.blind_scan or args.nit_scan:
+        backend = make_backend()
+        if args.replay:
+            print(f"📼 Kayıt oynatma: {args.replay} ({len(backend.carriers)} mux)\n")
+        elif args.simulate:
+            print("🔄 Simülasyon modunda çalışıyor (sanal frontend)...\n")
+        else:
+            if not check_dvb_adapter(args.adapter):
+                return
+
+        adapter = DVBAdapter(args.adapter, backend=backend)
         scanner = DVBScanner(adapter, db)
 
-        if not has_tools or not has_adapter:
-            print("🔄 Simülasyon modunda çalışıyor...\n")
-
-        if args.scan == "turksat" or args.scan == "all":
-            result = scanner.scan_turksat()
-        elif args.blind_scan:
-            result = scanner.blind_scan(args.pol)
-        elif args.nit_scan:
-            result = scanner.nit_scan()
+        try:
+            if args.scan == "multi":
+                try:
+                    from .diseqc import DiSEqCController, DishPositioner
+                except ImportError:
+                    from diseqc import DiSEqCController, DishPositioner
+                if backend is None:
+                    scanner.diseqc = DiSEqCController(args.adapter)
+                positioner = DishPositioner(scanner.diseqc, args.positioner,
+                                            clock=adapter.frontend.clock,
+                                            sleep=adapter.frontend.sleep)
+                satellites = args.satellites.split(",") if args.satellites else None
+                result = scanner.scan_satellites(satellites, positioner, resume=args.resume)
+            elif args.scan == "turksat" or args.scan == "all":
+                result = scanner.scan_turksat(incremental=args.incremental, resume=args.resume)
+            elif args.blind_scan:
+                result = scanner.blind_scan(args.pol, args.blind_method, resume=args.resume)
+            elif args.nit_scan:
+                result = scanner.nit_scan()
+        except KeyboardInterrupt:
+            print("\n⏹️  Tarama kullanıcı tarafından durduruldu")
+        finally:
+            adapter.close()
 
     # Listeleme
     elif args.list_channels:
-        channels = db.get_all_channels(args.type)
+        channels = db.get_all_channels(args.type, unique=not args.all_sources)
         if not channels:
             print("📋 Kayıtlı kanal bulunamadı. Önce tarama yapın: --scan turksat")
             return
@@ -894,21 +2787,24 @@ def main():
 
     # Dışa aktarma
     elif args.export:
-        exporter = ChannelExporter(db)
+        exporter = ChannelExporter(db, unique=not args.all_sources)
         output_dir = SCRIPT_DIR / "exports"
-        output_dir.mkdir(exist_ok=True)
-
-        ext_map = {"m3u": ".m3u8", "csv": ".csv", "enigma2": ".tv", "xmltv": ".xml"}
-        output_path = Path(args.output) if args.output else output_dir / f"apexsat_channels{ext_map[args.export]}"
 
-        if args.export == "m3u":
-            exporter.export_m3u(output_path, args.type)
-        elif args.export == "csv":
-            exporter.export_csv(output_path)
-        elif args.export == "enigma2":
-            exporter.export_enigma2(output_path)
-        elif args.export == "xmltv":
-            exporter.export_xmltv(output_path)
+        if args.export == "all":
+            # --output verilmişse dizin olarak kullanılır
+            exporter.export_all(Path(args.output) if args.output else output_dir)
+        else:
+            output_dir.mkdir(exist_ok=True)
+            output_path = Path(args.output) if args.output else output_dir / f"apexsat_channels{EXPORT_FORMATS[args.export]}"
+
+            if args.export == "m3u":
+                exporter.export_m3u(output_path, args.type)
+            elif args.export == "csv":
+                exporter.export_csv(output_path)
+            elif args.export == "enigma2":
+                exporter.export_enigma2(output_path)
+            elif args.export == "xmltv":
+                exporter.export_xmltv(output_path)
 
     # İstatistikler
     elif args.stats:
@@ -920,6 +2816,7 @@ def main():
         print("\n📊 APEXSAT AI - Kanal İstatistikleri")
         print("─" * 40)
         print(f"  📋 Toplam kanal: {stats['total']}")
+        print(f"  🔗 Tekil servis: {stats['unique_services']}")
         print(f"  📺 TV kanalları: {stats['tv']}")
         print(f"  📻 Radyo kanalları: {stats['radio']}")
         print(f"  🔷 HD kanallar: {stats['hd']}")
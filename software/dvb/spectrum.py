@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+APEXSAT AI - Spektrum Analizi (Blind Scan 1. aşama)
+
+Hızlı güç/AGC taramasından elde edilen spektrum dizisinde taşıyıcıları bulur,
+merkez frekans ve -3 dB bant genişliğinden symbol rate tahmin eder. Sadece
+bulunan adaylar tune edilir.
+
+Kullanım:
+    python3 spectrum.py                 # Sentetik spektrum ile dedektör testi
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+# ─── Sabitler ────────────────────────────────────────────────────────────────
+
+DEFAULT_THRESHOLD_DB = 3.0      # Gürültü tabanı üstü eşik
+DEFAULT_SPLIT_DB = 2.0          # Bitişik taşıyıcıları ayıran çukur derinliği
+MIN_BANDWIDTH_MHZ = 1.0         # Daha dar bölgeler gürültü sayılır
+SR_SNAP_TOLERANCE = 0.15        # Standart SR'ye yapıştırma toleransı (±%15)
+NOISE_PERCENTILE = 10           # Gürültü tabanı tahmini
+
+
+@dataclass
+class DetectedCarrier:
+    """Spektrumda bulunan taşıyıcı adayı."""
+    frequency: float            # MHz (merkez)
+    bandwidth: float            # MHz (-3 dB)
+    symbol_rate: int            # ksps (tahmin)
+    level_db: float             # Gürültü tabanı üstü tepe seviyesi
+
+
+# ─── Sentetik Spektrum ───────────────────────────────────────────────────────
+
+def raised_cosine_shape(offset_mhz: np.ndarray, symbol_rate_mhz: float,
+                        rolloff: float) -> np.ndarray:
+    """Raised-cosine güç yoğunluğu (merkezde 1, ±Rs/2'de 0.5)."""
+    x = np.abs(offset_mhz)
+    inner = (1 - rolloff) * symbol_rate_mhz / 2
+    outer = (1 + rolloff) * symbol_rate_mhz / 2
+
+    shape = np.zeros_like(x, dtype=float)
+    shape[x <= inner] = 1.0
+    edge = (x > inner) & (x <= outer)
+    shape[edge] = 0.5 * (1 + np.cos(np.pi / (rolloff * symbol_rate_mhz) * (x[edge] - inner)))
+    return shape
+
+
+def synthetic_spectrum(carriers: Sequence, start: float, end: float, step: float,
+                       noise_floor_db: float = -70.0, noise_db: float = 0.3,
+                       seed: Optional[int] = 0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Donanımsız test için sentetik güç spektrumu üret.
+
+    carriers: frequency (MHz), symbol_rate (ksps), snr (dB, taban üstü seviye)
+    ve isteğe bağlı rolloff alanları olan nesneler (ör. FakeCarrier).
+    """
+    rng = np.random.default_rng(seed)
+    freqs = np.arange(start, end + step / 2, step, dtype=float)
+    linear = np.full_like(freqs, 10 ** (noise_floor_db / 10))
+
+    for c in carriers:
+        rolloff = getattr(c, "rolloff", 0.35)
+        shape = raised_cosine_shape(freqs - c.frequency, c.symbol_rate / 1000, rolloff)
+        linear += 10 ** ((noise_floor_db + c.snr) / 10) * shape
+
+    power = 10 * np.log10(linear)
+    if noise_db > 0:
+        power += rng.normal(0.0, noise_db, size=power.shape)
+    return freqs, power
+
+
+# ─── Taşıyıcı Algılama ───────────────────────────────────────────────────────
+
+def _smooth(power: np.ndarray, width: int = 3) -> np.ndarray:
+    if len(power) < width:
+        return power
+    kernel = np.ones(width) / width
+    padded = np.pad(power, width // 2, mode="edge")
+    return np.convolve(padded, kernel, mode="valid")
+
+
+def _runs(mask: np.ndarray) -> list[tuple[int, int]]:
+    """True bölgelerin [başlangıç, bitiş) indeksleri."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return list(zip(starts, ends))
+
+
+def _split_run(power: np.ndarray, lo: int, hi: int, split_db: float) -> list[tuple[int, int]]:
+    """Aralarında yeterince derin çukur olan bitişik taşıyıcıları ayır."""
+    segment = power[lo:hi]
+    if len(segment) < 3:
+        return [(lo, hi)]
+
+    # Yerel maksimumlar
+    peaks = np.flatnonzero((segment[1:-1] >= segment[:-2]) & (segment[1:-1] >= segment[2:])) + 1
+    if len(peaks) < 2:
+        return [(lo, hi)]
+
+    parts = []
+    part_start = 0
+    current_peak = peaks[0]
+    for nxt in peaks[1:]:
+        valley = current_peak + int(np.argmin(segment[current_peak:nxt + 1]))
+        depth = min(segment[current_peak], segment[nxt]) - segment[valley]
+        if depth >= split_db:
+            parts.append((lo + part_start, lo + valley))
+            part_start = valley
+            current_peak = nxt
+        elif segment[nxt] > segment[current_peak]:
+            current_peak = nxt
+    parts.append((lo + part_start, hi))
+    return parts
+
+
+def _edge_crossing(freqs: np.ndarray, power: np.ndarray, i_in: int, i_out: int,
+                   level: float) -> float:
+    """i_in (seviye üstü) ile i_out arasında seviye geçiş frekansı (lineer ara değer)."""
+    if i_out < 0 or i_out >= len(power):
+        return float(freqs[i_in])
+    p_in, p_out = power[i_in], power[i_out]
+    if p_in == p_out:
+        return float(freqs[i_in])
+    t = (p_in - level) / (p_in - p_out)
+    return float(freqs[i_in] + t * (freqs[i_out] - freqs[i_in]))
+
+
+def snap_symbol_rate(estimate: float, symbol_rates: Sequence[int] = (),
+                     tolerance: float = SR_SNAP_TOLERANCE) -> int:
+    """Tahmini SR'yi en yakın standart değere yapıştır, yoksa 100 ksps'ye yuvarla."""
+    if symbol_rates:
+        nearest = min(symbol_rates, key=lambda sr: abs(sr - estimate))
+        if abs(nearest - estimate) <= nearest * tolerance:
+            return int(nearest)
+    return int(round(estimate / 100.0) * 100)
+
+
+def detect_carriers(freqs: Sequence[float], power: Sequence[float],
+                    symbol_rates: Sequence[int] = (),
+                    threshold_db: float = DEFAULT_THRESHOLD_DB,
+                    split_db: float = DEFAULT_SPLIT_DB,
+                    min_bandwidth: float = MIN_BANDWIDTH_MHZ) -> list[DetectedCarrier]:
+    """
+    Güç spektrumunda taşıyıcıları bul.
+
+    Gürültü tabanı üstü bölgeler bulunur, çukurlardan bölünür; her bölgenin
+    -3 dB genişliği raised-cosine spektrumda symbol rate'e eşittir.
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    power = _smooth(np.asarray(power, dtype=float))
+    if len(freqs) < 3:
+        return []
+
+    floor = float(np.percentile(power, NOISE_PERCENTILE))
+    mask = power > floor + threshold_db
+
+    carriers = []
+    for run_lo, run_hi in _runs(mask):
+        for lo, hi in _split_run(power, run_lo, run_hi, split_db):
+            peak_idx = lo + int(np.argmax(power[lo:hi]))
+            peak = power[peak_idx]
+            half = peak - 3.0
+
+            # Tepeden dışa doğru -3 dB noktaları
+            left = peak_idx
+            while left > lo and power[left - 1] >= half:
+                left -= 1
+            right = peak_idx
+            while right < hi - 1 and power[right + 1] >= half:
+                right += 1
+
+            f_lo = _edge_crossing(freqs, power, left, left - 1, half)
+            f_hi = _edge_crossing(freqs, power, right, right + 1, half)
+            bandwidth = f_hi - f_lo
+            if bandwidth < min_bandwidth:
+                continue
+
+            carriers.append(DetectedCarrier(
+                frequency=(f_lo + f_hi) / 2,
+                bandwidth=bandwidth,
+                symbol_rate=snap_symbol_rate(bandwidth * 1000, symbol_rates),
+                level_db=float(peak - floor),
+            ))
+
+    return carriers
+
+
+# ─── Test ────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    from types import SimpleNamespace
+
+    print("=" * 50)
+    print("  APEXSAT AI - Spektrum Dedektör Testi")
+    print("=" * 50)
+
+    truth = [
+        SimpleNamespace(frequency=10970, symbol_rate=30000, snr=12.0),
+        SimpleNamespace(frequency=11012, symbol_rate=30000, snr=10.0),
+        SimpleNamespace(frequency=11096, symbol_rate=27500, snr=9.0),
+        SimpleNamespace(frequency=11452, symbol_rate=5000, snr=7.0),
+        SimpleNamespace(frequency=11461, symbol_rate=6000, snr=8.0),
+        SimpleNamespace(frequency=12380, symbol_rate=2400, snr=6.0),
+    ]
+    f, p = synthetic_spectrum(truth, 10700, 12750, 0.5, seed=42)
+    found = detect_carriers(f, p, symbol_rates=[2400, 3125, 5000, 6000, 13000, 22000, 27500, 30000, 45000])
+
+    print(f"\n📊 {len(f)} nokta, {len(found)} taşıyıcı bulundu\n")
+    for c in found:
+        print(f"  {c.frequency:9.1f} MHz  BW {c.bandwidth:5.1f} MHz  "
+              f"SR {c.symbol_rate:6d}  +{c.level_db:.1f} dB")
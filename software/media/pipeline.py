@@ -113,9 +113,11 @@ class MediaPipeline:
                    └──────────┘    └───────────┘    └──────────┘
     """
 
-    def __init__(self, adapter_num: int = 0, frontend_num: int = 0):
+    def __init__(self, adapter_num: int = 0, frontend_num: int = 0,
+                 source_file: Optional[str] = None):
         self.adapter_num = adapter_num
         self.frontend_num = frontend_num
+        self.source_file = source_file      # Kayıtlı TS (ReplayFrontend.stream_path())
         self.state = PlaybackState.STOPPED
         self.pipeline = None
         self.main_loop = None
@@ -170,6 +172,13 @@ class MediaPipeline:
         }
         return decoders.get(codec, "decodebin")
 
+    def _source_element(self, stream: StreamInfo) -> str:
+        """TS kaynağı: tuner (dvbsrc) veya kayıtlı TS dosyası (filesrc)."""
+        if self.source_file:
+            return f"filesrc location={self.source_file}"
+        pids = f"{stream.video_pid}:{stream.audio_pid}:{stream.pcr_pid}:{stream.pmt_pid}"
+        return f"dvbsrc adapter={self.adapter_num} frontend={self.frontend_num} pids={pids}"
+
     def build_live_tv_pipeline(self, stream: StreamInfo) -> str:
         """
         Canlı TV izleme pipeline'ı oluştur.
@@ -182,10 +191,7 @@ class MediaPipeline:
         audio_dec = self._get_audio_decoder_element(stream.audio_codec)
 
         # DVB kaynak
-        dvb_src = (
-            f"dvbsrc adapter={self.adapter_num} frontend={self.frontend_num} "
-            f"pids={stream.video_pid}:{stream.audio_pid}:{stream.pcr_pid}:{stream.pmt_pid}"
-        )
+        dvb_src = self._source_element(stream)
 
         pipeline_str = (
             f"{dvb_src} ! tsdemux name=demux "
@@ -209,8 +215,7 @@ class MediaPipeline:
 
         TS'yi doğrudan dosyaya yazar (re-encode yok).
         """
-        pids = f"{stream.video_pid}:{stream.audio_pid}:{stream.pcr_pid}:{stream.pmt_pid}"
-        dvb_src = f"dvbsrc adapter={self.adapter_num} frontend={self.frontend_num} pids={pids}"
+        dvb_src = self._source_element(stream)
 
         video_dec = self._get_video_decoder_element(stream.video_codec)
         audio_dec = self._get_audio_decoder_element(stream.audio_codec)
@@ -238,8 +243,7 @@ class MediaPipeline:
         TIMESHIFT_BUFFER_PATH.mkdir(parents=True, exist_ok=True)
         ts_file = str(TIMESHIFT_BUFFER_PATH / "timeshift.ts")
 
-        pids = f"{stream.video_pid}:{stream.audio_pid}:{stream.pcr_pid}:{stream.pmt_pid}"
-        dvb_src = f"dvbsrc adapter={self.adapter_num} frontend={self.frontend_num} pids={pids}"
+        dvb_src = self._source_element(stream)
 
         video_dec = self._get_video_decoder_element(stream.video_codec)
         audio_dec = self._get_audio_decoder_element(stream.audio_codec)
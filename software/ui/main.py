@@ -8,8 +8,12 @@ Kullanım:
     python3 main.py --resolution 1280x720  # Özel çözünürlük
 """
 
+import asyncio
+import contextlib
 import sys
 import os
+import tempfile
+import threading
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
@@ -29,16 +33,31 @@ except ImportError:
         QT_AVAILABLE = False
 
 
+def _load_scan_api():
+    """dvb paketini içe aktar (software/ dizini arama yolunda değilse ekle)."""
+    software_dir = str(SCRIPT_DIR.parent)
+    if software_dir not in sys.path:
+        sys.path.insert(0, software_dir)
+    from dvb.async_scan import AsyncScanner, ScanFinished
+    from dvb.scanner import ChannelDatabase, DVBAdapter, DVBScanner
+    return AsyncScanner, ScanFinished, ChannelDatabase, DVBAdapter, DVBScanner
+
+
 class APEXSATBackend(QObject):
     """QML'den erişilebilen Python backend."""
 
     channelChanged = pyqtSignal(int, str, arguments=["channelNum", "channelName"])
     volumeChanged = pyqtSignal(int, arguments=["volume"])
+    # Tarama olayları: kind = started/tune/lock/signal/services/progress/finished
+    scanEvent = pyqtSignal(str, "QVariantMap", arguments=["kind", "data"])
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._current_channel = 1
         self._volume = 50
+        self._scan_thread = None
+        self._scan_loop = None
+        self._scan_task = None
 
     @pyqtSlot(int, str)
     def changeChannel(self, num, name):
@@ -59,6 +78,67 @@ class APEXSATBackend(QObject):
         """Sesli komutu işle."""
         print(f"🎙️ Sesli komut: {command}")
 
+    @pyqtSlot(int)
+    @pyqtSlot(int, bool)
+    def startScan(self, adapter_num=0, simulate=False):
+        """
+        Türksat taramasını arka planda başlat.
+
+        Tarama kendi asyncio döngüsünde (ayrı iş parçacığı) çalışır, Qt
+        iş parçacığı bloklanmaz; olaylar scanEvent sinyaliyle gelir.
+        simulate=True sanal frontend ile tarar; sanal kanallar geçici bir
+        veritabanına yazılır, gerçek kanal listesi değişmez.
+        """
+        if self._scan_thread is not None and self._scan_thread.is_alive():
+            return
+        self._scan_thread = threading.Thread(
+            target=lambda: asyncio.run(self._scan(adapter_num, simulate)),
+            name="apexsat-scan", daemon=True)
+        self._scan_thread.start()
+
+    @pyqtSlot()
+    def stopScan(self):
+        """Süren taramayı iptal et."""
+        if self._scan_loop is not None and self._scan_task is not None:
+            self._scan_loop.call_soon_threadsafe(self._scan_task.cancel)
+
+    async def _scan(self, adapter_num, simulate=False):
+        AsyncScanner, ScanFinished, ChannelDatabase, DVBAdapter, DVBScanner = _load_scan_api()
+
+        if simulate:
+            adapter = DVBAdapter(adapter_num, backend=DVBScanner.simulation_frontend())
+        else:
+            adapter = DVBAdapter(adapter_num)
+            if not adapter.exists():
+                # Sanal kanallar gerçek kanal listesine yazılmasın
+                error = f"DVB adaptör bulunamadı: {adapter.frontend_path}"
+                print(f"⚠️  {error}")
+                self.scanEvent.emit("finished",
+                                    ScanFinished(f"adapter{adapter_num}", error=error).to_dict())
+                return
+
+        self._scan_loop = asyncio.get_running_loop()
+        self._scan_task = asyncio.current_task()
+        # Simülasyonda kanal listesi geçici dizinde, tarama bitince silinir
+        tmp = tempfile.TemporaryDirectory(prefix="apexsat-ui-sim-") if simulate else None
+        db = ChannelDatabase(Path(tmp.name) / "channels.db") if tmp else ChannelDatabase()
+        print(f"📡 Tarama başladı (adapter{adapter_num}{', simülasyon' if simulate else ''})")
+        try:
+            # aclosing: iptalde üreteç süren iş parçacığı adımlarını bitirip kapanır,
+            # adaptör ve veritabanı ondan sonra kapatılır
+            events = AsyncScanner(DVBScanner(adapter, db)).scan_turksat()
+            async with contextlib.aclosing(events):
+                async for event in events:
+                    self.scanEvent.emit(event.kind, event.to_dict())
+        except asyncio.CancelledError:
+            self.scanEvent.emit("cancelled", {})
+        finally:
+            adapter.close()
+            db.close()
+            if tmp is not None:
+                tmp.cleanup()
+            self._scan_loop = self._scan_task = None
+
     @pyqtSlot(result=str)
     def getVersion(self):
         return "APEXSAT AI v1.0"
@@ -0,0 +1,8 @@
+"""Testler dvb paketini software/ dizininden içe aktarır."""
+
+import sys
+from pathlib import Path
+
+SOFTWARE_DIR = Path(__file__).resolve().parent.parent / "software"
+if str(SOFTWARE_DIR) not in sys.path:
+    sys.path.insert(0, str(SOFTWARE_DIR))
@@ -0,0 +1,105 @@
+"""Uyarlamalı (kaba → ince) blind scan ve kilit geçmişi."""
+
+import pytest
+
+from dvb import scanner as scanner_module
+from dvb.frontend import FakeCarrier, FakeFrontend, VirtualClock
+from dvb.scanner import ChannelDatabase, DVBAdapter, DVBScanner
+
+
+CARRIERS = [
+    # Bitişik iki taşıyıcı ve tek başına dar bir taşıyıcı
+    FakeCarrier(10810, "H", 27500, "DVB-S2"),
+    FakeCarrier(10848, "H", 27500, "DVB-S"),
+    FakeCarrier(10930, "H", 13000, "DVB-S2"),
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = ChannelDatabase(tmp_path / "channels.db")
+    yield database
+    database.close()
+
+
+@pytest.fixture(autouse=True)
+def narrow_range(monkeypatch):
+    monkeypatch.setitem(scanner_module.BLIND_SCAN_RANGE, "start", 10760)
+    monkeypatch.setitem(scanner_module.BLIND_SCAN_RANGE, "end", 11000)
+
+
+class _InterruptedFrontend(FakeFrontend):
+    """stop_at MHz ve üstüne ilk tune'da Ctrl+C benzeri kesinti."""
+
+    def __init__(self, carriers, stop_at=None, **kw):
+        super().__init__(carriers, **kw)
+        self.stop_at = stop_at
+
+    def tune(self, tp):
+        if self.stop_at is not None and tp.frequency >= self.stop_at:
+            self.stop_at = None
+            raise KeyboardInterrupt
+        super().tune(tp)
+
+
+def _scanner(db, carriers=CARRIERS, stop_at=None):
+    clock = VirtualClock()
+    carriers = [FakeCarrier(c.frequency, c.polarization, c.symbol_rate, c.system) for c in carriers]
+    frontend = _InterruptedFrontend(carriers, stop_at, clock=clock, sleep=clock.sleep)
+    return DVBScanner(DVBAdapter(0, backend=frontend), db)
+
+
+def _locked(result):
+    return sorted((t.frequency, t.symbol_rate, t.system) for t in result.timings if t.locked)
+
+
+def test_adaptive_blind_scan_finds_carriers(db):
+    scanner = _scanner(db)
+    result = scanner.blind_scan(pol="H", method="adaptive")
+
+    locked = _locked(result)
+    assert [(sr, system) for _, sr, system in locked] == [
+        (c.symbol_rate, c.system) for c in CARRIERS]
+    for (freq, _, _), carrier in zip(locked, CARRIERS):
+        assert abs(freq - carrier.frequency) <= 4
+    assert result.transponders_locked == len(CARRIERS)
+
+    # Adım yöntemine göre çok daha az tune
+    step = _scanner(db)
+    step.blind_scan(pol="H", method="step")
+    assert scanner.adapter.frontend.tune_count < step.adapter.frontend.tune_count / 3
+
+
+def test_lock_history_orders_trials(db):
+    scanner = _scanner(db)
+    default = scanner._ranked_trials("turksat")
+    assert default[0][0] == max(scanner_module.COMMON_SYMBOL_RATES)
+
+    scanner.blind_scan(pol="H", method="adaptive")
+    history = db.lock_history("turksat")
+    assert history[(27500, "DVB-S2")][1] == 1 and history[(13000, "DVB-S2")][1] == 1
+    assert sum(a for a, _ in history.values()) == len(scanner.scan_result.timings)
+
+    # Yeni tarayıcı geçmişi veritabanından okur: kilitlenen kombinasyonlar önce
+    ranked = _scanner(db)._ranked_trials("turksat")
+    assert set(ranked[:3]) == {(27500, "DVB-S2"), (27500, "DVB-S"), (13000, "DVB-S2")}
+
+
+def test_resumed_adaptive_scan_keeps_coverage(db, tmp_path):
+    # İkinci taşıyıcı ilkine bir kaba adımdan yakın: alt kenar araması
+    # önceki bölgenin kapsadığı üst sınırdan başlamalı
+    carriers = [FakeCarrier(10810, "H", 27500, "DVB-S2"), FakeCarrier(10840, "H", 13000, "DVB-S2"),
+                FakeCarrier(10930, "H", 13000, "DVB-S2")]
+    full = _scanner(ChannelDatabase(tmp_path / "full.db"), carriers)
+    full.blind_scan(pol="H", method="adaptive")
+
+    # İlk bölge bittikten sonra, sonraki kaba noktada kesilir
+    first = _scanner(db, carriers, stop_at=10832)
+    with pytest.raises(KeyboardInterrupt):
+        first.blind_scan(pol="H", method="adaptive")
+    resumed = _scanner(db, carriers)
+    resumed.blind_scan(pol="H", method="adaptive", resume=True)
+
+    assert _locked(first.scan_result) + _locked(resumed.scan_result) == _locked(full.scan_result)
+    assert (first.adapter.frontend.tune_count + resumed.adapter.frontend.tune_count
+            == full.adapter.frontend.tune_count)
@@ -0,0 +1,220 @@
+"""asyncio tarama API'si: olay akışı ve çoklu tarama birleştirme."""
+
+import asyncio
+import threading
+
+import pytest
+
+from dvb.async_scan import AsyncScanner, merge_events
+from dvb.frontend import FakeFrontend, FrontendCapabilities, IoctlFrontend, VirtualClock
+from dvb.planner import PlanItem
+from dvb.scanner import ChannelDatabase, DVBAdapter, DVBScanner, Transponder
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = ChannelDatabase(tmp_path / "channels.db")
+    yield database
+    database.close()
+
+
+def _scanner(db, transponders, scan_id=""):
+    backend = DVBScanner.simulation_frontend(transponders, clock=VirtualClock())
+    return AsyncScanner(DVBScanner(DVBAdapter(0, backend=backend), db), scan_id)
+
+
+def _collect(stream):
+    async def run():
+        return [event async for event in stream]
+    return asyncio.run(run())
+
+
+def test_scan_event_stream(db):
+    transponders = DVBScanner.load_transponders()[:3]
+    missing = Transponder(12000, "H", 27500, "3/4", "DVB-S2", "8PSK")
+    scanner = _scanner(db, transponders)
+    plan = scanner.scanner.planner.plan(transponders + [missing])
+
+    events = _collect(scanner.scan(plan))
+    kinds = [e.kind for e in events]
+    assert kinds[0] == "started" and kinds[-1] == "finished"
+    assert kinds.count("tune") == kinds.count("lock") == kinds.count("progress") == 4
+    assert kinds.count("signal") == kinds.count("services") == 3
+
+    # Her transponder: tune → lock (→ signal → services) → progress
+    for i, kind in enumerate(kinds):
+        if kind == "tune":
+            assert kinds[i + 1] == "lock"
+
+    locks = {(e.frequency, e.locked) for e in events if e.kind == "lock"}
+    assert (12000, False) in locks
+    finished = events[-1]
+    expected = sum(len(DVBScanner._simulate_channels(tp)) for tp in transponders)
+    assert finished.transponders_scanned == 4 and finished.transponders_locked == 3
+    assert finished.channels_found == expected and not finished.error
+    assert events[-2].done == 4 and events[-2].eta_s == 0
+
+    # Yazımlar tarama bitmeden tamamlanır
+    assert db.get_channel_count()["total"] == expected
+    assert finished.to_dict()["kind"] == "finished"
+
+
+def test_merge_events_from_two_tuners(db):
+    transponders = DVBScanner.load_transponders()[:6]
+    first = _scanner(db, transponders, "tuner0")
+    second = _scanner(db, transponders, "tuner1")
+
+    events = _collect(merge_events(
+        first.scan(first.scanner.planner.plan(transponders[:3])),
+        second.scan(second.scanner.planner.plan(transponders[3:])),
+    ))
+    finished = {e.scan_id: e for e in events if e.kind == "finished"}
+    assert set(finished) == {"tuner0", "tuner1"}
+    assert all(f.transponders_locked == 3 for f in finished.values())
+    expected = sum(len(DVBScanner._simulate_channels(tp)) for tp in transponders)
+    assert db.get_channel_count()["total"] == expected
+
+
+class _BlockingFrontend(FakeFrontend):
+    """İkinci tune'da serbest bırakılana kadar bekleyen frontend."""
+
+    def __init__(self, carriers, **kw):
+        super().__init__(carriers, **kw)
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.finished = False
+
+    def tune(self, tp):
+        if self.tune_count == 1:
+            self.entered.set()
+            self.release.wait(5)
+            self.finished = True
+        super().tune(tp)
+
+
+def test_cancel_waits_for_in_flight_tune(db):
+    transponders = DVBScanner.load_transponders()[:3]
+    clock = VirtualClock()
+    carriers = DVBScanner.simulation_frontend(transponders).carriers
+    frontend = _BlockingFrontend(carriers, clock=clock, sleep=clock.sleep)
+    scanner = AsyncScanner(DVBScanner(DVBAdapter(0, backend=frontend), db))
+
+    async def run():
+        async def consume():
+            async for _ in scanner.scan(scanner.scanner.planner.plan(transponders)):
+                pass
+
+        task = asyncio.create_task(consume())
+        await asyncio.to_thread(frontend.entered.wait, 5)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        # İş parçacığı hâlâ tune'da: görev iptal olmuş sayılmaz
+        assert not task.done()
+        frontend.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert frontend.finished
+
+
+class _FaultyFrontend(FakeFrontend):
+    """Tek bir frekansta cihaz hatası veren frontend."""
+
+    def __init__(self, carriers, bad_frequency, **kw):
+        super().__init__(carriers, **kw)
+        self.bad_frequency = bad_frequency
+
+    def tune(self, tp):
+        if tp.frequency == self.bad_frequency:
+            raise OSError("FE_SET_PROPERTY: Input/output error")
+        super().tune(tp)
+
+
+class _Switch:
+    def switch_port_1_0(self, port, polarization, high_band):
+        if port == 1:
+            raise OSError("DiSEqC zaman aşımı")
+
+
+def _async_scanner(db, frontend, diseqc=None):
+    return AsyncScanner(DVBScanner(DVBAdapter(0, backend=frontend), db, diseqc))
+
+
+def test_device_errors_are_reported_per_transponder(db):
+    transponders = DVBScanner.load_transponders()[:4]
+    clock = VirtualClock()
+    carriers = DVBScanner.simulation_frontend(transponders).carriers
+    frontend = _FaultyFrontend(carriers, transponders[1].frequency, clock=clock, sleep=clock.sleep)
+    scanner = _async_scanner(db, frontend, _Switch())
+    items = [PlanItem(tp, "turksat", 1 if i == 2 else 0) for i, tp in enumerate(transponders)]
+
+    events = _collect(scanner.scan(scanner.scanner.planner.plan_items(items)))
+    locks = {e.frequency: e for e in events if e.kind == "lock"}
+    assert not locks[transponders[1].frequency].locked
+    assert "Input/output error" in locks[transponders[1].frequency].reason
+    assert locks[transponders[2].frequency].reason == "DiSEqC zaman aşımı"
+    assert [e.kind for e in events].count("services") == 2
+    assert events[-1].kind == "finished" and not events[-1].error
+    assert events[-1].transponders_locked == 2
+
+
+def test_unsupported_transponder_is_skipped(db):
+    s2 = [tp for tp in DVBScanner.load_transponders() if tp.system == "DVB-S2"][:2]
+    clock = VirtualClock()
+    caps = FrontendCapabilities("Test Demod", ["DVB-S"], 950000, 2150000, 1000000, 45000000)
+    frontend = FakeFrontend(DVBScanner.simulation_frontend(s2).carriers,
+                            clock=clock, sleep=clock.sleep, caps=caps)
+    scanner = _async_scanner(db, frontend)
+
+    events = _collect(scanner.scan(scanner.scanner.planner.plan(s2)))
+    assert frontend.tune_count == 0 and scanner.result.skipped == 2
+    locks = [e for e in events if e.kind == "lock"]
+    assert len(locks) == 2 and all(not e.locked and "DVB-S2" in e.reason for e in locks)
+
+
+def test_scan_shares_lock_history_and_checkpoints(db):
+    transponders = DVBScanner.load_transponders()
+    stop_at = 20
+    scanner = _scanner(db, transponders)
+
+    async def interrupted():
+        stream = scanner.scan_turksat()
+        async for event in stream:
+            if event.kind == "progress" and event.done == stop_at:
+                await stream.aclose()
+                break
+
+    asyncio.run(interrupted())
+    assert db.lock_history("turksat")
+    session = db.find_scan_session("turksat", {})
+    assert session["completed"] == stop_at
+    assert db.get_channel_count()["total"] == session["channels_found"] > 0
+
+    # Senkron tarama aynı oturumu sürdürür
+    sync = DVBScanner(DVBAdapter(0, backend=DVBScanner.simulation_frontend(clock=VirtualClock())), db)
+    result = sync.scan_turksat(resume=True)
+    assert result.transponders_scanned == len(transponders) - stop_at
+    expected = sum(len(DVBScanner._simulate_channels(tp)) for tp in transponders)
+    assert db.get_channel_count()["total"] == expected
+
+
+def test_incremental_scan_skips_unchanged_muxes(db):
+    transponders = DVBScanner.load_transponders()[:5]
+    _collect(_scanner(db, transponders).scan_turksat())
+
+    events = _collect(_scanner(db, transponders).scan_turksat(incremental=True))
+    assert [e.kind for e in events].count("services") == 0
+    assert events[-1].transponders_locked == 5
+
+
+def test_missing_frontend_finishes_with_error(db, tmp_path):
+    transponders = DVBScanner.load_transponders()[:3]
+    backend = IoctlFrontend(str(tmp_path / "frontend0"))
+    scanner = AsyncScanner(DVBScanner(DVBAdapter(0, backend=backend), db))
+
+    events = _collect(scanner.scan(scanner.scanner.planner.plan(transponders)))
+    finished = events[-1]
+    assert finished.kind == "finished" and finished.error
+    assert [e.kind for e in events].count("tune") == 1
+    assert db.get_channel_count()["total"] == 0
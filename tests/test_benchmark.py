@@ -0,0 +1,91 @@
+"""Gecikme modelli sanal frontend ve tarama ölçümü."""
+
+import random
+
+import pytest
+
+from dvb import scanner as scanner_module
+from dvb.benchmark import bench_parallel, bench_scan
+from dvb.frontend import (CarouselSectionSource, FakeCarrier, LatencyModel, ModelledFrontend,
+                          VirtualClock)
+from dvb.psi import PID_PAT, PID_SDT, TABLE_PAT, TABLE_SDT_ACTUAL
+from dvb.scanner import Channel, DVBScanner, Transponder
+
+
+def _carrier(frequency=11054):
+    channels = [Channel("TRT 1", 1001, frequency, "H", 101, 201, 101, 1001, "TV")]
+    return FakeCarrier(frequency, "H", 30000, channels=channels)
+
+
+def _tp(frequency=11054):
+    return Transponder(frequency, "H", 30000, "5/6", "DVB-S2", "8PSK")
+
+
+def test_carousel_waits_for_next_repetition():
+    clock = VirtualClock()
+    sections = _carrier().sections_by_pid()
+    intervals = {PID_PAT: 0.1, PID_SDT: 2.0, "pmt": 0.1}
+    source = CarouselSectionSource(sections, intervals, clock, clock.sleep, random.Random(1))
+
+    times = []
+    for pid, _ in source.sections({PID_PAT: TABLE_PAT}, timeout=0.35):
+        times.append(clock())
+    assert len(times) in (3, 4)
+    assert all(b - a == pytest.approx(0.1) for a, b in zip(times, times[1:]))
+    assert clock() == pytest.approx(0.35)
+
+    # SDT sadece kendi aralığında gelir
+    start = clock()
+    first = next(source.sections({PID_SDT: TABLE_SDT_ACTUAL}, timeout=5.0))
+    assert first[0] == PID_SDT and 0 <= clock() - start <= 2.0
+
+
+def test_modelled_frontend_lock_probability():
+    clock = VirtualClock()
+    model = LatencyModel(lock_probability=0.0, lock_jitter=0.0)
+    frontend = ModelledFrontend([_carrier()], model, clock=clock, sleep=clock.sleep, seed=1)
+
+    frontend.tune(_tp())
+    assert clock() == pytest.approx(model.tune_latency)
+    result = frontend.wait_for_lock(30000)
+    assert not result.locked and result.carrier_time is not None
+    assert frontend.failed_locks == 1
+
+
+def test_wait_for_lock_with_large_virtual_clock():
+    clock = VirtualClock(start=1e7)
+    frontend = ModelledFrontend([_carrier()], LatencyModel(lock_probability=0.0),
+                                clock=clock, sleep=clock.sleep)
+    frontend.tune(_tp(frequency=12000))
+    # Kayan nokta yuvarlamasında sonsuz döngüye girmemeli
+    assert frontend.wait_for_lock(30000).reason == "no_signal"
+
+
+def test_bench_scan_is_deterministic():
+    first = bench_scan("turksat", seed=3)
+    second = bench_scan("turksat", seed=3)
+    for key in ("transponders", "locked", "channels", "tune_attempts", "failed_locks", "scan_time"):
+        assert first[key] == second[key]
+    assert first["transponders"] > 0 and first["locked"] <= first["transponders"]
+    assert bench_scan("turksat", seed=4)["scan_time"] != first["scan_time"]
+
+
+def test_bench_scan_ignores_saved_nit_list(tmp_path, monkeypatch):
+    static = DVBScanner.load_transponders()
+    saved = tmp_path / "nit_transponders.json"
+    DVBScanner.save_transponder_list(static[:2], saved)
+    monkeypatch.setattr(scanner_module, "NIT_TRANSPONDER_DB", saved)
+    before = saved.read_text()
+
+    assert bench_scan("turksat", seed=1)["transponders"] == len(static)
+    assert bench_scan("nit", seed=1)["transponders"] > 2
+    assert bench_parallel(2, seed=1, scale=0.001)["transponders"] == len(static)
+    assert saved.read_text() == before
+
+
+def test_bench_parallel_scans_every_transponder_once():
+    one = bench_parallel(1, seed=1, scale=0.001)
+    two = bench_parallel(2, seed=1, scale=0.001)
+    assert sum(two["per_tuner"]) == two["transponders"] == one["transponders"]
+    assert len(two["per_tuner"]) == 2 and two["locked"] <= two["transponders"]
+    assert two["channels"] > 0
@@ -0,0 +1,85 @@
+"""Frontend yetenekleri: desteklenmeyen tune'ları atlama ve önbellek."""
+
+import json
+
+from dvb.frontend import (FE_CAN_2G_MODULATION, FE_CAN_MULTISTREAM, FakeCarrier, FakeFrontend,
+                          FrontendCapabilities, IoctlFrontend, VirtualClock)
+from dvb.scanner import ChannelDatabase, DVBAdapter, DVBScanner, Transponder
+
+
+def _caps(**kw):
+    fields = {"name": "Test Demod", "delivery_systems": ["DVB-S", "DVB-S2"],
+              "frequency_min": 950000, "frequency_max": 2150000,
+              "symbol_rate_min": 1000000, "symbol_rate_max": 45000000, **kw}
+    return FrontendCapabilities(**fields)
+
+
+def _tp(frequency=11054, symbol_rate=30000, system="DVB-S2"):
+    return Transponder(frequency, "H", symbol_rate, "5/6", system, "8PSK")
+
+
+def test_unsupported_reasons():
+    caps = _caps()
+    assert caps.unsupported(_tp()) == ""
+    assert caps.unsupported(_tp(system="AUTO")) == ""
+    assert "DVB-S2X" in caps.unsupported(_tp(system="DVB-S2X"))
+    assert "SR" in caps.unsupported(_tp(symbol_rate=500))
+    assert "IF" in caps.unsupported(_tp(frequency=13500))
+    assert "DVB-S2" in _caps(delivery_systems=["DVB-S"]).unsupported(_tp())
+
+    s2x = _caps(caps=FE_CAN_2G_MODULATION | FE_CAN_MULTISTREAM)
+    assert s2x.unsupported(_tp(system="DVB-S2X")) == ""
+    assert FrontendCapabilities.from_dict(s2x.to_dict()) == s2x
+
+
+def test_scanner_skips_unsupported_without_tuning(tmp_path):
+    clock = VirtualClock()
+    carriers = [FakeCarrier(11054, "H", 30000, "DVB-S2"), FakeCarrier(11096, "H", 30000, "DVB-S")]
+    frontend = FakeFrontend(carriers, clock=clock, sleep=clock.sleep,
+                            caps=_caps(delivery_systems=["DVB-S"]))
+    scanner = DVBScanner(DVBAdapter(0, backend=frontend), ChannelDatabase(tmp_path / "channels.db"))
+
+    assert scanner.scan_transponder(_tp(11054)) == []
+    assert frontend.tune_count == 0 and scanner.scan_result.skipped == 1
+    scanner.scan_transponder(_tp(11096, system="DVB-S"))
+    assert frontend.tune_count == 1 and scanner.scan_result.transponders_locked == 1
+
+
+class _CountingFrontend(IoctlFrontend):
+    def __init__(self, path):
+        super().__init__(path)
+        self.queries = 0
+
+    def capabilities(self):
+        self.queries += 1
+        return _caps()
+
+
+def test_adapter_caches_capabilities(tmp_path):
+    node = tmp_path / "frontend0"
+    node.touch()
+    cache = tmp_path / "frontend_caps.json"
+
+    def adapter():
+        a = DVBAdapter(0, backend=_CountingFrontend(str(node)))
+        a.frontend_path = str(node)
+        a.caps_cache = cache
+        return a
+
+    first = adapter()
+    assert first.capabilities() == _caps()
+    assert first.capabilities() == _caps()
+    assert first.frontend.queries == 1
+    assert json.loads(cache.read_text())[str(node)]["caps"]["name"] == "Test Demod"
+
+    # Yeni süreç: önbellekten okunur, ioctl yapılmaz
+    second = adapter()
+    assert second.get_info()["name"] == "Test Demod"
+    assert second.frontend.queries == 0
+
+    # Düğüm yeniden oluşturulunca (hotplug) yeniden sorgulanır
+    node.unlink()
+    node.touch()
+    third = adapter()
+    third.capabilities()
+    assert third.frontend.queries == 1
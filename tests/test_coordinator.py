@@ -0,0 +1,196 @@
+"""Çoklu tuner paralel tarama: iş çalan kuyruk ve N sanal adaptör."""
+
+import pytest
+
+from dvb.coordinator import ParallelScanCoordinator, WorkStealingQueue, discover_adapters
+from dvb.frontend import FakeCarrier, FakeFrontend
+from dvb.planner import PlanItem, ScanPlanner
+from dvb.scanner import Channel, ChannelDatabase, DVBAdapter, Transponder
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(seconds, 0.0)
+
+
+def _transponders(count=24):
+    return [Transponder(10700 + i * 80, "HV"[i % 2], 27500, "3/4", "DVB-S2", "8PSK")
+            for i in range(count)]
+
+
+def _services(tp):
+    return [Channel(f"{tp.frequency}{tp.polarization}-{sid}", sid, tp.frequency, tp.polarization,
+                    100 + sid, 200 + sid, 100 + sid, 1000 + sid, "TV")
+            for sid in (1, 2)]
+
+
+def _adapters(n, carriers):
+    adapters = []
+    for i in range(n):
+        clock = _Clock()
+        adapters.append(DVBAdapter(i, backend=FakeFrontend(carriers, clock=clock, sleep=clock.sleep)))
+    return adapters
+
+
+@pytest.mark.parametrize("tuners", [2, 3, 4])
+def test_parallel_scan_with_fake_adapters(tmp_path, tuners):
+    transponders = _transponders()
+    # Her üçüncü transponder'da taşıyıcı yok
+    carriers = [FakeCarrier(tp.frequency, tp.polarization, tp.symbol_rate, channels=_services(tp))
+                for i, tp in enumerate(transponders) if i % 3]
+    db = ChannelDatabase(tmp_path / "channels.db")
+    coordinator = ParallelScanCoordinator(_adapters(tuners, carriers), db)
+
+    result = coordinator.scan(ScanPlanner().plan(transponders))
+    coordinator.close()
+
+    assert result.transponders_scanned == len(transponders)
+    assert result.transponders_locked == len(carriers)
+    assert result.channels_found == 2 * len(carriers)
+    # Her transponder tam bir kez taranır
+    scanned = sorted((t.frequency, t.polarization) for t in result.timings)
+    assert scanned == sorted((tp.frequency, tp.polarization) for tp in transponders)
+    assert len(db.get_all_channels()) == 2 * len(carriers)
+
+
+def test_work_stealing_queue_drains_every_item():
+    plan = ScanPlanner().plan(_transponders(10))
+    queue = WorkStealingQueue(list(enumerate(plan.items)), workers=3)
+    assert len(queue) == 10
+
+    # Sadece 0. tuner çalışırsa diğer kuyrukları çalarak bitirir
+    entries = []
+    while (entry := queue.pop(0)) is not None:
+        entries.append(entry)
+    assert sorted(position for position, _ in entries) == list(range(10))
+    assert all(item is plan.items[position] for position, item in entries)
+    assert queue.steals > 0 and len(queue) == 0
+
+
+def test_discover_adapters(tmp_path):
+    for path in ("adapter0/frontend0", "adapter1/frontend0", "adapter1/frontend1", "adapter2/demux0"):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+    found = [(a.adapter_num, a.frontend_num) for a in discover_adapters(str(tmp_path))]
+    assert found == [(0, 0), (1, 0), (1, 1)]
+
+
+def test_coordinator_requires_adapter(tmp_path):
+    with pytest.raises(ValueError):
+        ParallelScanCoordinator([], ChannelDatabase(tmp_path / "channels.db"))
+
+
+class _Switch:
+    """Port 1'e geçişi cihaz hatasıyla reddeden DiSEqC denetleyicisi."""
+
+    def __init__(self):
+        self.ports = []
+
+    def switch_port_1_0(self, port, polarization, high_band):
+        if port == 1:
+            raise OSError("DiSEqC zaman aşımı")
+        self.ports.append(port)
+
+
+def test_diseqc_errors_skip_only_that_transponder(tmp_path):
+    transponders = _transponders(8)
+    carriers = [FakeCarrier(tp.frequency, tp.polarization, tp.symbol_rate, channels=_services(tp))
+                for tp in transponders]
+    items = [PlanItem(tp, "turksat", i % 2) for i, tp in enumerate(transponders)]
+    switches = [_Switch(), _Switch()]
+    coordinator = ParallelScanCoordinator(_adapters(2, carriers),
+                                          ChannelDatabase(tmp_path / "channels.db"),
+                                          diseqc=switches)
+
+    result = coordinator.scan(ScanPlanner().plan_items(items))
+    coordinator.close()
+    assert coordinator.failed == 4
+    assert result.transponders_scanned == result.transponders_locked == 4
+    assert all(port == 0 for s in switches for port in s.ports)
+
+
+class _BrokenFrontend(FakeFrontend):
+    """Tek bir frekansta beklenmeyen hata veren frontend."""
+
+    def tune(self, tp):
+        if tp.frequency == 10940:
+            raise RuntimeError("sürücü çöktü")
+        super().tune(tp)
+
+
+def test_worker_error_leaves_resumable_session(tmp_path):
+    transponders = _transponders(6)
+    carriers = [FakeCarrier(tp.frequency, tp.polarization, tp.symbol_rate, channels=_services(tp))
+                for tp in transponders]
+    adapters = [DVBAdapter(i, backend=_BrokenFrontend(carriers)) for i in range(2)]
+    db = ChannelDatabase(tmp_path / "channels.db")
+    coordinator = ParallelScanCoordinator(adapters, db)
+
+    with pytest.raises(RuntimeError):
+        coordinator.scan(ScanPlanner().plan(transponders))
+    coordinator.close()
+    # Biten adaylar kanallarıyla yazılmış, hatalı aday bekliyor
+    session = db.find_scan_session("turksat", {})
+    assert 0 < session["completed"] < len(transponders)
+    assert len(db.get_all_channels()) == session["channels_found"]
+
+    resumed = ParallelScanCoordinator(_adapters(2, carriers), db)
+    result = resumed.scan(resume=True)
+    resumed.close()
+    assert result.transponders_scanned == len(transponders) - session["completed"]
+    assert len(db.get_all_channels()) == 2 * len(transponders)
+    assert db.find_scan_session("turksat", {}) is None
+
+
+def test_parallel_scan_records_checkpoints_and_lock_history(tmp_path):
+    transponders = _transponders(12)
+    carriers = [FakeCarrier(tp.frequency, tp.polarization, tp.symbol_rate, channels=_services(tp))
+                for tp in transponders]
+    db = ChannelDatabase(tmp_path / "channels.db")
+    coordinator = ParallelScanCoordinator(_adapters(3, carriers), db)
+
+    result = coordinator.scan(ScanPlanner().plan(transponders))
+    coordinator.close()
+    assert result.channels_found == result.tv_channels == 2 * len(transponders)
+    history = db.lock_history("turksat")
+    assert history[(27500, "DVB-S2")] == [len(transponders), len(transponders)]
+    # Oturum tüm tunerların kontrol noktaları yazılınca kapanır
+    assert db.find_scan_session("turksat", {}) is None
+    assert len(db.get_all_channels()) == 2 * len(transponders)
+
+
+class _UnpluggedFrontend(FakeFrontend):
+    """Tek bir frekansta cihaz düğümü kaybolan (tuner çıkarılmış) frontend."""
+
+    def tune(self, tp):
+        if tp.frequency == 10940:
+            raise FileNotFoundError("/dev/dvb/adapter0/frontend0")
+        super().tune(tp)
+
+
+def test_missing_frontend_stops_scan(tmp_path):
+    transponders = _transponders(6)
+    carriers = [FakeCarrier(tp.frequency, tp.polarization, tp.symbol_rate, channels=_services(tp))
+                for tp in transponders]
+    adapters = [DVBAdapter(i, backend=_UnpluggedFrontend(carriers)) for i in range(2)]
+    db = ChannelDatabase(tmp_path / "channels.db")
+    coordinator = ParallelScanCoordinator(adapters, db)
+
+    with pytest.raises(FileNotFoundError):
+        coordinator.scan(ScanPlanner().plan(transponders))
+    coordinator.close()
+    session = db.find_scan_session("turksat", {})
+    assert session["completed"] < len(transponders)
+    assert len(db.get_all_channels()) == session["channels_found"]
+
+
+def test_diseqc_list_must_match_adapters(tmp_path):
+    with pytest.raises(ValueError):
+        ParallelScanCoordinator(_adapters(2, []), ChannelDatabase(tmp_path / "channels.db"),
+                                diseqc=[None])
@@ -0,0 +1,291 @@
+"""EPG veritabanı: toplu yazım ve sorgular."""
+
+import gzip
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from dvb.epg import (NOW_NEXT_EMPTY_TTL, EPGDatabase, EPGEvent, EPGManager, XMLTVParser,
+                     epoch, parse_xmltv_time)
+
+
+BASE = datetime(2026, 3, 1, 20, 0)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = EPGDatabase(tmp_path / "epg.db")
+    yield database
+    database.close()
+
+
+def _events(channels=3, per_channel=10, start=BASE):
+    for ch in range(1, channels + 1):
+        for i in range(per_channel):
+            yield EPGEvent(ch, i, start + timedelta(minutes=30 * i), 30, f"Program {ch}-{i}",
+                           genre="Haber" if i % 2 else "Film")
+
+
+def _indexes(db):
+    return {r[0] for r in db.conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_epg_%'")}
+
+
+def test_save_events_in_batches(db):
+    assert db.save_events(_events(), batch_size=7) == 30
+    assert db.conn.execute("SELECT COUNT(*) FROM epg_events").fetchone()[0] == 30
+
+    # Aynı (kanal, event_id) güncellenir
+    db.save_event(EPGEvent(1, 0, BASE, 45, "Yeni Başlık"))
+    schedule = db.get_schedule(1, "2026-03-01")
+    assert schedule[0]["title"] == "Yeni Başlık" and schedule[0]["duration"] == 45
+    assert db.conn.execute("SELECT COUNT(*) FROM epg_events").fetchone()[0] == 30
+
+
+def test_deferred_indexes_are_rebuilt(db):
+    assert db.save_events(list(_events()), defer_indexes=True) == 30
+    assert _indexes(db) == set(EPGDatabase.INDEXES)
+
+
+def test_interrupted_load_restores_indexes(tmp_path):
+    db = EPGDatabase(tmp_path / "epg.db")
+
+    def broken():
+        yield from _events(per_channel=2)
+        raise RuntimeError("kaynak koptu")
+
+    with pytest.raises(RuntimeError):
+        db.save_events(broken(), batch_size=2, defer_indexes=True)
+    # Biten parçalar kalır, indeksler yine kurulur
+    assert db.conn.execute("SELECT COUNT(*) FROM epg_events").fetchone()[0] == 6
+    assert _indexes(db) == set(EPGDatabase.INDEXES)
+
+    # İndeksleri eksik bir veritabanı açılışta onarılır
+    db.conn.execute(f"DROP INDEX {next(iter(EPGDatabase.INDEXES))}")
+    db.conn.commit()
+    db.close()
+    assert _indexes(EPGDatabase(tmp_path / "epg.db")) == set(EPGDatabase.INDEXES)
+
+
+def test_queries(db):
+    db.save_events(_events())
+    assert len(db.search_programs("Program 2-")) == 10
+    assert len(db.search_programs("Program 2-", genre="Film")) == 5
+    assert {g["genre"]: g["count"] for g in db.get_genres()} == {"Film": 15, "Haber": 15}
+    assert [e["event_id"] for e in db.get_schedule(3, "2026-03-01")] == list(range(8))
+
+
+# ─── Epoch sütunları ─────────────────────────────────────────────────────────
+
+def test_now_next_and_current_events(db):
+    db.save_events(_events())
+    now = epoch(BASE + timedelta(minutes=45))
+
+    now_next = db.get_now_next(2, now=now)
+    assert now_next["current"]["event_id"] == 1
+    assert now_next["next"]["event_id"] == 2
+    assert [e["channel_id"] for e in db.get_current_events(now=now)] == [1, 2, 3]
+    assert [e["channel_id"] for e in db.get_current_events([3], now=now)] == [3]
+
+    # Yayın bittikten sonra şimdiki yok
+    after = epoch(BASE + timedelta(hours=6))
+    assert db.get_now_next(1, now=after) == {"current": None, "next": None}
+    assert db.get_current_events(now=after) == []
+
+
+def test_long_event_is_current(db):
+    # Uzun olay max_span ile "şu an" penceresine girer
+    db.save_events([EPGEvent(1, 99, BASE - timedelta(hours=5), 360, "Maraton")])
+    now = epoch(BASE)
+    assert [e["event_id"] for e in db.get_current_events(now=now)] == [99]
+
+
+def test_get_range(db):
+    db.save_events(_events())
+    start = epoch(BASE + timedelta(hours=1))
+    found = db.get_range(1, start, start + 3600)
+    assert [e["event_id"] for e in found] == [2, 3]
+
+
+def test_old_database_is_migrated(tmp_path):
+    path = tmp_path / "epg.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE epg_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            channel_id INTEGER NOT NULL,
+            event_id INTEGER,
+            start_time TEXT NOT NULL,
+            duration INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT DEFAULT '',
+            genre TEXT DEFAULT '',
+            UNIQUE(channel_id, event_id)
+        );
+        CREATE INDEX idx_epg_channel ON epg_events(channel_id);
+        CREATE INDEX idx_epg_start ON epg_events(start_time);
+    """)
+    conn.execute("INSERT INTO epg_events (channel_id, event_id, start_time, duration, title) "
+                 "VALUES (1, 7, ?, 90, 'Film')", (BASE.isoformat(),))
+    conn.commit()
+    conn.close()
+
+    db = EPGDatabase(path)
+    row = db.conn.execute("SELECT start_ts, end_ts FROM epg_events").fetchone()
+    # Saat dilimsiz eski zamanlar yerel saat olarak çevrilir
+    assert tuple(row) == (epoch(BASE), epoch(BASE) + 90 * 60)
+    assert _indexes(db) == set(EPGDatabase.INDEXES)
+    assert db.get_now_next(1, now=epoch(BASE) + 60)["current"]["event_id"] == 7
+    db.close()
+
+
+# ─── now/next önbelleği ──────────────────────────────────────────────────────
+
+@pytest.fixture
+def manager(db):
+    db.save_events(_events())
+    return EPGManager(db)
+
+
+def test_now_next_cache_expires_at_event_end(manager):
+    now = epoch(BASE + timedelta(minutes=10))
+    first = manager.get_now_next(1, now=now)
+    assert first["current"]["event_id"] == 0
+    assert manager.get_now_next(1, now=now + 60) is first
+    assert (manager.cache_hits, manager.cache_misses) == (1, 1)
+
+    # Olay bitişinde giriş düşer, yeni olay sorgulanır
+    end = first["current"]["end_ts"]
+    assert manager.get_now_next(1, now=end - 1) is first
+    assert manager.get_now_next(1, now=end)["current"]["event_id"] == 1
+    assert manager.cache_misses == 2
+
+
+def test_now_next_cache_before_first_event(manager):
+    before = epoch(BASE - timedelta(minutes=5))
+    result = manager.get_now_next(2, now=before)
+    assert result["current"] is None and result["next"]["event_id"] == 0
+    assert manager.get_now_next(2, now=epoch(BASE))["current"]["event_id"] == 0
+    assert manager.cache_misses == 2
+
+
+def test_now_next_cache_empty_channel_ttl(manager):
+    now = epoch(BASE)
+    assert manager.get_now_next(42, now=now) == {"current": None, "next": None}
+    manager.get_now_next(42, now=now + NOW_NEXT_EMPTY_TTL - 1)
+    assert manager.cache_misses == 1
+    manager.get_now_next(42, now=now + NOW_NEXT_EMPTY_TTL)
+    assert manager.cache_misses == 2
+
+
+def test_now_next_cache_invalidated_by_writes(manager, db):
+    now = epoch(BASE + timedelta(minutes=10))
+    manager.get_now_next_many([1, 2], now=now)
+    assert manager.cache_misses == 2
+
+    # Sadece yazılan kanalın girişi silinir
+    db.save_event(EPGEvent(1, 0, BASE, 30, "Son Dakika"))
+    assert manager.get_now_next(1, now=now)["current"]["title"] == "Son Dakika"
+    manager.get_now_next(2, now=now)
+    assert (manager.cache_hits, manager.cache_misses) == (1, 3)
+
+    manager.invalidate()
+    manager.get_now_next(2, now=now)
+    assert manager.cache_misses == 4
+
+
+# ─── Rehber grid'i ───────────────────────────────────────────────────────────
+
+def test_grid_rows_follow_requested_channel_order(db):
+    db.save_events(_events(per_channel=6, start=BASE))
+    db.save_event(EPGEvent(2, 99, BASE - timedelta(hours=4), 300, "Uzun Yayın", description="Özet"))
+    start = epoch(BASE + timedelta(minutes=15))
+    grid = db.get_grid([3, 1, 2], start, start + 3600)
+
+    assert list(grid.channel_ids) == [3, 1, 2]
+    assert list(grid.row) == sorted(grid.row)
+    # Satır içinde başlangıca göre; pencereyle kesişenler (0..2) ve uzun olay
+    row0 = grid.row_slice(0)
+    assert [grid.title_of(i) for i in range(row0.start, row0.stop)] == \
+        ["Program 3-0", "Program 3-1", "Program 3-2"]
+    row2 = grid.row_slice(2)
+    assert grid.title_of(row2.start) == "Uzun Yayın"
+    assert list(grid.start[row2]) == sorted(grid.start[row2])
+    assert np.all(grid.end > start) and np.all(grid.start < start + 3600)
+    assert db.get_description(int(grid.event[row2.start])) == "Özet"
+
+
+def test_grid_title_pool_is_shared(db):
+    db.save_events(_events(channels=2, per_channel=4))
+    window = (epoch(BASE), epoch(BASE + timedelta(hours=2)))
+    first = db.get_grid([1, 2], *window)
+    pool = len(db.titles)
+    second = db.get_grid([2, 1], *window)
+    assert len(db.titles) == pool
+    assert {first.title_of(i) for i in range(len(first))} == \
+        {second.title_of(i) for i in range(len(second))}
+    assert len(db.get_grid([5], *window)) == 0
+
+
+# ─── XMLTV ───────────────────────────────────────────────────────────────────
+
+XMLTV = """<?xml version="1.0" encoding="UTF-8"?>
+<tv>
+  <channel id="trt1.tr"><display-name>TRT 1</display-name></channel>
+  <programme channel="trt1.tr" start="20260301200000 +0300" stop="20260301213000 +0300">
+    <title>Haberler</title><desc>Ana haber</desc><category>Haber</category>
+  </programme>
+  <programme channel="trt1.tr" start="20260301213000 +0300" stop="20260301230000 +0300">
+    <title>Dizi</title>
+  </programme>
+  <programme channel="bbc.uk" start="20260301170000 +0000" stop="20260301180000 +0000">
+    <title>News</title>
+  </programme>
+  <programme channel="bbc.uk" start="bozuk"><title>Atlanır</title></programme>
+</tv>
+"""
+
+
+def test_parse_xmltv_time_offsets():
+    utc = datetime(2026, 3, 1, 17, 0, tzinfo=timezone.utc)
+    assert parse_xmltv_time("20260301200000 +0300") == utc
+    assert parse_xmltv_time("20260301200000+0300") == utc
+    assert parse_xmltv_time("20260301120000 -0500") == utc
+    assert parse_xmltv_time("20260301223000 +0530") == utc
+    assert parse_xmltv_time("20260301170000 Z") == utc
+    assert parse_xmltv_time("20260301200000 +0300").utcoffset() == timedelta(hours=3)
+    # Dilimsiz: yerel saat, saniye isteğe bağlı
+    assert parse_xmltv_time("202603012000") == datetime(2026, 3, 1, 20, 0)
+    for bad in ("", "2026", "20260301200000 +03", "20260301200000 EST", "20261301200000",
+                "20260301200000 +2400", "20260301200000 -9999", "20260301200000 +0399",
+                "2026030120000", "202603012000001"):
+        assert parse_xmltv_time(bad) is None
+
+
+def test_xmltv_events_use_offsets(tmp_path):
+    path = tmp_path / "tv.xml"
+    path.write_text(XMLTV, encoding="utf-8")
+    events = XMLTVParser().parse_file(path)
+
+    assert [e.title for e in events] == ["Haberler", "Dizi", "News"]
+    # Aynı UTC anı: 20:00 +0300 ile 17:00 +0000
+    assert events[0].start_ts == events[2].start_ts
+    assert [e.duration for e in events] == [90, 90, 60]
+    assert events[0].channel_id == events[1].channel_id == XMLTVParser.channel_id("trt1.tr")
+    assert events[0].event_id == events[0].start_ts // 60
+    assert (events[0].description, events[0].genre) == ("Ana haber", "Haber")
+
+
+def test_load_gzipped_xmltv(tmp_path, db):
+    path = tmp_path / "tv.xml.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(XMLTV)
+    manager = EPGManager(db)
+    assert manager.load_xmltv_file(path) == 3
+
+    trt1 = XMLTVParser.channel_id("trt1.tr")
+    now_next = manager.get_now_next(trt1, now=epoch(datetime(2026, 3, 1, 17, 30, tzinfo=timezone.utc)))
+    assert now_next["current"]["title"] == "Haberler"
+    assert now_next["next"]["title"] == "Dizi"
@@ -0,0 +1,70 @@
+"""Kanal listesi dışa aktarma (M3U, CSV, Enigma2, XMLTV)."""
+
+import csv
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from dvb.scanner import Channel, ChannelDatabase, ChannelExporter, ExportWriter
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = ChannelDatabase(tmp_path / "channels.db")
+    database.save_channels([
+        Channel("TRT 1 HD", 1001, 10970, "H", 101, 201, 101, 1001, "TV", True, True, "TRT"),
+        Channel('Kanal "D"', 1002, 10970, "H", 102, 202, 102, 1002, "TV", True, False, "Doğan"),
+        Channel("TRT FM", 1003, 10970, "H", 0, 203, 0, 1003, "Radio", True, False, "TRT"),
+        Channel("Spor & Haber", 1004, 11054, "V", 104, 204, 104, 1004, "TV", False, False, "D<S>"),
+    ])
+    yield database
+    database.close()
+
+
+def test_export_all(db, tmp_path):
+    paths = ChannelExporter(db).export_all(tmp_path / "out")
+    assert set(paths) == {"m3u", "csv", "enigma2", "xmltv"}
+    assert all(p.parent == tmp_path / "out" for p in paths.values())
+
+    m3u = paths["m3u"].read_text(encoding="utf-8").splitlines()
+    assert m3u[0] == "#EXTM3U" and "# Toplam: 4 kanal" in m3u
+    assert sum(line.startswith("#EXTINF") for line in m3u) == 4
+    assert "dvb://frequency=11054&polarization=V&service_id=1004" in m3u
+    assert any(line.endswith(",TRT 1 HD HD") for line in m3u)
+
+    # CSV: başlık + 4 satır, gömülü tırnak korunur
+    rows = list(csv.reader(paths["csv"].open(encoding="utf-8")))
+    assert len(rows) == 5
+    assert [r[0] for r in rows[1:]].count('Kanal "D"') == 1
+    assert {r[9] for r in rows[1:]} == {"TRT", "Doğan", "D<S>"}
+
+    # Enigma2 ve XMLTV sadece TV kanallarını yazar
+    enigma = paths["enigma2"].read_text(encoding="utf-8").splitlines()
+    assert enigma[0] == "#NAME APEXSAT Türksat"
+    assert sum(line.startswith("#SERVICE") for line in enigma) == 3
+    assert "#SERVICE 1:0:1:3E9:0:0:0:0:0:0:" in enigma
+
+    root = ET.parse(paths["xmltv"]).getroot()
+    channels = {c.get("id"): c.findtext("display-name") for c in root.iter("channel")}
+    assert channels == {"1001": "TRT 1 HD", "1002": 'Kanal "D"', "1004": "Spor & Haber"}
+
+
+def test_export_filters_by_type(db, tmp_path):
+    path = ChannelExporter(db).export_m3u(tmp_path / "radio.m3u", channel_type="Radio")
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert "# Toplam: 1 kanal" in lines
+    assert [line for line in lines if line.startswith("#EXTINF")] == [
+        '#EXTINF:-1 tvg-name="TRT FM" tvg-type="Radio" group-title="TRT",TRT FM']
+
+
+def test_export_rejects_unknown_format(db, tmp_path):
+    with pytest.raises(ValueError):
+        ChannelExporter(db).export({"pdf": tmp_path / "x.pdf"})
+
+
+def test_export_writer_requires_rows(tmp_path):
+    class _NoRows(ExportWriter):
+        label = "Eksik"
+
+    with pytest.raises(TypeError):
+        _NoRows(tmp_path / "out.txt")
@@ -0,0 +1,170 @@
+"""Frontend arka uçları: ioctl ve sanal frontend."""
+
+import pytest
+
+from dvb.frontend import (FE_HAS_CARRIER, FE_HAS_LOCK, FE_HAS_SIGNAL, SIGNAL_TIMEOUT,
+                          STATUS_POLL_INTERVAL, FakeCarrier, FakeFrontend, IoctlFrontend,
+                          lock_timeout)
+from dvb.scanner import ChannelDatabase, DVBAdapter, DVBScanner, Transponder
+
+
+def _tp(frequency=11054, polarization="H", symbol_rate=30000, system="DVB-S2"):
+    return Transponder(frequency, polarization, symbol_rate, "5/6", system, "8PSK")
+
+
+class _Clock:
+    """Elle ilerletilen saat; sleep() beklemeden ilerletir."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(seconds, 0.0)
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+def _frontend(clock, **carrier):
+    carrier = {"frequency": 11054, "polarization": "H", "symbol_rate": 30000, **carrier}
+    return FakeFrontend([FakeCarrier(**carrier)], clock=clock, sleep=clock.sleep)
+
+
+# ─── FakeFrontend ────────────────────────────────────────────────────────────
+
+def test_fake_frontend_status_follows_lock_time():
+    clock = _Clock()
+    frontend = FakeFrontend([FakeCarrier(11054, "H", 30000, lock_time=0.2)], clock=clock)
+    frontend.tune(_tp())
+
+    assert frontend.read_status() == FE_HAS_SIGNAL
+    clock.now = 0.1
+    assert frontend.read_status() == FE_HAS_SIGNAL | FE_HAS_CARRIER
+    clock.now = 0.2
+    assert frontend.read_status() & FE_HAS_LOCK
+    assert frontend.tune_count == 1
+
+
+def test_fake_frontend_without_matching_carrier():
+    clock = _Clock()
+    frontend = FakeFrontend([FakeCarrier(11054, "H", 30000, lock_time=0.0)], clock=clock)
+
+    frontend.tune(_tp(frequency=12000))                 # Bant dışı
+    assert frontend.read_status() == 0
+    frontend.tune(_tp(polarization="V"))                # Diğer polarizasyon
+    assert frontend.read_status() == 0
+    frontend.tune(_tp(symbol_rate=22000))               # Bant içi, yanlış SR
+    assert frontend.read_status() == FE_HAS_SIGNAL
+    frontend.tune(_tp(system="DVB-S"))                  # Yanlış sistem
+    assert frontend.read_status() == FE_HAS_SIGNAL
+    frontend.tune(_tp(system="AUTO"))
+    assert frontend.read_status() & FE_HAS_LOCK
+
+
+def test_fake_frontend_stats():
+    clock = _Clock()
+    carrier = FakeCarrier(11054, "H", 30000, snr=11.5, signal_strength=80.0, lock_time=0.1)
+    frontend = FakeFrontend([carrier], clock=clock)
+    frontend.tune(_tp())
+
+    stats = frontend.read_stats()
+    assert not stats.locked and stats.snr == 0.0 and stats.signal_strength == 80.0
+    clock.now = 0.1
+    stats = frontend.read_stats()
+    assert stats.locked and stats.snr == 11.5
+
+
+def test_adapter_signal_stats_from_backend():
+    frontend = FakeFrontend([FakeCarrier(11054, "H", 30000, lock_time=0.0)])
+    adapter = DVBAdapter(0, backend=frontend)
+    assert adapter.frontend is frontend
+
+    frontend.tune(_tp())
+    stats = adapter.get_signal_stats()
+    assert stats["locked"] and stats["snr"] == 12.0
+
+
+# ─── wait_for_lock ───────────────────────────────────────────────────────────
+
+def test_wait_for_lock_returns_at_lock(clock):
+    frontend = _frontend(clock, lock_time=0.2)
+    frontend.tune(_tp())
+    result = frontend.wait_for_lock(30000)
+
+    assert result.locked and result.reason == "locked"
+    assert result.signal_time == 0.0
+    assert 0.1 <= result.carrier_time <= 0.1 + STATUS_POLL_INTERVAL
+    assert 0.2 <= result.lock_time <= 0.2 + STATUS_POLL_INTERVAL
+    assert clock() == pytest.approx(result.elapsed)
+
+
+def test_wait_for_lock_gives_up_without_signal(clock):
+    frontend = _frontend(clock)
+    frontend.tune(_tp(frequency=12000))
+    result = frontend.wait_for_lock(30000)
+
+    assert not result.locked and result.reason == "no_signal"
+    assert result.elapsed == pytest.approx(SIGNAL_TIMEOUT, abs=STATUS_POLL_INTERVAL)
+
+
+def test_wait_for_lock_gives_up_without_carrier(clock):
+    # Bant içi ama yanlış symbol rate: sinyal var, taşıyıcı yok
+    frontend = _frontend(clock)
+    frontend.tune(_tp(symbol_rate=22000))
+    result = frontend.wait_for_lock(22000)
+
+    assert not result.locked and result.reason == "no_carrier"
+    assert result.signal_time == 0.0 and result.carrier_time is None
+    assert result.elapsed < lock_timeout(22000)
+
+
+def test_wait_for_lock_wrong_system(clock):
+    frontend = _frontend(clock, system="DVB-S")
+    frontend.tune(_tp(system="DVB-S2"))
+    assert not frontend.wait_for_lock(30000).locked
+
+    frontend.tune(_tp(system="DVB-S"))
+    assert frontend.wait_for_lock(30000).locked
+
+
+def test_lock_timeout_scales_with_symbol_rate():
+    assert lock_timeout(2400) > lock_timeout(30000)
+    assert lock_timeout(1) == lock_timeout(100)         # Üst sınır
+
+
+def test_scan_transponder_records_timing(tmp_path, clock):
+    db = ChannelDatabase(tmp_path / "channels.db")
+    scanner = DVBScanner(DVBAdapter(0, backend=_frontend(clock)), db)
+
+    assert scanner.scan_transponder(_tp(frequency=12000)) == []
+    timing = scanner.scan_result.timings[0]
+    assert not timing.locked and timing.reason == "no_signal"
+    assert timing.total_ms == pytest.approx(SIGNAL_TIMEOUT * 1000, abs=STATUS_POLL_INTERVAL * 1000)
+    assert scanner.scan_result.transponders_scanned == 1
+    assert scanner.scan_result.transponders_locked == 0
+
+
+# ─── IoctlFrontend ───────────────────────────────────────────────────────────
+
+def test_ioctl_frontend_missing_device(tmp_path):
+    frontend = IoctlFrontend(str(tmp_path / "frontend0"))
+    with pytest.raises(FileNotFoundError):
+        frontend.tune(_tp())
+    frontend.close()
+    assert "error" in DVBAdapter(99, backend=frontend).get_signal_stats()
+
+
+def test_scan_without_frontend_device_is_an_error(tmp_path):
+    db = ChannelDatabase(tmp_path / "channels.db")
+    scanner = DVBScanner(DVBAdapter(0, backend=IoctlFrontend(str(tmp_path / "frontend0"))), db)
+
+    # Sanal kanallara düşülmez; --simulate olmadan tarama durur
+    with pytest.raises(FileNotFoundError):
+        scanner.scan_transponder(_tp())
+    assert scanner.scan_result.channels == []
+    assert scanner.scan_result.transponders_locked == 0
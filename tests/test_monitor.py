@@ -0,0 +1,100 @@
+"""Sinyal izleyici: halka tamponu, pencere özeti ve abonelik."""
+
+import time
+
+import numpy as np
+import pytest
+
+from dvb.frontend import (FE_HAS_LOCK, FakeCarrier, FakeFrontend, IoctlFrontend, SignalStats,
+                          VirtualClock)
+from dvb.monitor import FIELDS, SignalMonitor, SignalRing
+from dvb.scanner import DVBAdapter, Transponder
+
+
+def _stats(snr, ucb=0, locked=True):
+    return SignalStats(FE_HAS_LOCK if locked else 0, 70.0, snr, 1e-6, ucb)
+
+
+def test_ring_window_after_wrap():
+    ring = SignalRing(4)
+    for i in range(10):
+        ring.append(float(i), _stats(float(i)))
+
+    assert len(ring) == 4 and ring.total == 10
+    rows = ring.window()
+    # Eskiden yeniye, sadece son 4 örnek
+    assert rows[:, FIELDS.index("time")].tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert rows[:, FIELDS.index("snr")].tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert ring.window(1.0)[:, 0].tolist() == [8.0, 9.0]
+    assert ring.latest().time == 9.0
+
+    # Pencere kopyadır; yeni yazım eski sonucu değiştirmez
+    ring.append(10.0, _stats(10.0))
+    assert rows[:, 0].tolist() == [6.0, 7.0, 8.0, 9.0]
+
+
+def test_ring_before_wrap_and_empty():
+    ring = SignalRing(8)
+    assert ring.latest() is None and ring.window().shape == (0, len(FIELDS))
+    ring.append(1.0, _stats(5.0))
+    ring.append(2.0, _stats(6.0))
+    assert ring.window()[:, 0].tolist() == [1.0, 2.0]
+    with pytest.raises(ValueError):
+        SignalRing(0)
+
+
+def _monitor(clock, rate_hz=10.0):
+    tp = Transponder(11054, "H", 30000, "5/6", "DVB-S2", "8PSK")
+    frontend = FakeFrontend([FakeCarrier(11054, "H", 30000, lock_time=0.0, snr=11.0)],
+                            clock=clock, sleep=clock.sleep)
+    frontend.tune(tp)
+    return SignalMonitor(frontend, rate_hz=rate_hz, history_s=1.0)
+
+
+def test_summary_and_rate_limited_subscribers():
+    clock = VirtualClock()
+    monitor = _monitor(clock)
+    every, limited = [], []
+    monitor.subscribe(every.append)
+    token = monitor.subscribe(limited.append, min_interval=0.3)
+
+    for _ in range(20):
+        monitor.sample_once()
+        clock.sleep(0.1)
+    assert len(monitor.ring) == 10                  # 1 s × 10 Hz
+    assert len(every) == 20
+    assert 6 <= len(limited) <= 7
+
+    summary = monitor.summary(0.45)
+    assert summary["samples"] == 5
+    assert summary["snr"] == {"min": 11.0, "max": 11.0, "mean": 11.0}
+    assert summary["lock_ratio"] == 1.0 and summary["ucb_delta"] == 0
+
+    monitor.unsubscribe(token)
+    monitor.sample_once()
+    assert len(every) == 21 and len(limited) in (6, 7)
+
+
+def test_monitor_counts_read_errors(tmp_path):
+    monitor = SignalMonitor(IoctlFrontend(str(tmp_path / "frontend0")))
+    assert monitor.sample_once() is None
+    assert monitor.errors == 1 and monitor.last_error
+
+
+def test_adapter_uses_running_monitor():
+    frontend = FakeFrontend([FakeCarrier(11054, "H", 30000, lock_time=0.0)])
+    frontend.tune(Transponder(11054, "H", 30000, "5/6", "DVB-S2", "8PSK"))
+    adapter = DVBAdapter(0, backend=frontend)
+
+    monitor = adapter.signal_monitor(rate_hz=200)
+    try:
+        deadline = time.monotonic() + 2.0
+        while monitor.latest() is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = adapter.get_signal_stats()
+        assert stats["locked"] and "time" in stats       # İzleyici örneği
+        assert adapter.signal_monitor() is monitor
+    finally:
+        adapter.close()
+    assert not monitor.running
+    assert np.isfinite(monitor.history()).all()
@@ -0,0 +1,70 @@
+"""Çoklu uydu taraması: USALS rota sırası ve uydu başına tek konumlandırma."""
+
+import pytest
+
+from dvb import scanner as scanner_module
+from dvb.diseqc import DishPositioner
+from dvb.frontend import VirtualClock
+from dvb.scanner import ChannelDatabase, DVBAdapter, DVBScanner
+
+
+def test_usals_route_sweeps_once():
+    positioner = DishPositioner()
+    names = ["hotbird", "yamal", "turksat", "astra_19"]
+    order = positioner.order(names)
+
+    # Motor açısına göre tek geçiş (doğudan batıya ya da tersi)
+    angles = [positioner.angle_of(n) for n in order]
+    assert angles == sorted(angles) or angles == sorted(angles, reverse=True)
+    assert positioner.route_cost(order) < positioner.route_cost(names)
+    assert set(order) == set(names)
+
+    # Çanak doğudaysa doğu ucundan başlanır
+    positioner.goto("yamal")
+    assert positioner.order(names)[0] == "yamal"
+
+
+def test_switch_mode_orders_by_port():
+    positioner = DishPositioner(mode="switch")
+    assert positioner.order(["astra_28", "turksat", "hotbird"]) == ["turksat", "hotbird", "astra_28"]
+    assert positioner.route_cost(["astra_28", "turksat"]) == 0.0
+    with pytest.raises(ValueError):
+        DishPositioner(mode="gps")
+
+
+def test_goto_overlaps_travel_with_work():
+    clock = VirtualClock()
+    positioner = DishPositioner(clock=clock, sleep=clock.sleep)
+    travel = positioner.goto("turksat")
+    assert travel > 0 and positioner.moves == 1
+
+    clock.sleep(travel / 2)                 # Motor dönerken yapılan iş
+    positioner.wait()
+    assert positioner.waited_s == pytest.approx(travel / 2)
+    assert positioner.goto("turksat") == 0.0 and positioner.moves == 1
+
+
+def test_scan_satellites_positions_once_per_satellite(tmp_path, monkeypatch):
+    monkeypatch.setitem(scanner_module.BLIND_SCAN_RANGE, "start", 10700)
+    monkeypatch.setitem(scanner_module.BLIND_SCAN_RANGE, "end", 10760)
+    transponders = DVBScanner.load_transponders()[:4]
+    lists = {"turksat": transponders, "hotbird": None}
+    monkeypatch.setattr(DVBScanner, "satellite_transponders", classmethod(lambda cls, n: lists[n]))
+
+    clock = VirtualClock()
+    frontend = DVBScanner.simulation_frontend(transponders, clock=clock)
+    db = ChannelDatabase(tmp_path / "channels.db")
+    scanner = DVBScanner(DVBAdapter(0, backend=frontend), db)
+    positioner = DishPositioner(clock=clock, sleep=clock.sleep)
+
+    result = scanner.scan_satellites(["turksat", "hotbird"], positioner)
+    assert positioner.moves == 2
+    assert result.transponders_locked >= len(transponders)
+    expected = sum(len(DVBScanner._simulate_channels(tp)) for tp in transponders)
+    assert db.get_channel_count()["total"] == expected
+    assert db.find_scan_session("multi", {"satellites": positioner.order(["turksat", "hotbird"]),
+                                          "positioner": "usals"}) is None
+
+    with pytest.raises(ValueError):
+        scanner.scan_satellites(["pluto"], positioner)
+    db.close()
@@ -0,0 +1,74 @@
+"""Tarama planlayıcı: LNB/DiSEqC geçişlerini en aza indiren sıralama."""
+
+import random
+
+from dvb.planner import PlanItem, ScanPlanner, estimate_switching_cost
+from dvb.scanner import ChannelDatabase, DVBAdapter, DVBScanner, Transponder
+
+
+def _tp(frequency, polarization):
+    return Transponder(frequency, polarization, 27500, "3/4", "DVB-S2", "8PSK")
+
+
+def _states(plan):
+    return [item.lnb_state for item in plan]
+
+
+def test_plan_groups_lnb_states():
+    rng = random.Random(1)
+    transponders = [_tp(rng.randrange(10700, 12750), rng.choice("HV")) for _ in range(60)]
+    plan = ScanPlanner().plan(transponders)
+
+    assert sorted(plan.transponders, key=id) == sorted(transponders, key=id)
+    # Her LNB durumu tek, kesintisiz bir blok
+    states = _states(plan)
+    blocks = [s for i, s in enumerate(states) if i == 0 or s != states[i - 1]]
+    assert len(blocks) == len(set(states))
+    for group in plan.groups:
+        freqs = [item.transponder.frequency for item in group.items]
+        assert freqs == sorted(freqs)
+
+
+def test_plan_switches_one_parameter_at_a_time():
+    transponders = [_tp(f, p) for f in (10970, 11500, 12100, 12600) for p in "HV"]
+    cost = ScanPlanner().plan(transponders).switching_cost()
+
+    # İlk ayar + low/V → low/H → high/H → high/V
+    assert (cost.voltage_switches, cost.tone_switches, cost.diseqc_switches) == (3, 2, 1)
+    naive = estimate_switching_cost(PlanItem(tp) for tp in transponders)
+    assert cost.seconds < naive.seconds
+
+
+def test_plan_keeps_ports_contiguous():
+    items = [PlanItem(_tp(f, p), "sat", port)
+             for f in (10970, 12100) for p in "HV" for port in (0, 1, 2)]
+    plan = ScanPlanner().plan_items(items)
+
+    ports = [item.diseqc_port for item in plan]
+    assert ports == sorted(ports, key=[0, 1, 2].index)
+    assert plan.switching_cost().diseqc_switches == 3
+
+
+def test_estimate_switching_cost():
+    items = [PlanItem(_tp(10970, "V")), PlanItem(_tp(10970, "H")), PlanItem(_tp(12100, "H"))]
+    cost = estimate_switching_cost(items, costs={"voltage": 1.0, "tone": 10.0, "diseqc": 100.0})
+    assert (cost.voltage_switches, cost.tone_switches, cost.diseqc_switches) == (2, 2, 1)
+    assert cost.seconds == 122.0
+
+
+class _RecordingDiSEqC:
+    def __init__(self):
+        self.calls = []
+
+    def switch_port_1_0(self, port, polarization, high_band):
+        self.calls.append(port)
+
+
+def test_scanner_switches_port_only_on_change(tmp_path):
+    diseqc = _RecordingDiSEqC()
+    scanner = DVBScanner(DVBAdapter(0), ChannelDatabase(tmp_path / "channels.db"), diseqc)
+    plan = ScanPlanner().plan_items(PlanItem(_tp(f, p), "sat", port)
+                                    for port in (0, 1) for f in (10970, 12100) for p in "HV")
+    for item in plan:
+        scanner._select_port(item)
+    assert diseqc.calls == [0, 1]
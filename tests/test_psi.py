@@ -0,0 +1,135 @@
+"""PSI/SI section ayrıştırma: PAT/PMT/SDT/NIT ve CRC doğrulaması."""
+
+from dvb.psi import (PID_NIT, PID_PAT, PID_SDT, TABLE_PAT, TABLE_PMT, TABLE_SDT_ACTUAL,
+                     PSIScanner, SectionSource, TSSectionSource, build_mux, build_nit,
+                     build_pat, build_satellite_delivery, crc32_mpeg, decode_dvb_text,
+                     encode_dvb_text, packetize, parse_nit, parse_satellite_delivery,
+                     parse_section)
+from dvb.scanner import Channel
+
+
+def _channels():
+    return [
+        Channel("TRT 1 HD", 2001, 11054, "H", 201, 301, 201, 2001, "TV", True, True, "TRT"),
+        Channel("Şifreli Spor", 2002, 11054, "H", 202, 302, 202, 2002, "TV", False, False, "Digiturk"),
+        Channel("TRT FM", 2003, 11054, "H", 0, 403, 0, 2003, "Radio", True, False, "TRT"),
+    ]
+
+
+def _corrupt(section: bytes) -> bytes:
+    data = bytearray(section)
+    data[-1] ^= 0xFF
+    return bytes(data)
+
+
+class _ListSource(SectionSource):
+    """Verilen (PID, section) listesini sırayla sunar."""
+
+    def __init__(self, items):
+        self.items = items
+
+    def sections(self, filters, timeout):
+        for pid, section in self.items:
+            if pid in filters:
+                yield pid, section
+
+
+# ─── Section ─────────────────────────────────────────────────────────────────
+
+def test_built_section_has_valid_crc():
+    section = build_pat(7, {1: 0x100})
+    assert crc32_mpeg(section) == 0
+
+    parsed = parse_section(section)
+    assert parsed.table_id == TABLE_PAT
+    assert parsed.table_id_extension == 7
+    assert parsed.current_next
+
+
+def test_parse_section_rejects_crc_error():
+    section = _corrupt(build_pat(7, {1: 0x100}))
+    assert parse_section(section) is None
+    # Kaynak CRC'yi zaten doğruladıysa (donanım filtresi) kontrol atlanır
+    assert parse_section(section, check_crc=False) is not None
+
+
+def test_parse_section_rejects_truncated():
+    section = build_pat(7, {1: 0x100})
+    assert parse_section(section[:10]) is None
+    assert parse_section(section[:-2]) is None
+
+
+def test_dvb_text_roundtrip():
+    for text in ("TRT 1", "Şifreli Çağrı Ğ"):
+        assert decode_dvb_text(encode_dvb_text(text)) == text
+
+
+# ─── Tarama ──────────────────────────────────────────────────────────────────
+
+def test_scan_mux_services():
+    channels = _channels()
+    source = TSSectionSource.from_bytes(build_mux(channels, tsid=12, onid=1))
+    mux = PSIScanner().scan(source)
+
+    assert mux.transport_stream_id == 12
+    assert mux.original_network_id == 1
+    assert mux.crc_errors == 0
+    by_sid = {s.service_id: s for s in mux.services}
+    assert set(by_sid) == {2001, 2002, 2003}
+
+    hd = by_sid[2001]
+    assert hd.name == "TRT 1 HD" and hd.provider == "TRT"
+    assert hd.video_pid == 201 and hd.audio_pid == 301
+    assert hd.is_hd and hd.is_free and hd.channel_type == "TV"
+    assert not by_sid[2002].is_free
+    assert by_sid[2003].channel_type == "Radio" and by_sid[2003].video_pid == 0
+
+
+def test_scan_counts_crc_errors_and_uses_next_repetition():
+    # Her tablonun ilk kopyası bozuk, ikinci tekrarı sağlam
+    good = TSSectionSource.from_bytes(build_mux(_channels(), tsid=12))
+    by_pid = {}
+    filters = {PID_PAT: TABLE_PAT, PID_SDT: TABLE_SDT_ACTUAL}
+    filters.update({ch.pmt_pid: TABLE_PMT for ch in _channels()})
+    for pid, section in good.sections(filters, timeout=1.0):
+        by_pid.setdefault(pid, []).append(section)
+    items = [(PID_PAT, _corrupt(by_pid[PID_PAT][0])), (PID_SDT, _corrupt(by_pid[PID_SDT][0]))]
+    items += [(pid, s) for pid, sections in by_pid.items() for s in sections]
+
+    mux = PSIScanner().scan(_ListSource(items))
+    assert mux.crc_errors == 2
+    assert mux.transport_stream_id == 12
+    assert {s.name for s in mux.services} == {ch.name for ch in _channels()}
+
+
+def test_scan_with_only_corrupt_sections_finds_nothing():
+    items = [(PID_PAT, _corrupt(build_pat(12, {2001: 0x100})))]
+    mux = PSIScanner().scan(_ListSource(items), timeout=0.1)
+    assert mux.crc_errors == 1
+    assert mux.services == []
+
+
+def test_scan_reads_nit_delivery():
+    nit = build_nit(1, "Türksat", [
+        (1, 1, build_satellite_delivery(11054, "H", 30000, "5/6", "DVB-S2", "8PSK")),
+        (2, 1, build_satellite_delivery(12380, "V", 2400, "3/4", "DVB-S", "QPSK")),
+    ])
+    source = TSSectionSource.from_bytes(build_mux(_channels(), tsid=1, nit=nit))
+    mux = PSIScanner().scan(source, want_nit=True)
+
+    assert mux.nit.network_name == "Türksat"
+    deliveries = [e.delivery for e in mux.nit.transports]
+    assert [(d.frequency, d.polarization, d.symbol_rate) for d in deliveries] == [
+        (11054, "H", 30000), (12380, "V", 2400)]
+    assert all(d.longitude == 42.0 for d in deliveries)
+
+    # Tek section olarak da ayrışır
+    nit_only = TSSectionSource.from_bytes(packetize(PID_NIT, nit))
+    sections = [parse_section(s) for _, s in nit_only.sections({PID_NIT: 0x40}, timeout=1.0)]
+    assert parse_nit(sections).network_name == "Türksat"
+
+
+def test_delivery_longitude_is_signed():
+    west = build_satellite_delivery(11054, "H", 30000, orbital_position=30.0, east=False)
+    delivery = parse_satellite_delivery(west[2:])
+    assert delivery.orbital_position == 30.0 and delivery.longitude == -30.0
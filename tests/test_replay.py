@@ -0,0 +1,59 @@
+"""Kayıtlı TS dosyalarından tarama (ReplayFrontend)."""
+
+import pytest
+
+from dvb.frontend import VirtualClock
+from dvb.replay import ReplayFrontend, scan_captures, write_captures
+from dvb.scanner import ChannelDatabase, DVBAdapter, DVBScanner, Transponder
+
+
+def _transponders():
+    return DVBScanner.load_transponders()[:3]
+
+
+def test_scan_captures_parses_file_names(tmp_path):
+    for name in ("11054H.ts", "12380v_2400_DVB-S.ts", "notes.txt", "x11054H.ts"):
+        (tmp_path / name).write_bytes(b"")
+    known = [Transponder(11054, "H", 30000, "5/6", "DVB-S2", "8PSK")]
+
+    carriers = scan_captures(tmp_path, known)
+    assert [(c.frequency, c.polarization, c.symbol_rate, c.system) for c in carriers] == [
+        (11054, "H", 30000, "DVB-S2"), (12380, "V", 2400, "DVB-S")]
+
+
+def test_replay_scan_matches_simulation(tmp_path):
+    transponders = _transponders()
+    write_captures(DVBScanner.simulation_frontend(transponders).carriers, tmp_path / "captures")
+
+    clock = VirtualClock()
+    frontend = ReplayFrontend(tmp_path / "captures", transponders, clock=clock, sleep=clock.sleep)
+    scanner = DVBScanner(DVBAdapter(0, backend=frontend), ChannelDatabase(tmp_path / "channels.db"))
+
+    found = {(ch.transponder_freq, ch.service_id, ch.name)
+             for tp in transponders for ch in scanner.scan_transponder(tp)}
+    expected = {(ch.transponder_freq, ch.service_id, ch.name)
+                for tp in transponders for ch in DVBScanner._simulate_channels(tp)}
+    assert found == expected
+    assert scanner.scan_result.transponders_locked == len(transponders)
+
+
+def test_replay_latency_injection(tmp_path):
+    tp = _transponders()[0]
+    write_captures(DVBScanner.simulation_frontend([tp]).carriers, tmp_path)
+
+    clock = VirtualClock()
+    frontend = ReplayFrontend(tmp_path, [tp], clock=clock, sleep=clock.sleep,
+                              lock_time=0.3, tune_latency=0.1, section_latency=0.01)
+    frontend.tune(tp)
+    assert clock() == 0.1
+    assert frontend.stream_path() is None                 # Henüz kilit yok
+    assert frontend.wait_for_lock(tp.symbol_rate).locked
+    assert clock() >= 0.3
+    assert frontend.stream_path().endswith(".ts")
+
+    before = clock()
+    source = frontend.section_source()
+    count = sum(1 for _ in source.sections({0x0000: 0x00}, timeout=1.0))
+    source.close()
+    assert count > 0
+    assert clock() - before == pytest.approx(count * 0.01)
@@ -0,0 +1,388 @@
+"""Sanal frontend ile uçtan uca Türksat taraması ve kanal veritabanı."""
+
+import sqlite3
+from dataclasses import replace
+
+import pytest
+
+from dvb import scanner as scanner_module
+from dvb.frontend import VirtualClock
+from dvb.psi import NITable, TransportStreamEntry, build_satellite_delivery
+from dvb.scanner import (Channel, ChannelDatabase, ChannelExporter, DVBAdapter, DVBScanner,
+                         Transponder, fold_turkish, transponders_from_nit)
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    # Önceki NIT taramalarının listesi testi etkilemesin
+    monkeypatch.setattr(scanner_module, "NIT_TRANSPONDER_DB", tmp_path / "nit_transponders.json")
+    database = ChannelDatabase(tmp_path / "channels.db")
+    yield database
+    database.close()
+
+
+def _scanner(db, clock=None):
+    clock = clock or VirtualClock()
+    backend = DVBScanner.simulation_frontend(clock=clock)
+    return DVBScanner(DVBAdapter(0, backend=backend), db)
+
+
+def test_simulated_scan_turksat(db):
+    clock = VirtualClock()
+    transponders = DVBScanner.load_transponders()
+    expected = [ch for tp in transponders for ch in DVBScanner._simulate_channels(tp)]
+
+    result = _scanner(db, clock).scan_turksat()
+
+    assert result.transponders_scanned == len(transponders)
+    assert result.transponders_locked == len(transponders)
+    assert result.channels_found == len(expected)
+    # Sanal saatte ölçülen süreler; gerçek bekleme yok
+    assert 0 < clock() < 60
+    assert all(t.locked for t in result.timings)
+
+    rows = db.get_all_channels()
+    assert len(rows) == len(expected)
+    assert {(r["transponder_freq"], r["service_id"]) for r in rows} == {
+        (ch.transponder_freq, ch.service_id) for ch in expected}
+    assert all(r["transport_stream_id"] > 0 and r["original_network_id"] == 1 for r in rows)
+    assert db.get_channel_count()["total"] == len(expected)
+
+
+
+def test_rescan_keeps_channel_ids(db):
+    _scanner(db).scan_turksat()
+    before = {(r["transponder_freq"], r["service_id"]): r["id"] for r in db.get_all_channels()}
+
+    _scanner(db).scan_turksat()
+    after = {(r["transponder_freq"], r["service_id"]): r["id"] for r in db.get_all_channels()}
+    assert after == before
+
+
+
+def test_resume_skips_completed_candidates(db):
+    transponders = DVBScanner.load_transponders()
+    stop_at = 20
+
+    def interrupt(i, total, tp):
+        if i == stop_at:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        _scanner(db).scan_turksat(progress_callback=interrupt)
+    # Kesintiden önce biten adaylar kanallarıyla birlikte yazılmış olmalı
+    session = db.find_scan_session("turksat", {})
+    assert session["completed"] == stop_at - 1
+    saved = db.get_channel_count()["total"]
+    assert saved == session["channels_found"] > 0
+
+    scanner = _scanner(db)
+    result = scanner.scan_turksat(resume=True)
+    tuned = {(t.frequency, t.polarization) for t in result.timings}
+    assert len(tuned) == result.transponders_scanned == len(transponders) - (stop_at - 1)
+    assert scanner.adapter.frontend.tune_count == len(tuned)
+
+    expected = sum(len(DVBScanner._simulate_channels(tp)) for tp in transponders)
+    assert db.get_channel_count()["total"] == expected
+    # Biten oturum sürdürülmez
+    assert db.find_scan_session("turksat", {}) is None
+
+
+# ─── Kanal Veritabanı ────────────────────────────────────────────────────────
+
+def _channel(name="TRT 1", sid=1001, **kw):
+    fields = {"channel_type": "TV", "provider": "TRT", **kw}
+    return Channel(name, sid, 10970, "H", 101, 201, 101, 1001, **fields)
+
+
+def test_save_channels_upserts_in_place(db):
+    db.save_channels([_channel(category="Ulusal")])
+    row_id = db.get_all_channels()[0]["id"]
+    db.conn.execute("UPDATE channels SET favorite = 1, position = 5 WHERE id = ?", (row_id,))
+
+    # Boş kategori mevcut olanı silmez, favori ve sıra korunur
+    db.save_channels([_channel(name="TRT 1 HD", is_hd=True)])
+    rows = db.get_all_channels()
+    assert len(rows) == 1
+    row = rows[0]
+    assert row["id"] == row_id and row["name"] == "TRT 1 HD" and row["is_hd"]
+    assert row["category"] == "Ulusal" and row["favorite"] == 1 and row["position"] == 5
+
+
+def test_channel_count(db):
+    db.save_channels([
+        _channel(sid=1, is_hd=True), _channel(sid=2, is_free=False),
+        Channel("TRT FM", 3, 10970, "H", 0, 301, 0, 1003, "Radio"),
+    ])
+    assert db.get_channel_count() == {"total": 3, "tv": 2, "radio": 1, "hd": 1, "fta": 2,
+                                      "unique_services": 3}
+
+
+
+
+# ─── Servis Tekilleştirme ────────────────────────────────────────────────────
+
+def _source(freq, pol, is_hd=False, onid=1, name="TRT 1"):
+    return Channel(name, 1001, freq, pol, 101, 201, 101, 1001, "TV", True, is_hd, "TRT",
+                   transport_stream_id=5, original_network_id=onid)
+
+
+def _tp(freq, pol):
+    return Transponder(freq, pol, 30000, "5/6", "DVB-S2", "8PSK")
+
+
+def test_same_service_on_two_transponders_is_deduplicated(db):
+    db.save_transponders([(_tp(10970, "H"), 9.0, "turksat"), (_tp(11054, "V"), 12.0, "turksat")])
+    db.save_channels([_source(10970, "H"), _source(11054, "V")])
+    ids = {r["transponder_freq"]: r["id"] for r in db.get_all_channels()}
+
+    # SD kaynaklarda yüksek SNR kazanır
+    assert db.preferred_channel_id(1, 5, 1001) == ids[11054]
+    assert db.get_service(1, 5, 1001)["sources"] == 2
+    assert [r["id"] for r in db.service_sources(1, 5, 1001)] == [ids[11054], ids[10970]]
+    assert [r["id"] for r in db.get_all_channels(unique=True)] == [ids[11054]]
+    assert db.get_channel_count()["unique_services"] == 1
+
+    # HD kaynak SNR'dan önce gelir; SNR değişimi de sıralamayı günceller
+    db.save_channels([_source(10970, "H", is_hd=True)])
+    assert db.preferred_channel_id(1, 5, 1001) == ids[10970]
+    db.save_channels([_source(10970, "H")])
+    db.save_transponders([(_tp(10970, "H"), 14.0, "turksat")])
+    assert db.preferred_channel_id(1, 5, 1001) == ids[10970]
+
+    # Kaynak silinince kalan tercih edilir
+    db.sync_transponder_channels(10970, "H", [])
+    assert db.preferred_channel_id(1, 5, 1001) == ids[11054]
+    assert db.get_service(1, 5, 1001)["sources"] == 1
+
+
+def test_same_mux_on_two_satellites_is_kept(db):
+    tp = _tp(11054, "H")
+    channels = []
+    for satellite, name in (("turksat", "TRT 1"), ("hotbird", "Rai 1")):
+        channels.append(Channel(name, 1001, tp.frequency, tp.polarization, 101, 201, 101, 1001,
+                                "TV", True, False, satellite=satellite))
+        db.save_transponder(tp, 10.0, satellite)
+    db.save_channels(channels)
+
+    rows = db.get_all_channels()
+    assert sorted((r["satellite"], r["name"]) for r in rows) == [
+        ("hotbird", "Rai 1"), ("turksat", "TRT 1")]
+    assert db.conn.execute("SELECT COUNT(*) FROM transponders").fetchone()[0] == 2
+
+    # Bir uydunun transponder eşitlemesi diğerini etkilemez
+    db.sync_transponder_channels(tp.frequency, tp.polarization, [], "hotbird")
+    assert [r["name"] for r in db.get_all_channels()] == ["TRT 1"]
+
+
+def test_services_without_onid_are_not_merged(db):
+    db.save_channels([_source(10970, "H", onid=0), _source(11054, "V", onid=0)])
+    assert db.preferred_channel_id(0, 5, 1001) is None
+    assert len(db.get_all_channels(unique=True)) == 2
+
+
+def test_service_index_survives_rollback(db):
+    db.save_channels([_source(10970, "H")])
+    assert db.preferred_channel_id(1, 5, 1001) is not None
+    with pytest.raises(RuntimeError):
+        with db._transaction() as conn:
+            conn.execute("DELETE FROM channels")
+            db._refresh_services(conn, {(1, 5, 1001)})
+            raise RuntimeError
+    assert db.preferred_channel_id(1, 5, 1001) is not None
+
+
+def test_export_skips_duplicate_sources(db, tmp_path):
+    db.save_channels([_source(10970, "H"), _source(11054, "V"), _source(11096, "H", onid=0)])
+    unique = ChannelExporter(db).export_csv(tmp_path / "unique.csv")
+    every = ChannelExporter(db, unique=False).export_csv(tmp_path / "all.csv")
+    assert len(unique.read_text(encoding="utf-8").splitlines()) == 1 + 2
+    assert len(every.read_text(encoding="utf-8").splitlines()) == 1 + 3
+
+
+# ─── Kanal Arama ─────────────────────────────────────────────────────────────
+
+def _search_db(db):
+    db.save_channels([
+        _channel("CNN Türk", 1, provider="Doğan"),
+        _channel("Haberturk", 2, provider="Ciner"),
+        _channel("TRT Spor", 3, provider="", category="Spor"),
+        _channel("Spor Smart", 4, provider="TRT"),
+        _channel("Show TV", 5, provider="Ciner"),
+    ])
+    return db
+
+
+def test_fold_turkish():
+    assert fold_turkish("İSTANBUL Şişli Çağ Güzel Ödül ı") == "istanbul sisli cag guzel odul i"
+    assert fold_turkish(None) == ""
+
+
+def test_search_channels_folds_turkish(db):
+    _search_db(db)
+    assert [r["name"] for r in db.search_channels("cnn turk")] == ["CNN Türk"]
+    assert [r["name"] for r in db.search_channels("habertürk")] == ["Haberturk"]
+    assert [r["name"] for r in db.search_channels("DOĞAN")] == ["CNN Türk"]
+    # Her kelime önek; hepsi eşleşmeli
+    assert [r["name"] for r in db.search_channels("cnn tü")] == ["CNN Türk"]
+    assert db.search_channels("cnn spor") == []
+    assert db.search_channels("  ") == []
+
+
+def test_search_channels_falls_back_to_substring(db):
+    db.save_channels([_channel("Habertürk", 1), _channel("TRT Spor", 2)])
+    # Kelime içi eşleşme FTS önekiyle bulunmaz, katlanmış LIKE ile bulunur
+    assert [r["name"] for r in db.search_channels("türk")] == ["Habertürk"]
+    assert [r["name"] for r in db.search_channels("TURK")] == ["Habertürk"]
+    assert db.search_channels("show") == []
+
+
+def test_search_channels_ranks_name_first(db):
+    _search_db(db)
+    names = [r["name"] for r in db.search_channels("trt")]
+    assert names == ["TRT Spor", "Spor Smart"]
+    assert len(db.search_channels("spor", limit=1)) == 1
+
+
+def test_search_index_follows_updates_and_deletes(db):
+    _search_db(db)
+    db.save_channels([_channel("Show Max", 5)])
+    assert [r["name"] for r in db.search_channels("show")] == ["Show Max"]
+    assert db.search_channels("tv") == []
+
+    db.sync_transponder_channels(10970, "H", [_channel("CNN Türk", 1, provider="Doğan")])
+    assert db.search_channels("show") == []
+    assert [r["name"] for r in db.search_channels("cnn")] == ["CNN Türk"]
+
+
+def test_old_database_duplicates_are_merged(tmp_path):
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE channels (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, service_id INTEGER,
+            transponder_freq INTEGER, transponder_pol TEXT, video_pid INTEGER DEFAULT 0,
+            audio_pid INTEGER DEFAULT 0, pcr_pid INTEGER DEFAULT 0, pmt_pid INTEGER DEFAULT 0,
+            channel_type TEXT DEFAULT 'TV', is_free INTEGER DEFAULT 1, is_hd INTEGER DEFAULT 0,
+            provider TEXT DEFAULT '', category TEXT DEFAULT '', position INTEGER DEFAULT 0,
+            favorite INTEGER DEFAULT 0, locked INTEGER DEFAULT 0,
+            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+        CREATE TABLE favorites (id INTEGER PRIMARY KEY AUTOINCREMENT,
+            list_name TEXT NOT NULL DEFAULT 'Favoriler', channel_id INTEGER, position INTEGER);
+        CREATE INDEX idx_channels_freq ON channels(transponder_freq);
+        INSERT INTO channels (name, service_id, transponder_freq, transponder_pol)
+            VALUES ('TRT 1', 1001, 10970, 'H'), ('TRT 1', 1001, 10970, 'H'), ('TRT 2', 1002, 10970, 'H');
+        INSERT INTO favorites (channel_id, position) VALUES (2, 1);
+        CREATE TABLE transponders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, frequency INTEGER NOT NULL,
+            polarization TEXT NOT NULL, symbol_rate INTEGER, fec TEXT, system TEXT,
+            modulation TEXT, signal_quality REAL DEFAULT 0,
+            last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP, UNIQUE(frequency, polarization));
+        INSERT INTO transponders (frequency, polarization, symbol_rate, signal_quality)
+            VALUES (10970, 'H', 30000, 11.0);
+    """)
+    conn.close()
+
+    db = ChannelDatabase(path)
+    rows = db.get_all_channels()
+    assert sorted((r["id"], r["service_id"]) for r in rows) == [(1, 1001), (3, 1002)]
+    assert [r[0] for r in db.conn.execute("SELECT channel_id FROM favorites")] == [1]
+    assert "service_type" in {r[1] for r in db.conn.execute("PRAGMA table_info(channels)")}
+    # Eski transponderlar Türksat'a atanır; aynı frekans başka uyduda ayrı satırdır
+    assert [tuple(r) for r in db.conn.execute(
+        "SELECT satellite, frequency, signal_quality FROM transponders")] == [("turksat", 10970, 11.0)]
+    db.save_transponder(_tp(10970, "H"), 9.0, "hotbird")
+    assert db.conn.execute("SELECT COUNT(*) FROM transponders").fetchone()[0] == 2
+
+    # Yeni tarama tekrar satır üretmez; eski satırlar aramaya indekslenir
+    db.save_channels([_channel()])
+    assert db.get_channel_count()["total"] == 2
+    assert [r["id"] for r in db.search_channels("trt 2")] == [3]
+    db.close()
+
+
+def test_incremental_rescan_skips_unchanged_muxes(db):
+    _scanner(db).scan_turksat()
+
+    result = _scanner(db).scan_turksat(incremental=True)
+    assert result.diff.changed_muxes == 0
+    assert result.diff.unchanged_muxes == result.transponders_locked
+    assert not (result.diff.added or result.diff.removed or result.diff.moved)
+
+
+def test_incremental_rescan_applies_changed_mux(db):
+    _scanner(db).scan_turksat()
+    before = {r["service_id"]: r["id"] for r in db.get_all_channels() if r["transponder_freq"] == 10970}
+
+    scanner = _scanner(db)
+    carrier = next(c for c in scanner.adapter.frontend.carriers if c.frequency == 10970)
+    gone = carrier.channels.pop()
+    carrier.channels.append(Channel("Yeni Kanal", 1099, carrier.frequency, carrier.polarization,
+                                    199, 299, 199, 1099, "TV"))
+    carrier.pat_version += 1
+    carrier.sdt_version += 1
+
+    result = scanner.scan_turksat(incremental=True)
+    assert result.diff.changed_muxes == 1
+    assert [ch.name for ch in result.diff.added] == ["Yeni Kanal"]
+    assert [row["name"] for row in result.diff.removed] == [gone.name]
+
+    after = {r["service_id"]: r["id"] for r in db.get_all_channels() if r["transponder_freq"] == 10970}
+    assert set(after) == set(before) - {gone.service_id} | {1099}
+    # Değişmeyen servisler yerinde güncellenir
+    assert all(after[sid] == before[sid] for sid in after if sid in before)
+
+
+def test_incremental_diff_matches_services_on_triplet(db):
+    _scanner(db).scan_turksat()
+
+    scanner = _scanner(db)
+    source, target, old = scanner.adapter.frontend.carriers[:3]
+    renamed = source.channels[0]
+    source.channels[0] = replace(renamed, name=renamed.name + " HD")
+    # Mux (aynı TSID) başka frekansa taşınır, hedefin eski servisleri kalkar
+    dropped = [ch.name for ch in target.channels]
+    moved = [replace(ch, transponder_freq=target.frequency, transponder_pol=target.polarization)
+             for ch in old.channels]
+    target.transport_stream_id, target.channels = old.transport_stream_id, moved
+    old.transport_stream_id, old.channels = 0xFFFF, []
+    for carrier in (source, target, old):
+        carrier.pat_version += 1
+        carrier.sdt_version += 1
+
+    diff = scanner.scan_turksat(incremental=True).diff
+    assert [(ch.name, name) for ch, name in diff.renamed] == [(renamed.name + " HD", renamed.name)]
+    assert sorted((ch.name, freq) for ch, freq, _ in diff.moved) == sorted(
+        (ch.name, old.frequency) for ch in moved)
+    assert sorted(row["name"] for row in diff.removed) == sorted(dropped)
+    assert not diff.added
+
+
+def test_nit_scan_discovers_every_mux(db, tmp_path):
+    transponders = DVBScanner.load_transponders()
+    result = _scanner(db).nit_scan()
+
+    assert result.transponders_scanned == len(transponders)
+    assert result.transponders_locked == len(transponders)
+    # Keşfedilen liste kaydedilir ve sonraki taramalarda kullanılır
+    saved = DVBScanner.known_transponders()
+    assert (tmp_path / "nit_transponders.json").exists()
+    assert {(tp.frequency, tp.polarization) for tp in saved} == {
+        (tp.frequency, tp.polarization) for tp in transponders}
+
+
+def _entry(tsid, frequency, polarization="H", orbital_position=42.0, east=True):
+    body = build_satellite_delivery(frequency, polarization, 27500,
+                                    orbital_position=orbital_position, east=east)
+    return TransportStreamEntry(tsid, 1, [(body[0], body[2:])])
+
+
+def test_transponders_from_nit_filters_duplicates_and_other_orbits():
+    nit = NITable(1, 0, transports=[
+        _entry(1, 11054), _entry(2, 11055),             # Tolerans içinde tekrar
+        _entry(1, 11900),                               # Aynı TSID
+        _entry(3, 11900, "V"), _entry(4, 11600, orbital_position=31.0),
+        _entry(5, 12100, east=False),                   # 42.0°W
+    ])
+    assert [(tp.frequency, tp.polarization) for tp in transponders_from_nit(nit)] == [
+        (11054, "H"), (11900, "V")]
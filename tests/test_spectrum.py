@@ -0,0 +1,79 @@
+"""Spektrum taşıyıcı tespiti ve spektrum öncelikli blind scan."""
+
+import numpy as np
+
+from dvb.frontend import FakeCarrier, FakeFrontend
+from dvb.scanner import COMMON_SYMBOL_RATES, ChannelDatabase, DVBAdapter, DVBScanner, Transponder
+from dvb.spectrum import detect_carriers, snap_symbol_rate, synthetic_spectrum
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(seconds, 0.0)
+
+
+def _sweep(frontend, polarization, start, end, step=1.0):
+    freqs = np.arange(start, end, step)
+    power = [frontend.measure_power(Transponder(int(f), polarization, 0, "AUTO", "DVB-S2", "8PSK"))
+             for f in freqs]
+    return freqs, np.array(power)
+
+
+def test_detects_fake_frontend_peaks():
+    carriers = [
+        FakeCarrier(11000, "H", 30000, snr=12.0),
+        FakeCarrier(11080, "H", 27500, snr=10.0),
+        FakeCarrier(11150, "H", 6000, snr=9.0),
+        FakeCarrier(11040, "V", 30000, snr=12.0),       # Diğer polarizasyon
+    ]
+    frontend = FakeFrontend(carriers, seed=1)
+    freqs, power = _sweep(frontend, "H", 10950, 11200, step=0.5)
+
+    found = detect_carriers(freqs, power, symbol_rates=COMMON_SYMBOL_RATES)
+    assert [round(c.frequency) for c in found] == [11000, 11080, 11150]
+    assert [c.symbol_rate for c in found] == [30000, 27500, 6000]
+    assert all(c.level_db > 5 for c in found)
+
+
+def test_splits_adjacent_carriers():
+    carriers = [FakeCarrier(11000, "H", 27500), FakeCarrier(11034, "H", 27500)]
+    freqs, power = synthetic_spectrum(carriers, 10950, 11100, 0.5, seed=2)
+
+    found = detect_carriers(freqs, power, symbol_rates=COMMON_SYMBOL_RATES)
+    assert len(found) == 2
+    for carrier, detected in zip(carriers, found):
+        assert abs(detected.frequency - carrier.frequency) <= 2
+
+
+def test_noise_only_has_no_carriers():
+    freqs, power = synthetic_spectrum([], 10700, 11700, 1.0, seed=3)
+    assert detect_carriers(freqs, power) == []
+
+
+def test_snap_symbol_rate():
+    assert snap_symbol_rate(29200, COMMON_SYMBOL_RATES) == 30000
+    assert snap_symbol_rate(12345, [30000]) == 12300
+
+
+def test_spectrum_blind_scan_tunes_only_carriers(tmp_path):
+    clock = _Clock()
+    carriers = [
+        FakeCarrier(10970, "V", 30000, system="DVB-S2"),
+        FakeCarrier(11054, "H", 27500, system="DVB-S"),
+        FakeCarrier(12380, "V", 13000, system="DVB-S2"),
+    ]
+    frontend = FakeFrontend(carriers, clock=clock, sleep=clock.sleep, seed=4)
+    scanner = DVBScanner(DVBAdapter(0, backend=frontend), ChannelDatabase(tmp_path / "channels.db"))
+
+    result = scanner.blind_scan(method="spectrum")
+    assert result.transponders_locked == len(carriers)
+    # Her taşıyıcı en fazla iki sistemle denenir
+    assert frontend.tune_count <= 2 * len(carriers)
+    locked = sorted((t.frequency, t.polarization) for t in result.timings if t.locked)
+    assert locked == sorted((c.frequency, c.polarization) for c in carriers)